@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asset Mirror
+슬라이드 HTML이 참조하는 CDN 자산(Tailwind, FontAwesome, Noto Sans KR, Chart.js)을
+static/ 폴더와 로컬 폰트 캐시로 바꿔 쓰고, 프로세스 안의 loopback HTTP 서버로 제공하는 모듈
+렌더링 중 브라우저가 외부 네트워크에 접속하지 않으므로 폐쇄망에서도 페이지 로딩이 항상 같게 끝난다.
+
+폰트 캐시 채우기 (인터넷이 되는 호스트에서 한 번 실행 후 캐시 폴더를 복사):
+    python asset_mirror.py
+"""
+
+import hashlib
+import mimetypes
+import re
+import shutil
+import sys
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+# 기본 설정
+DEFAULT_STATIC_DIR = Path(__file__).resolve().parent / 'static'
+DEFAULT_FONT_CACHE_DIR = Path.home() / '.cache' / 'html_to_pptx' / 'fonts'
+DOWNLOAD_TIMEOUT = 30  # 폰트 캐시를 채울 때 파일 하나당 다운로드 제한 시간 (초)
+FONTAWESOME_WEBFONT_URL = "https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@{version}/webfonts/{name}"
+
+# URL이 끝나는 위치 (따옴표, 공백, 괄호, 태그 경계)
+_URL_END = r'''[^"'\s()<>]'''
+
+# (CDN URL 정규식, loopback 서버 경로) - 위에서부터 순서대로 적용
+CDN_RULES = [
+    # Tailwind CSS 2.x
+    (rf'(?:https?:)?//(?:cdn\.jsdelivr\.net/npm|unpkg\.com)/tailwindcss@{_URL_END}*?/dist/tailwind(?:\.min)?\.css',
+     'static/tailwind.min.css'),
+    (rf'(?:https?:)?//cdnjs\.cloudflare\.com/ajax/libs/tailwindcss/{_URL_END}+?/tailwind(?:\.min)?\.css',
+     'static/tailwind.min.css'),
+    # FontAwesome 6 (웹폰트는 all.min.css 기준 ../webfonts/로 요청됨)
+    (rf'(?:https?:)?//cdnjs\.cloudflare\.com/ajax/libs/font-awesome/{_URL_END}+?/css/all(?:\.min)?\.css',
+     'static/all.min.css'),
+    (rf'(?:https?:)?//cdn\.jsdelivr\.net/npm/@fortawesome/fontawesome-free@{_URL_END}+?/css/all(?:\.min)?\.css',
+     'static/all.min.css'),
+    (rf'(?:https?:)?//use\.fontawesome\.com/releases/v{_URL_END}+?/css/all(?:\.min)?\.css',
+     'static/all.min.css'),
+    (rf'(?:https?:)?//{_URL_END}+?/webfonts/(?P<name>fa-[\w.-]+)', r'webfonts/\g<name>'),
+    # Noto Sans KR (Google Fonts CSS와 gstatic 폰트 파일)
+    (rf'(?:https?:)?//fonts\.googleapis\.com/css2\?family=Noto\+Sans\+KR{_URL_END}*', 'static/css2.css'),
+    (rf'(?:https?:)?//fonts\.gstatic\.com/(?P<path>{_URL_END}+)', r'fonts/gstatic/\g<path>'),
+    # Chart.js 4.x
+    (rf'(?:https?:)?//cdn\.jsdelivr\.net/npm/chart\.js(?:@[\w.-]+)?(?:/dist/chart(?:\.umd)?(?:\.min)?\.js)?(?!{_URL_END})',
+     'static/chart.js'),
+]
+
+# 바꿔 쓰지 못한 외부 참조 확인용 (link href, script/img src, CSS url())
+EXTERNAL_URL_PATTERN = re.compile(
+    r'''(?:href|src)\s*=\s*["']((?:https?:)?//[^"']+)["']|url\(\s*["']?((?:https?:)?//[^"')]+)''',
+    re.IGNORECASE
+)
+# 외부 호스트 연결 힌트 (렌더링에 필요 없고 브라우저가 외부로 연결을 시도하므로 제거)
+RESOURCE_HINT_PATTERN = re.compile(
+    r'''<link[^>]+rel\s*=\s*["']?(?:preconnect|dns-prefetch)["']?[^>]*>''',
+    re.IGNORECASE
+)
+GSTATIC_URL_PATTERN = re.compile(rf'https?://fonts\.gstatic\.com/({_URL_END}+)')
+WEBFONT_REF_PATTERN = re.compile(r'url\(\.\./webfonts/([\w.-]+)\)')
+FONTAWESOME_VERSION_PATTERN = re.compile(r'Font Awesome Free (\d+\.\d+\.\d+)')
+
+
+def rewrite_cdn_urls(text, base_url, rules=CDN_RULES):
+    """text 안의 알려진 CDN URL을 base_url(loopback 서버) 아래 로컬 경로로 교체
+
+    반환값: (바뀐 text, 교체 횟수)
+    """
+    total = 0
+    for pattern, target in rules:
+        text, count = re.subn(pattern, lambda match: f"{base_url}/{match.expand(target)}", text)
+        total += count
+    return text, total
+
+
+def external_urls(text):
+    """text가 아직 참조하는 외부(http/https) URL 목록 (중복 제거)"""
+    urls = []
+    for match in EXTERNAL_URL_PATTERN.finditer(text):
+        url = match.group(1) or match.group(2)
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+
+class _AssetRequestHandler(BaseHTTPRequestHandler):
+    """static/ 폴더와 폰트 캐시의 파일만 제공하는 GET/HEAD 핸들러 (없는 파일은 바로 404)"""
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body):
+        relative = unquote(urlparse(self.path).path).lstrip('/')
+        data = self.server.mirror.read_asset(relative)
+        if data is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            return
+
+        content_type = mimetypes.guess_type(relative)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type.endswith('javascript'):
+            content_type += '; charset=utf-8'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        # file:// 페이지에서 웹폰트를 쓰려면 CORS 허용 필요
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'max-age=3600')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        """요청마다 출력하지 않음 (없는 파일은 AssetMirror.missing에 기록)"""
+
+
+class AssetMirror:
+    """CDN 자산을 로컬 파일로 제공하는 loopback HTTP 서버와 HTML 바꿔 쓰기
+
+    사용 예:
+        with AssetMirror() as mirror:
+            html = mirror.rewrite_html(html)  # CDN URL -> http://127.0.0.1:<port>/...
+            ...  # 브라우저로 렌더링
+
+    static/의 CSS도 제공할 때 gstatic 폰트 URL을 로컬 경로로 바꿔 쓴다 (css2.css의 @font-face).
+    """
+
+    def __init__(self, static_dir=DEFAULT_STATIC_DIR, font_cache_dir=DEFAULT_FONT_CACHE_DIR, host='127.0.0.1'):
+        self.static_dir = Path(static_dir)
+        self.font_cache_dir = Path(font_cache_dir)
+        self.host = host
+        self.missing = set()  # 요청되었지만 로컬에 없는 경로
+        self.unmapped = set()  # 바꿔 쓰지 못한 외부 URL
+        # 서버 경로 접두사별 파일 위치 (앞의 폴더에 없으면 다음 폴더에서 찾음)
+        self._routes = {
+            'static/': [self.static_dir],
+            'webfonts/': [self.static_dir / 'webfonts', self.font_cache_dir / 'webfonts'],
+            'fonts/': [self.font_cache_dir],
+        }
+        self._css_cache = {}  # (경로, 수정 시각) -> 바꿔 쓴 CSS bytes
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        if self._server is None:
+            raise RuntimeError("자산 서버가 시작되지 않았습니다.")
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def start(self):
+        """loopback HTTP 서버 시작 (빈 포트 자동 선택, 이미 시작했으면 그대로)"""
+        if self._server is not None:
+            return self
+        self.missing.clear()
+        self.unmapped.clear()
+        self._server = ThreadingHTTPServer((self.host, 0), _AssetRequestHandler)
+        self._server.daemon_threads = True
+        self._server.mirror = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"로컬 자산 서버 시작: {self.base_url} (static: {self.static_dir}, 폰트 캐시: {self.font_cache_dir})")
+        return self
+
+    def close(self):
+        """서버 종료 후 로컬에 없던 자산 보고"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        if self.missing:
+            print(f"로컬에 없는 자산 {len(self.missing)}개 (python asset_mirror.py로 폰트 캐시를 채우세요):")
+            for path in sorted(self.missing)[:10]:
+                print(f"  - {path}")
+        if self.unmapped:
+            print(f"로컬 사본이 없어 바꾸지 못한 외부 URL {len(self.unmapped)}개:")
+            for url in sorted(self.unmapped)[:10]:
+                print(f"  - {url}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def rewrite_html(self, html_content):
+        """HTML의 CDN URL을 loopback 서버 URL로 교체 (바꾸지 못한 외부 URL은 unmapped에 기록)"""
+        html_content = RESOURCE_HINT_PATTERN.sub('', html_content)
+        html_content, _ = rewrite_cdn_urls(html_content, self.base_url)
+        with self._lock:
+            self.unmapped.update(url for url in external_urls(html_content) if not url.startswith(self.base_url))
+        return html_content
+
+    def fingerprint(self):
+        """static/ 파일 목록, 크기, 수정 시각 해시 (렌더 캐시 키에 포함하여 static/이 바뀌면 다시 렌더링)"""
+        digest = hashlib.sha256()
+        for path in sorted(self.static_dir.rglob('*')):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.relative_to(self.static_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n"
+                              .encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def resolve(self, relative):
+        """서버 경로(static/..., webfonts/..., fonts/...)를 로컬 파일 경로로 변환 (없으면 None)"""
+        for prefix, roots in self._routes.items():
+            if not relative.startswith(prefix):
+                continue
+            name = relative[len(prefix):]
+            for root in roots:
+                root = root.resolve()
+                path = (root / name).resolve()
+                # 폴더 밖으로 나가는 경로(../) 차단
+                if root not in path.parents:
+                    continue
+                if path.is_file():
+                    return path
+            return None
+        return None
+
+    def read_asset(self, relative):
+        """서버 경로의 파일 내용 (CSS는 gstatic URL을 바꿔 쓴 내용, 없으면 None)"""
+        path = self.resolve(relative)
+        if path is None:
+            with self._lock:
+                self.missing.add(relative)
+            return None
+        if path.suffix != '.css':
+            return path.read_bytes()
+
+        key = (path, path.stat().st_mtime_ns)
+        with self._lock:
+            cached = self._css_cache.get(key)
+        if cached is None:
+            css, _ = rewrite_cdn_urls(path.read_text(encoding='utf-8'), self.base_url)
+            cached = css.encode('utf-8')
+            with self._lock:
+                self._css_cache[key] = cached
+        return cached
+
+
+def font_download_urls(static_dir=DEFAULT_STATIC_DIR):
+    """static/ CSS가 참조하는 폰트 파일의 (다운로드 URL, 폰트 캐시 안의 상대 경로) 목록"""
+    static_dir = Path(static_dir)
+    downloads = {}
+    for css_path in sorted(static_dir.glob('*.css')):
+        css = css_path.read_text(encoding='utf-8')
+        for path in GSTATIC_URL_PATTERN.findall(css):
+            downloads[f"https://fonts.gstatic.com/{path}"] = Path('gstatic') / path
+
+        # FontAwesome: CSS 머리말의 버전으로 웹폰트 URL 결정
+        version = FONTAWESOME_VERSION_PATTERN.search(css[:500])
+        if version:
+            for name in WEBFONT_REF_PATTERN.findall(css):
+                url = FONTAWESOME_WEBFONT_URL.format(version=version.group(1), name=name)
+                downloads[url] = Path('webfonts') / name
+    return list(downloads.items())
+
+
+def mirror_fonts(static_dir=DEFAULT_STATIC_DIR, font_cache_dir=DEFAULT_FONT_CACHE_DIR):
+    """static/ CSS가 참조하는 폰트 파일을 폰트 캐시로 다운로드 (이미 있는 파일은 건너뜀)
+
+    반환값: (다운로드 수, 실패 수)
+    """
+    font_cache_dir = Path(font_cache_dir)
+    downloaded = 0
+    failed = 0
+    for url, relative in font_download_urls(static_dir):
+        target = font_cache_dir / relative
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(target.name + '.part')
+        try:
+            with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, open(temp_path, 'wb') as f:
+                shutil.copyfileobj(response, f)
+            temp_path.replace(target)
+            downloaded += 1
+        except Exception as e:
+            print(f"폰트 다운로드 실패 ({url}): {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+            failed += 1
+    return downloaded, failed
+
+
+def main():
+    # 설정
+    static_dir = DEFAULT_STATIC_DIR
+    font_cache_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FONT_CACHE_DIR
+
+    print("로컬 폰트 캐시 채우기")
+    print(f"static 폴더: {static_dir}")
+    print(f"폰트 캐시: {font_cache_dir}")
+    print("-" * 50)
+
+    downloaded, failed = mirror_fonts(static_dir, font_cache_dir)
+
+    print("-" * 50)
+    print(f"다운로드 {downloaded}개, 실패 {failed}개")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render Backend Benchmark
+같은 HTML 슬라이드 묶음을 렌더 백엔드마다 렌더링하여 슬라이드당 지연 시간(p50/p95), 최대 메모리(RSS),
+출력 PPTX 크기를 비교하는 스크립트 (호스트마다 가장 빠른 백엔드를 데이터로 고르기 위함)
+
+각 백엔드는 별도 프로세스에서 실행하므로 최대 RSS가 서로 섞이지 않는다.
+사용법: python benchmark_backends.py [백엔드 이름 ...]  (생략하면 모든 백엔드)
+"""
+
+import json
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from render_backends import BACKENDS
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# 기본 설정
+RSS_SAMPLE_SECONDS = 0.1  # 브라우저를 포함한 프로세스 트리 RSS 측정 주기
+RESULT_POLL_SECONDS = 1.0  # 자식 프로세스 결과를 기다리며 생존 여부를 확인하는 주기
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class PeakRSS:
+    """현재 프로세스와 자식 프로세스(브라우저, 드라이버, Node 워커)의 RSS 합계 최댓값 측정
+
+    psutil이 있으면 프로세스 트리를 주기적으로 합산하고, 없으면 resource의 ru_maxrss(자기 자신 + 종료된 자식)를 사용한다.
+    """
+
+    def __init__(self, interval=RSS_SAMPLE_SECONDS):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        process = psutil.Process(os.getpid())
+        while True:
+            total = 0
+            for proc in [process] + process.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    continue
+            self.peak_bytes = max(self.peak_bytes, total)
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self):
+        if PSUTIL_AVAILABLE:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        elif RESOURCE_AVAILABLE:
+            # ru_maxrss 단위: Linux는 KB, macOS는 bytes
+            unit = 1 if sys.platform == 'darwin' else 1024
+            self.peak_bytes = sum(
+                resource.getrusage(who).ru_maxrss * unit
+                for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)
+            )
+
+
+def benchmark_backend(backend, html_dir, output_path, rounds=1, render_size=None):
+    """백엔드 하나로 HTML 폴더 전체를 rounds번 렌더링하고 측정값 반환 (렌더 캐시 사용 안 함)"""
+    from slide_converter import SlideConverter
+
+    html_files = sorted(Path(html_dir).glob("*.html"))
+    converter = SlideConverter(html_dir, output_path, backend=backend, render_size=render_size)
+    latencies = []
+    failures = 0
+    slide_images = []
+
+    with PeakRSS() as peak_rss:
+        converter.setup_temp_directory()
+        try:
+            # 브라우저/워커 시작 시간은 슬라이드 지연 시간과 따로 측정
+            start = time.perf_counter()
+            converter.backend.start()
+            startup_ms = (time.perf_counter() - start) * 1000
+            try:
+                for _ in range(rounds):
+                    slide_images = []
+                    for i, html_file in enumerate(html_files, 1):
+                        start = time.perf_counter()
+                        slide_png = converter.convert_html_to_image(html_file.name, i)
+                        latencies.append((time.perf_counter() - start) * 1000)
+                        if slide_png is None:
+                            failures += 1
+                        slide_images.append(slide_png)
+            finally:
+                converter.backend.close()
+
+            # 마지막 라운드의 이미지로 PPTX 생성 후 크기 측정
+            converter.create_pptx(enumerate(slide_images), len(slide_images))
+        finally:
+            converter.cleanup_temp_directory()
+
+    return {
+        'backend': backend,
+        'slides': len(html_files),
+        'rounds': rounds,
+        'failures': failures,
+        'startup_ms': round(startup_ms, 1),
+        'p50_ms': round(percentile(latencies, 50), 1) if latencies else None,
+        'p95_ms': round(percentile(latencies, 95), 1) if latencies else None,
+        'mean_ms': round(sum(latencies) / len(latencies), 1) if latencies else None,
+        'peak_rss_mb': round(peak_rss.peak_bytes / (1024 * 1024), 1) if peak_rss.peak_bytes else None,
+        'output_mb': round(Path(output_path).stat().st_size / (1024 * 1024), 2),
+    }
+
+
+def _run_in_child(results, backend, html_dir, output_path, rounds, render_size):
+    """자식 프로세스 진입점 (결과 또는 오류 메시지를 큐로 전달)"""
+    try:
+        results.put(benchmark_backend(backend, html_dir, output_path, rounds, render_size))
+    except Exception as e:
+        results.put({'backend': backend, 'error': str(e)})
+
+
+def _wait_for_result(results, process, backend):
+    """자식 프로세스의 결과를 기다림 (결과를 보내기 전에 프로세스가 죽으면 오류 결과 반환)"""
+    while True:
+        try:
+            return results.get(timeout=RESULT_POLL_SECONDS)
+        except queue.Empty:
+            pass
+        if not process.is_alive():
+            break
+    # 종료 직전에 보낸 결과가 파이프에 남아 있을 수 있으므로 한 번 더 확인
+    try:
+        return results.get(timeout=RESULT_POLL_SECONDS)
+    except queue.Empty:
+        return {'backend': backend, 'error': f"결과 없이 프로세스 종료 (종료 코드 {process.exitcode})"}
+
+
+def run_benchmark(backends, html_dir, output_dir, rounds=1, render_size=None):
+    """백엔드마다 별도 프로세스에서 벤치마크 실행
+
+    반환값: 백엔드별 측정값 dict 리스트 (실패한 백엔드는 'error' 포함)
+    """
+    context = multiprocessing.get_context('spawn')
+    report = []
+    for backend in backends:
+        print(f"[{backend}] 벤치마크 시작")
+        results = context.Queue()
+        output_path = Path(output_dir) / f"benchmark_{backend}.pptx"
+        process = context.Process(target=_run_in_child,
+                                  args=(results, backend, str(html_dir), str(output_path), rounds, render_size))
+        process.start()
+        # 결과를 먼저 받은 뒤 join (큰 결과가 파이프에 남아 join이 멈추지 않도록)
+        # OOM/크래시로 자식이 결과 없이 죽으면 무한히 기다리지 않고 오류로 기록
+        try:
+            result = _wait_for_result(results, process, backend)
+        except Exception as e:
+            result = {'backend': backend, 'error': str(e)}
+        process.join()
+        if process.exitcode not in (0, None) and 'error' not in result:
+            result['error'] = f"프로세스 종료 코드 {process.exitcode}"
+        report.append(result)
+    return report
+
+
+def print_report(report):
+    """측정 결과 표 출력"""
+    columns = [
+        ('backend', '백엔드'), ('slides', '슬라이드'), ('failures', '실패'), ('startup_ms', '시작ms'),
+        ('p50_ms', 'p50ms'), ('p95_ms', 'p95ms'), ('mean_ms', '평균ms'),
+        ('peak_rss_mb', 'RSS MB'), ('output_mb', '출력 MB'),
+    ]
+    print(" | ".join(f"{title:>10}" for _, title in columns))
+    print("-" * (13 * len(columns)))
+    for result in report:
+        if 'error' in result:
+            print(f"{result['backend']:>10} | 오류: {result['error']}")
+            continue
+        print(" | ".join(f"{'-' if result[key] is None else result[key]!s:>10}" for key, _ in columns))
+
+    measured = [result for result in report if 'error' not in result and result['p50_ms'] is not None]
+    if measured:
+        fastest = min(measured, key=lambda result: result['p50_ms'])
+        print(f"가장 빠른 백엔드 (p50 기준): {fastest['backend']}")
+
+
+def main():
+    # 설정
+    html_dir = r"C:\Project\gigabitamin\genspark\smart_gate\html"  # 고정 벤치마크 슬라이드 묶음
+    output_dir = tempfile.gettempdir()  # 백엔드별 출력 PPTX 저장 위치
+    rounds = 3  # 슬라이드 묶음을 반복 렌더링할 횟수 (p95 안정화)
+    render_size = None  # 출력 픽셀 크기 ('1080p', '720p', '2x'), None이면 렌더 후 리사이즈
+    report_path = Path(output_dir) / 'benchmark_backends.json'  # 측정 결과 JSON
+
+    backends = [arg for arg in sys.argv[1:] if not arg.startswith('--')] or list(BACKENDS)
+    unknown = [backend for backend in backends if backend not in BACKENDS]
+    if unknown:
+        print(f"지원하지 않는 렌더 백엔드: {', '.join(unknown)} (사용 가능: {', '.join(BACKENDS)})")
+        sys.exit(1)
+
+    print("렌더 백엔드 벤치마크 시작")
+    print(f"HTML 디렉토리: {html_dir}")
+    print(f"백엔드: {', '.join(backends)} (반복 {rounds}회)")
+    if not PSUTIL_AVAILABLE:
+        print("psutil이 없어 RSS는 resource 기준으로 측정합니다 (pip install psutil 권장).")
+    print("-" * 50)
+
+    report = run_benchmark(backends, html_dir, output_dir, rounds, render_size)
+
+    print("-" * 50)
+    print_report(report)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"측정 결과 저장: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Browser Pool
+여러 변환기(html2image, Selenium, Puppeteer)가 공유하는 헤드리스 Chrome 브라우저 풀
+브라우저를 슬라이드마다 새로 띄우지 않고 재사용하며, 일정 페이지 수마다 재시작하여 메모리를 제한한다.
+"""
+
+import base64
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+from page_measure import fit_viewport_to_content, measure_clips, measure_page, root_clip, set_viewport
+from page_readiness import DEFAULT_QUIET_MS, DEFAULT_TIMEOUT_MS, wait_for_page_ready
+from request_policy import RequestInterceptor
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import WebDriverException
+    SELENIUM_AVAILABLE = True
+    # 브라우저/세션 자체의 오류 (이 오류가 난 브라우저는 재사용하지 않음)
+    BROWSER_ERRORS = (WebDriverException, ConnectionError)
+except ImportError:
+    SELENIUM_AVAILABLE = False
+    BROWSER_ERRORS = (ConnectionError,)
+
+# 기본 설정
+DEFAULT_POOL_SIZE = 2  # 동시에 유지할 브라우저 수
+DEFAULT_MAX_PAGES_PER_BROWSER = 50  # 브라우저 하나가 처리할 최대 페이지 수 (이후 재시작)
+DEFAULT_WINDOW_SIZE = (1920, 1080)
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000)
+
+
+def debugger_url(driver):
+    """WebDriver가 제어하는 Chrome의 DevTools URL (Puppeteer 워커가 접속할 때 사용)"""
+    chrome_options = driver.capabilities.get('goog:chromeOptions', {})
+    address = chrome_options.get('debuggerAddress')
+    return f"http://{address}" if address else None
+
+
+class PooledBrowser:
+    """풀에서 관리되는 브라우저 하나 (WebDriver + 재사용 탭 + 처리한 페이지 수)
+
+    pages_served는 브라우저가 로드한 페이지 수이다. WebDriver 없이 DevTools로 직접 로드하는 도구
+    (Puppeteer 워커, CDP 백엔드)는 로드할 때마다 직접 1씩 더한다.
+    """
+
+    def __init__(self, driver, browser_id):
+        self.driver = driver
+        self.browser_id = browser_id
+        self.pages_served = 0
+        # 브라우저마다 탭 하나를 계속 재사용
+        self.tab_handle = driver.current_window_handle
+        # 재사용 탭의 요청 가로채기 (set_request_policy 이후)
+        self.request_interceptor = None
+
+    @property
+    def debugger_url(self):
+        """Puppeteer 등 외부 도구가 접속할 수 있는 DevTools URL"""
+        return debugger_url(self.driver)
+
+    def set_viewport(self, width, height, scale=1):
+        """뷰포트 크기를 정확하게 설정 (창 크기가 아닌 CSS 뷰포트 기준, scale은 deviceScaleFactor)"""
+        set_viewport(self.driver, width, height, scale)
+
+    def set_request_policy(self, policy):
+        """재사용 탭의 요청에 request_policy.RequestPolicy 적용 (None이면 가로채기 해제)
+
+        가로채기 연결은 브라우저가 재시작될 때까지 유지하고, 정책이 바뀌면 정책만 교체한다.
+        """
+        if policy is None:
+            if self.request_interceptor is not None:
+                self.request_interceptor.close()
+                self.request_interceptor = None
+            return
+        if self.request_interceptor is not None:
+            self.request_interceptor.policy = policy
+            return
+        self.driver.switch_to.window(self.tab_handle)
+        target_id = self.driver.execute_cdp_cmd('Target.getTargetInfo', {})['targetInfo']['targetId']
+        interceptor = RequestInterceptor(self.debugger_url, target_id, policy)
+        interceptor.start()
+        self.request_interceptor = interceptor
+
+    def take_request_log(self):
+        """마지막으로 가져간 뒤 차단/바꿔쓴 요청 기록 (가로채기를 쓰지 않으면 빈 리스트)"""
+        if self.request_interceptor is None:
+            return []
+        return self.request_interceptor.take_log()
+
+    def load(self, html_path):
+        """재사용 탭에서 HTML 파일 로드"""
+        self.driver.switch_to.window(self.tab_handle)
+        self.driver.get(Path(html_path).resolve().as_uri())
+        self.pages_served += 1
+
+    def capture_png(self, html_path, size, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS,
+                    fit_content=True, scale=1, timings=None):
+        """HTML 파일을 로드하고 페이지 준비 완료 후 스크린샷을 PNG bytes로 반환 (파일 저장 없음)
+
+        fit_content=True이면 size의 높이는 초기값으로만 쓰고, 측정한 실제 DOM 높이로 뷰포트를 맞춰 한 번만 캡처한다.
+        fit_content=False이면 size x scale 픽셀 크기 그대로 캡처한다.
+        timings dict를 주면 단계별 시간(load_ms, wait_ms, measure_ms, screenshot_ms)을 채운다.
+        """
+        timings = {} if timings is None else timings
+        width, height = size
+        start = time.perf_counter()
+        self.set_viewport(width, height, scale)
+        self.load(html_path)
+        timings['load_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        wait_for_page_ready(self.driver, quiet_ms=quiet_ms, timeout_ms=timeout_ms)
+        timings['wait_ms'] = _elapsed_ms(start)
+
+        if fit_content:
+            start = time.perf_counter()
+            fit_viewport_to_content(self.driver, width, scale=scale)
+            timings['measure_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        png_data = self.driver.get_screenshot_as_png()
+        timings['screenshot_ms'] = _elapsed_ms(start)
+        return png_data
+
+    def capture_root(self, html_path, size, root_selector, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS,
+                     scale=1, timings=None):
+        """HTML 파일을 로드하고 root_selector 요소(.slide-container 등)의 영역만 PNG bytes로 캡처
+
+        요소 영역을 size 너비로 확대하여 캡처하므로 (clip scale) 요소가 슬라이드 비율이면 PNG가 곧 size x scale 크기이다.
+        요소를 찾지 못하면 size x scale 뷰포트 그대로 캡처한다.
+        반환값: (PNG bytes, page_measure 측정값)
+        """
+        timings = {} if timings is None else timings
+        width, height = size
+        start = time.perf_counter()
+        self.set_viewport(width, height, scale)
+        self.load(html_path)
+        timings['load_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        wait_for_page_ready(self.driver, quiet_ms=quiet_ms, timeout_ms=timeout_ms)
+        timings['wait_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        metrics = measure_page(self.driver, root_selector, min_height=int(height))
+        clip = root_clip(metrics, width)
+        timings['measure_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        if clip is None:
+            print(f"  {root_selector} 요소를 찾지 못해 뷰포트 전체를 캡처합니다.")
+            png_data = self.driver.get_screenshot_as_png()
+        else:
+            screenshot = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'png',
+                'clip': clip,
+                'captureBeyondViewport': True,
+            })
+            png_data = base64.b64decode(screenshot['data'])
+        timings['screenshot_ms'] = _elapsed_ms(start)
+        return png_data, metrics
+
+    def capture_clips(self, html_path, size, box_selector, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS,
+                      scale=1):
+        """HTML 파일을 한 번 로드하고 box_selector 요소(슬라이드 상자)마다 clip 영역을 PNG bytes로 캡처
+
+        size는 뷰포트 크기 (상자 하나 크기), 뷰포트 밖의 상자는 captureBeyondViewport로 캡처한다.
+        반환값: (상자 인덱스, PNG bytes, 넘친 높이 px, 단계별 시간 dict)를 문서 순서대로 내보내는 generator
+        (첫 상자의 시간에 load_ms, wait_ms, measure_ms 포함)
+        """
+        width, height = size
+        timings = {}
+        start = time.perf_counter()
+        self.set_viewport(width, height, scale)
+        self.load(html_path)
+        timings['load_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        wait_for_page_ready(self.driver, quiet_ms=quiet_ms, timeout_ms=timeout_ms)
+        timings['wait_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        clips = measure_clips(self.driver, box_selector)
+        timings['measure_ms'] = _elapsed_ms(start)
+
+        for index, clip in enumerate(clips):
+            start = time.perf_counter()
+            screenshot = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'png',
+                'clip': {'x': clip['x'], 'y': clip['y'], 'width': clip['width'], 'height': clip['height'], 'scale': 1},
+                'captureBeyondViewport': True,
+            })
+            timings['screenshot_ms'] = _elapsed_ms(start)
+            yield index, base64.b64decode(screenshot['data']), clip['overflow'], timings
+            timings = {}
+
+    def screenshot(self, html_path, output_path, size, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS,
+                   fit_content=True, scale=1):
+        """capture_png 결과를 파일로 저장"""
+        output_path = Path(output_path)
+        output_path.write_bytes(self.capture_png(html_path, size, quiet_ms, timeout_ms, fit_content, scale))
+        return output_path
+
+    def reset_tab(self):
+        """다음 작업을 위해 탭 정리 (페이지가 연 추가 창 닫기, 빈 페이지로 이동)"""
+        for handle in self.driver.window_handles:
+            if handle != self.tab_handle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(self.tab_handle)
+        self.driver.get('about:blank')
+
+    def quit(self):
+        if self.request_interceptor is not None:
+            self.request_interceptor.close()
+            self.request_interceptor = None
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"브라우저 종료 오류 (#{self.browser_id}): {e}")
+
+
+class BrowserPool:
+    """헤드리스 Chrome 브라우저 풀
+
+    사용 예:
+        with BrowserPool(pool_size=2) as pool:
+            with pool.acquire() as browser:
+                browser.screenshot(html_path, output_path, (1920, 1080))
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, max_pages_per_browser=DEFAULT_MAX_PAGES_PER_BROWSER,
+                 window_size=DEFAULT_WINDOW_SIZE, chrome_args=None):
+        if pool_size < 1:
+            raise ValueError("pool_size는 1 이상이어야 합니다.")
+
+        self.pool_size = pool_size
+        self.max_pages_per_browser = max_pages_per_browser
+        self.window_size = window_size
+        self.chrome_args = list(chrome_args or [])
+
+        self._idle = deque()
+        self._lock = threading.Lock()
+        # 유휴 브라우저가 돌아오거나 실행 자리가 비면 기다리는 acquire를 깨움
+        self._available = threading.Condition(self._lock)
+        self._launched = 0
+        self._next_id = 1
+        self._browsers = {}
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _create_options(self):
+        """Chrome 옵션 생성 (selenium_html_to_pptx.py의 설정과 동일)"""
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        chrome_options.add_argument("--disable-web-security")
+        chrome_options.add_argument("--allow-running-insecure-content")
+        chrome_options.add_argument("--hide-scrollbars")
+        for arg in self.chrome_args:
+            chrome_options.add_argument(arg)
+        return chrome_options
+
+    def _launch(self):
+        """새 브라우저 실행"""
+        if not SELENIUM_AVAILABLE:
+            raise ImportError("Selenium이 설치되지 않았습니다. pip install selenium으로 설치하세요.")
+
+        with self._lock:
+            browser_id = self._next_id
+            self._next_id += 1
+
+        driver = webdriver.Chrome(options=self._create_options())
+        browser = PooledBrowser(driver, browser_id)
+        with self._lock:
+            self._browsers[browser_id] = browser
+        print(f"브라우저 풀: 브라우저 #{browser_id} 시작")
+        return browser
+
+    def _take(self, timeout):
+        """유휴 브라우저를 가져오거나, 여유가 있으면 새로 실행 (둘 다 안 되면 반환/폐기될 때까지 대기)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("이미 종료된 브라우저 풀입니다.")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._launched < self.pool_size:
+                    self._launched += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"브라우저 풀에서 {timeout}초 안에 브라우저를 빌리지 못했습니다.")
+                self._available.wait(remaining)
+
+        try:
+            return self._launch()
+        except Exception:
+            with self._available:
+                self._launched -= 1
+                self._available.notify()
+            raise
+
+    def _discard(self, browser):
+        """브라우저를 풀에서 제거하고 종료 (close()가 이미 종료한 브라우저는 건너뜀)"""
+        with self._available:
+            if self._browsers.pop(browser.browser_id, None) is None:
+                return
+            self._launched -= 1
+            # 비어 있는 실행 자리로 기다리던 acquire가 새 브라우저를 띄울 수 있게 깨움
+            self._available.notify()
+        browser.quit()
+
+    def needs_restart(self, browser):
+        """브라우저가 재시작 기준 페이지 수에 닿았는지 여부"""
+        return browser.pages_served >= self.max_pages_per_browser
+
+    def _release(self, browser, healthy):
+        """사용이 끝난 브라우저를 풀에 반환 (필요 시 재시작)"""
+        if self._closed or not healthy:
+            self._discard(browser)
+            return
+
+        if self.needs_restart(browser):
+            print(f"브라우저 풀: 브라우저 #{browser.browser_id} 재시작 ({browser.pages_served}페이지 처리)")
+            self._discard(browser)
+            return
+
+        try:
+            browser.reset_tab()
+        except Exception as e:
+            print(f"브라우저 풀: 탭 정리 실패, 브라우저 #{browser.browser_id} 폐기 ({e})")
+            self._discard(browser)
+            return
+
+        with self._available:
+            if self._closed:
+                # 정리하는 사이 close()가 불렸으면 이미 종료된 브라우저
+                return
+            self._idle.append(browser)
+            self._available.notify()
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """브라우저 하나를 빌려 사용 후 자동 반환"""
+        if self._closed:
+            raise RuntimeError("이미 종료된 브라우저 풀입니다.")
+
+        browser = self._take(timeout)
+        healthy = True
+        try:
+            yield browser
+        except BROWSER_ERRORS:
+            # 브라우저/세션 오류이면 재사용하지 않음 (슬라이드 처리 중 일반 오류는 브라우저를 유지)
+            healthy = False
+            raise
+        finally:
+            self._release(browser, healthy)
+
+    def close(self):
+        """풀의 모든 브라우저 종료"""
+        with self._available:
+            self._closed = True
+            browsers = list(self._browsers.values())
+            self._browsers.clear()
+            self._idle.clear()
+            self._launched = 0
+            # 기다리던 acquire는 종료된 풀 오류로 끝남
+            self._available.notify_all()
+        for browser in browsers:
+            browser.quit()
+        if browsers:
+            print(f"브라우저 풀 종료 ({len(browsers)}개 브라우저)")
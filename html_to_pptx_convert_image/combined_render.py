@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Combined Render
+폴더의 슬라이드 HTML을 1920x1080 고정 상자로 이어 붙인 통합 문서 하나로 만들어 한 번만 로드하고,
+슬라이드 상자마다 clip 영역으로 캡처하는 렌더 모드 (merge_html/merge_html_folders.py의 merge_folder_print 방식)
+작은 슬라이드가 많은 덱에서 슬라이드마다 반복되는 문서 생성, CSS 파싱, 폰트 로드를 한 번으로 줄인다.
+
+제약: 슬라이드들의 <style>, <script>와 id가 한 문서에 합쳐지므로 body 전체에 거는 레이아웃 스타일이나
+같은 id를 쓰는 차트 스크립트가 서로 충돌하는 덱은 페이지별 렌더링을 사용한다 (중복 id는 경고로 알림).
+"""
+
+import re
+
+from slide_image import SLIDE_SIZE
+
+# 기본 설정
+SLIDE_BOX_CLASS = 'combined-slide'
+SLIDE_BOX_SELECTOR = f'.{SLIDE_BOX_CLASS}'
+
+COMBINED_HEAD = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+  <meta charset="UTF-8" />
+  {{HEAD_ASSETS}}
+  <style>
+    /* 슬라이드 상자를 세로로 이어 붙임 (슬라이드가 body에 건 크기/레이아웃/스크롤 제한 무시) */
+    html, body {
+      width: auto !important; height: auto !important; min-height: 0 !important;
+      overflow: visible !important; display: block !important;
+      margin: 0 !important; padding: 0 !important;
+    }
+    .{{BOX_CLASS}} {
+      position: relative; width: {{WIDTH}}px; height: {{HEIGHT}}px;
+      overflow: hidden; contain: strict;
+    }
+    .{{BOX_CLASS}} > .combined-body { width: 100%; min-height: 100%; }
+  </style>
+</head>
+<body>
+"""
+
+COMBINED_FOOT = """
+</body>
+</html>
+"""
+
+HEAD_PATTERN = re.compile(r"<head[^>]*>([\s\S]*?)</head>", re.IGNORECASE)
+BODY_PATTERN = re.compile(r"<body([^>]*)>([\s\S]*?)</body>", re.IGNORECASE)
+STYLESHEET_PATTERN = re.compile(r"<link[^>]+rel=[\"']?stylesheet[\"']?[^>]*>", re.IGNORECASE)
+STYLE_PATTERN = re.compile(r"<style[^>]*>[\s\S]*?</style>", re.IGNORECASE)
+SCRIPT_PATTERN = re.compile(r"<script[^>]*>[\s\S]*?</script>", re.IGNORECASE)
+ATTRIBUTE_PATTERN = r"""\b{name}\s*=\s*(?:"([^"]*)"|'([^']*)')"""
+ID_PATTERN = re.compile(r"""\bid\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
+
+def _attribute(attributes, name):
+    """태그 속성 문자열에서 속성값 추출 (없으면 '')"""
+    match = re.search(ATTRIBUTE_PATTERN.format(name=name), attributes, re.IGNORECASE)
+    return (match.group(1) or match.group(2) or '') if match else ''
+
+
+def extract_head_assets(html_text):
+    """문서의 <head>에서 스타일시트 link, <style>, <script> 태그를 문서 순서대로 추출"""
+    head_match = HEAD_PATTERN.search(html_text)
+    if not head_match:
+        return []
+    head = head_match.group(1)
+    tags = []
+    for pattern in (STYLESHEET_PATTERN, STYLE_PATTERN, SCRIPT_PATTERN):
+        tags.extend((match.start(), match.group(0)) for match in pattern.finditer(head))
+    return [tag for _, tag in sorted(tags)]
+
+
+def extract_body(html_text):
+    """<body> 안쪽 HTML과 body의 class/style 속성 (body가 없으면 head를 뺀 전체)"""
+    match = BODY_PATTERN.search(html_text)
+    if match:
+        attributes = match.group(1)
+        return match.group(2), _attribute(attributes, 'class'), _attribute(attributes, 'style')
+    cleaned = re.sub(r"</?html[^>]*>", "", html_text, flags=re.IGNORECASE)
+    cleaned = HEAD_PATTERN.sub("", cleaned)
+    return cleaned, '', ''
+
+
+def build_combined_document(html_contents, slide_size=SLIDE_SIZE):
+    """슬라이드 HTML 내용 리스트를 고정 크기 상자로 이어 붙인 통합 문서 HTML로 변환
+
+    head의 스타일시트/스타일/스크립트는 중복을 제거하여 한 번만 넣고,
+    body의 class/style은 슬라이드 상자 안쪽 div(.combined-body)에 옮겨 슬라이드마다 유지한다.
+    """
+    width, height = slide_size
+    head_assets = {}  # 태그 -> None (순서 유지 중복 제거)
+    bodies = []
+    ids = {}
+    for index, html_content in enumerate(html_contents):
+        for tag in extract_head_assets(html_content):
+            head_assets[tag] = None
+        body_inner, body_class, body_style = extract_body(html_content)
+        body_style = body_style.replace('"', '&quot;')
+        bodies.append(
+            f'<div class="{SLIDE_BOX_CLASS}" data-slide="{index}">\n'
+            f'<div class="combined-body {body_class}" style="{body_style}">\n{body_inner}\n</div>\n'
+            f'</div>'
+        )
+        for element_id in set(ID_PATTERN.findall(body_inner)):
+            ids.setdefault(element_id, []).append(index + 1)
+
+    duplicated = [(element_id, slides) for element_id, slides in ids.items() if len(slides) > 1]
+    if duplicated:
+        element_id, slides = duplicated[0]
+        print(f"  경고: 통합 문서에서 id {len(duplicated)}개가 여러 슬라이드에 중복됩니다 "
+              f"(예: #{element_id} 슬라이드 {slides}). 스크립트가 id로 요소를 찾는 덱은 페이지별 렌더링을 사용하세요.")
+
+    head = (COMBINED_HEAD.replace("{{HEAD_ASSETS}}", "\n  ".join(head_assets))
+            .replace("{{BOX_CLASS}}", SLIDE_BOX_CLASS)
+            .replace("{{WIDTH}}", str(width))
+            .replace("{{HEIGHT}}", str(height)))
+    return head + "\n".join(bodies) + COMBINED_FOOT
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Concurrent Render
+한 브라우저의 여러 탭에서 슬라이드를 동시에 렌더링하는 asyncio 렌더 모드
+동시 탭 수(K)를 제한하고, 결과는 완료되는 대로 슬라이드 인덱스와 함께 반환하며, 한 슬라이드의 실패가 다른 슬라이드를 취소하지 않는다.
+"""
+
+import asyncio
+import time
+
+from page_measure import root_overflow, slide_overflow
+from puppeteer_worker import AsyncPuppeteerWorker
+
+# 기본 설정
+DEFAULT_CONCURRENCY = 4  # 동시에 사용할 탭 수
+SLIDE_WIDTH = 1920
+
+
+def _finish_result(converter, html_file, result, calculated_height, fit_content, clip_selector=None):
+    """탭 렌더 결과를 후처리하여 슬라이드 이미지(PNG bytes) 반환 (실패 시 None)"""
+    if isinstance(result, BaseException):
+        print(f"HTML 변환 오류 ({html_file.name}): {result}")
+        return None
+
+    timings = result['timings']
+    print(f"  {html_file.name}: 로드 {timings.get('load_ms')}ms, 대기 {timings.get('wait_ms')}ms, "
+          f"스크린샷 {timings.get('screenshot_ms')}ms")
+    # 탭 안의 단계는 완료 시점에서 total_ms만큼 거슬러 올라간 위치부터 기록
+    if timings.get('total_ms') is not None:
+        render_start = time.perf_counter() - timings['total_ms'] / 1000
+        converter.tracer.record('render', render_start, timings['total_ms'] / 1000, slide=html_file.name)
+        converter.tracer.record_timings(render_start, timings, prefix='render.', slide=html_file.name)
+    converter.report_requests(html_file.name, result.get('requests'))
+    if clip_selector and result.get('metrics'):
+        converter.report_overflow(html_file.name, root_overflow(result['metrics'], (SLIDE_WIDTH, calculated_height)))
+    elif not fit_content and result.get('metrics'):
+        converter.report_overflow(html_file.name, slide_overflow(result['metrics'], calculated_height))
+    try:
+        with converter.tracer.slide(html_file.name):
+            return converter.finish_slide(result['png'])
+    except Exception as e:
+        print(f"이미지 후처리 오류 ({html_file.name}): {e}")
+        return None
+
+
+def iter_slides_concurrently(converter, html_files, concurrency=DEFAULT_CONCURRENCY, browser_url=None):
+    """변환기의 prepare_slide/finish_slide를 사용하여 폴더 전체를 병렬 렌더링하며 완료되는 대로 반환
+
+    임시 HTML은 탭이 빌 때마다 하나씩 준비하므로, 진행 중인 슬라이드는 최대 concurrency개이다.
+    반환값: (슬라이드 인덱스, 슬라이드 이미지 PNG bytes 또는 None)을 완료 순서대로 내보내는 generator
+    """
+    # 출력 크기가 지정되거나 루트 요소 clip 캡처이면 고정 뷰포트 + deviceScaleFactor로 최종 픽셀 크기 그대로 렌더링
+    clip_selector = converter.clip_selector if converter.clips_to_root() else None
+    fit_content = converter.render_size is None and clip_selector is None
+    request_rules = converter.request_policy.worker_rules() if converter.request_policy is not None else None
+    print(f"병렬 렌더링 시작: 슬라이드 {len(html_files)}개, 탭 {concurrency}개")
+
+    loop = asyncio.new_event_loop()
+    worker = AsyncPuppeteerWorker(browser_url=browser_url, tabs=concurrency)
+    running = {}  # task -> (인덱스, HTML 파일, 임시 HTML 경로, 계산된 높이)
+    try:
+        loop.run_until_complete(worker.start())
+        try:
+            pending = iter(enumerate(html_files))
+
+            while True:
+                # 빈 탭 수만큼 다음 슬라이드 준비 후 렌더링 시작 (준비 실패는 바로 None 반환)
+                for index, html_file in pending:
+                    try:
+                        temp_html_path, calculated_height = converter.prepare_slide(html_file.name, index + 1)
+                    except Exception as e:
+                        print(f"HTML 준비 오류 ({html_file.name}): {e}")
+                        yield index, None
+                        continue
+                    task = loop.create_task(worker.render(temp_html_path, (SLIDE_WIDTH, calculated_height),
+                                                          fit_content=fit_content, scale=converter.device_scale,
+                                                          clip_selector=clip_selector,
+                                                          virtual_time_ms=converter.virtual_time_ms,
+                                                          request_rules=request_rules))
+                    running[task] = (index, html_file, temp_html_path, calculated_height)
+                    if len(running) >= concurrency:
+                        break
+                if not running:
+                    break
+
+                # 하나 이상 완료될 때까지 이벤트 루프 실행 (한 슬라이드의 실패가 다른 탭을 취소하지 않음)
+                done, _ = loop.run_until_complete(asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED))
+                for task in done:
+                    index, html_file, temp_html_path, calculated_height = running.pop(task)
+                    result = task.exception() or task.result()
+                    slide_png = _finish_result(converter, html_file, result, calculated_height, fit_content,
+                                               clip_selector)
+
+                    # 임시 HTML 파일 삭제
+                    if temp_html_path.exists():
+                        temp_html_path.unlink()
+
+                    yield index, slide_png
+        finally:
+            # 중단된 경우 진행 중인 탭 작업 취소
+            for task in running:
+                task.cancel()
+            if running:
+                loop.run_until_complete(asyncio.gather(*running, return_exceptions=True))
+            for _, _, temp_html_path, _ in running.values():
+                if temp_html_path.exists():
+                    temp_html_path.unlink()
+            loop.run_until_complete(worker.close())
+    finally:
+        loop.close()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental PPTX
+이전에 생성한 PPTX를 열어 바뀐 슬라이드의 이미지만 교체하는 증분 빌드 모듈
+슬라이드마다 원본 HTML 파일명과 내용 키(render_cache.render_key)를 슬라이드 이름에 태그로 저장하고,
+다음 빌드에서는 키가 바뀐 슬라이드만 렌더링하여 이미지 파트를 바꾸고, 추가/삭제된 HTML에 맞춰 슬라이드를 더하거나 지운다.
+"""
+
+import io
+
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+# 슬라이드 이름 태그: "html_to_pptx|<HTML 파일명>|<내용 키>"
+SLIDE_TAG_PREFIX = 'html_to_pptx'
+
+
+def tag_slide(slide, source_name, content_key):
+    """슬라이드에 원본 HTML 파일명과 내용 키 태그 저장 (슬라이드 이름 사용)"""
+    slide._element.cSld.set('name', f"{SLIDE_TAG_PREFIX}|{source_name}|{content_key}")
+
+
+def read_slide_tag(slide):
+    """슬라이드 태그 읽기 (태그가 없으면 None)
+
+    반환값: (HTML 파일명, 내용 키)
+    """
+    parts = slide.name.split('|')
+    if len(parts) != 3 or parts[0] != SLIDE_TAG_PREFIX:
+        return None
+    return parts[1], parts[2]
+
+
+def add_image_slide(prs, png_data):
+    """빈 레이아웃 슬라이드를 추가하고 PNG를 슬라이드 전체 크기로 삽입"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # 빈 레이아웃
+    slide.shapes.add_picture(io.BytesIO(png_data), 0, 0, prs.slide_width, prs.slide_height)
+    return slide
+
+
+def replace_slide_image(slide, png_data):
+    """슬라이드의 그림 도형은 그대로 두고 이미지 파트만 교체"""
+    picture = next(shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE)
+    blip = picture._element.blipFill.blip
+    old_rId = blip.rEmbed
+    _, new_rId = slide.part.get_or_add_image_part(io.BytesIO(png_data))
+    if new_rId != old_rId:
+        blip.rEmbed = new_rId
+        # 더 이상 참조하지 않는 이전 이미지 관계 제거 (저장 시 이미지 파트도 빠짐)
+        slide.part.drop_rel(old_rId)
+
+
+def delete_slide(prs, slide):
+    """프레젠테이션에서 슬라이드 삭제"""
+    slide_ids = prs.slides._sldIdLst
+    for slide_id in list(slide_ids):
+        if prs.part.related_part(slide_id.rId) is slide.part:
+            slide_ids.remove(slide_id)
+            prs.part.drop_rel(slide_id.rId)
+            return
+
+
+def reorder_slides(prs, slides):
+    """슬라이드 순서를 주어진 순서로 변경"""
+    slide_ids = prs.slides._sldIdLst
+    by_part = {prs.part.related_part(slide_id.rId): slide_id for slide_id in slide_ids}
+    for slide_id in list(slide_ids):
+        slide_ids.remove(slide_id)
+    for slide in slides:
+        slide_ids.append(by_part[slide.part])
+
+
+def patch_pptx(pptx_path, html_files, slide_keys, render_files):
+    """기존 PPTX에서 바뀐 슬라이드만 교체하여 저장
+
+    html_files: 현재 HTML 파일 리스트 (슬라이드 순서)
+    slide_keys: html_files와 같은 순서의 내용 키 리스트
+    render_files: HTML 파일 리스트를 받아 같은 순서의 PNG bytes(실패 시 None) 리스트를 반환하는 함수
+    반환값: 패치했으면 {'changed', 'added', 'removed'} 개수 dict,
+            태그가 없는 슬라이드가 있어 전체 생성이 필요하면 None
+    """
+    prs = Presentation(pptx_path)
+
+    existing = {}
+    for slide in prs.slides:
+        tag = read_slide_tag(slide)
+        if tag is None:
+            print("태그가 없는 슬라이드가 있어 증분 빌드를 할 수 없습니다. 전체를 다시 생성합니다.")
+            return None
+        existing[tag[0]] = (slide, tag[1])
+
+    names = [html_file.name for html_file in html_files]
+    outdated = [
+        i for i, (name, key) in enumerate(zip(names, slide_keys))
+        if name not in existing or existing[name][1] != key
+    ]
+    removed = [name for name in existing if name not in set(names)]
+    print(f"증분 빌드: 변경/추가 {len(outdated)}개, 삭제 {len(removed)}개, 유지 {len(names) - len(outdated)}개")
+
+    # 바뀐 슬라이드만 렌더링
+    rendered = render_files([html_files[i] for i in outdated]) if outdated else []
+
+    result = {'changed': 0, 'added': 0, 'removed': 0}
+    for i, png_data in zip(outdated, rendered):
+        name = names[i]
+        if png_data is None:
+            # 실패한 슬라이드는 이전 이미지를 유지하고 태그도 그대로 두어 다음 빌드에서 다시 시도
+            print(f"  {name}: 렌더 실패, 이전 슬라이드 유지")
+            continue
+        if name in existing:
+            slide = existing[name][0]
+            replace_slide_image(slide, png_data)
+            result['changed'] += 1
+            print(f"  {name}: 이미지 교체")
+        else:
+            slide = add_image_slide(prs, png_data)
+            result['added'] += 1
+            print(f"  {name}: 슬라이드 추가")
+        tag_slide(slide, name, slide_keys[i])
+        existing[name] = (slide, slide_keys[i])
+
+    for name in removed:
+        delete_slide(prs, existing.pop(name)[0])
+        result['removed'] += 1
+        print(f"  {name}: 슬라이드 삭제")
+
+    # HTML 파일 순서에 맞게 정렬 후 저장
+    reorder_slides(prs, [existing[name][0] for name in names if name in existing])
+    prs.save(pptx_path)
+    print(f"PPTX 파일 갱신 완료: {pptx_path}")
+    return result
@@ -0,0 +1,42 @@
+/**
+ * Page Measure
+ * 렌더된 페이지에서 실제 콘텐츠 크기를 측정하는 스크립트 (Selenium/Puppeteer 백엔드 공용)
+ *
+ * (rootSelector, minHeight, maxHeight)로 호출하면 다음 값을 반환한다.
+ *   scroll_width, scroll_height : 문서 전체 스크롤 크기
+ *   root                        : rootSelector 요소(.slide-container 등)의 문서 기준 영역 또는 null
+ *                                 (overflow: 요소 안에서 넘쳐 잘린 콘텐츠 높이 px)
+ *   fit_height                  : 콘텐츠가 잘리지 않는 뷰포트 높이 (minHeight ~ maxHeight 범위)
+ */
+(function (rootSelector, minHeight, maxHeight) {
+    var doc = document.documentElement;
+    var body = document.body;
+    var scrollWidth = Math.max(doc.scrollWidth, body ? body.scrollWidth : 0);
+    var scrollHeight = Math.max(doc.scrollHeight, body ? body.scrollHeight : 0);
+
+    var root = null;
+    var element = rootSelector ? document.querySelector(rootSelector) : null;
+    if (element) {
+        var rect = element.getBoundingClientRect();
+        root = {
+            x: Math.round(rect.left + window.scrollX),
+            y: Math.round(rect.top + window.scrollY),
+            width: Math.round(rect.width),
+            height: Math.round(rect.height),
+            overflow: Math.max(0, element.scrollHeight - element.clientHeight)
+        };
+    }
+
+    var contentHeight = scrollHeight;
+    if (root) {
+        contentHeight = Math.max(contentHeight, root.y + root.height);
+    }
+    var fitHeight = Math.max(minHeight, Math.min(Math.ceil(contentHeight), maxHeight));
+
+    return {
+        scroll_width: scrollWidth,
+        scroll_height: scrollHeight,
+        root: root,
+        fit_height: fitHeight
+    };
+})
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page Measure
+텍스트 길이 기반 추정 대신 브라우저에서 실제 DOM 높이(scrollHeight, .slide-container 영역)를 측정하여
+뷰포트를 콘텐츠 크기에 맞추는 공용 모듈 (측정 스크립트 본문은 page_measure.js, 통합 문서 슬라이드 영역은 slide_clips.js)
+루트 요소 영역만 캡처하는 clip 값(root_clip)과 그때의 넘침 높이(root_overflow)도 여기서 계산한다.
+"""
+
+from pathlib import Path
+
+from page_readiness import load_page_script
+
+MEASURE_SCRIPT = load_page_script(Path(__file__).resolve().parent / 'page_measure.js')
+CLIP_SCRIPT = load_page_script(Path(__file__).resolve().parent / 'slide_clips.js')
+
+# 기본 설정
+DEFAULT_ROOT_SELECTOR = '.slide-container'
+SLIDE_WIDTH = 1920
+MIN_HEIGHT = 1080  # 슬라이드 최소 높이
+MAX_HEIGHT = 8640  # 비정상적으로 긴 페이지 보호용 상한
+
+
+def set_viewport(driver, width, height, scale=1):
+    """CDP로 CSS 뷰포트 크기와 deviceScaleFactor를 정확하게 설정 (스크린샷 픽셀 크기 = CSS 크기 x scale)"""
+    driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+        'width': int(width),
+        'height': int(height),
+        'deviceScaleFactor': scale,
+        'mobile': False,
+    })
+
+
+def measure_page(driver, root_selector=DEFAULT_ROOT_SELECTOR, min_height=MIN_HEIGHT, max_height=MAX_HEIGHT):
+    """현재 페이지의 스크롤 크기와 루트 요소 영역 측정"""
+    return driver.execute_script(
+        f"return ({MEASURE_SCRIPT})(arguments[0], arguments[1], arguments[2]);",
+        root_selector, min_height, max_height
+    )
+
+
+def fit_viewport_to_content(driver, width=SLIDE_WIDTH, root_selector=DEFAULT_ROOT_SELECTOR, scale=1):
+    """측정한 콘텐츠 높이로 뷰포트를 맞춤
+
+    반환값: (측정값 dict, 적용한 뷰포트 높이)
+    """
+    metrics = measure_page(driver, root_selector)
+    height = metrics['fit_height']
+    set_viewport(driver, width, height, scale)
+
+    root = metrics.get('root')
+    root_text = f"{root['width']}x{root['height']}" if root else "없음"
+    print(f"  측정된 높이: scrollHeight {metrics['scroll_height']}px, "
+          f"{root_selector} {root_text} -> 뷰포트 {width}x{height}")
+    return metrics, height
+
+
+def measure_clips(driver, box_selector):
+    """통합 문서에서 슬라이드 상자마다 캡처 영역 측정 ([{x, y, width, height, overflow}, ...])"""
+    return driver.execute_script(f"return ({CLIP_SCRIPT})(arguments[0]);", box_selector)
+
+
+def slide_overflow(metrics, viewport_height):
+    """고정 뷰포트 높이로 캡처할 때 잘리는 콘텐츠 높이(px, 없으면 0)"""
+    return max(0, metrics['fit_height'] - int(viewport_height))
+
+
+def root_clip(metrics, width):
+    """측정값의 루트 요소 영역을 출력 너비(width)로 확대하는 Page.captureScreenshot clip (요소가 없으면 None)
+
+    clip scale은 deviceScaleFactor에 곱해지므로, 캡처 픽셀 너비 = width x deviceScaleFactor가 된다.
+    """
+    root = metrics.get('root') if metrics else None
+    if not root or root['width'] <= 0 or root['height'] <= 0:
+        return None
+    return {
+        'x': root['x'],
+        'y': root['y'],
+        'width': root['width'],
+        'height': root['height'],
+        'scale': width / root['width'],
+    }
+
+
+def root_overflow(metrics, size):
+    """루트 요소 clip 캡처에서 슬라이드 크기(size)를 넘쳐 잘리는 높이 (슬라이드 px, 없으면 0)
+
+    요소가 슬라이드 비율보다 길거나 요소 안(overflow: hidden)에서 넘친 콘텐츠가 있으면 넘친 것으로 보고,
+    요소를 찾지 못해 고정 뷰포트로 캡처한 경우에는 뷰포트 높이를 넘친 콘텐츠 높이를 반환한다.
+    """
+    clip = root_clip(metrics, size[0])
+    if clip is None:
+        return slide_overflow(metrics, size[1])
+    clipped_height = round(clip['height'] * clip['scale']) - int(size[1])
+    hidden_height = round(metrics['root'].get('overflow', 0) * clip['scale'])
+    return max(0, clipped_height, hidden_height)
+
+
+def measure_overflow(driver, viewport_height, root_selector=DEFAULT_ROOT_SELECTOR):
+    """뷰포트를 바꾸지 않고 콘텐츠가 고정 슬라이드 높이를 넘치는지 측정
+
+    반환값: (측정값 dict, 넘친 높이 px)
+    """
+    metrics = measure_page(driver, root_selector, min_height=int(viewport_height))
+    return metrics, slide_overflow(metrics, viewport_height)
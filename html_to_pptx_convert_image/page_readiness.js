@@ -0,0 +1,106 @@
+/**
+ * Page Readiness Detector
+ * 모든 렌더 백엔드(Selenium, Puppeteer, 브라우저 풀)가 공유하는 페이지 준비 완료 감지 스크립트
+ *
+ * 고정 대기(sleep) 대신 다음 조건이 모두 충족되면 즉시 완료된다.
+ *   1. document.readyState === 'complete' (load 이벤트)
+ *   2. document.fonts.ready
+ *   3. 모든 <img> 로드 및 디코딩 완료
+ *   4. 새 리소스 요청이 quietMs 동안 없음 (네트워크 조용한 구간)
+ * timeoutMs가 지나면 조건과 관계없이 완료된다 (ready: false).
+ *
+ * 페이지 안에서 (quietMs, timeoutMs)로 호출하면 Promise<{ready, reason, elapsed_ms}>를 반환한다.
+ */
+(function (quietMs, timeoutMs) {
+    return new Promise(function (resolve) {
+        var start = performance.now();
+        var lastActivity = start;
+        var finished = false;
+        var observer = null;
+        var pollTimer = null;
+
+        function finish(ready, reason) {
+            if (finished) {
+                return;
+            }
+            finished = true;
+            clearTimeout(deadlineTimer);
+            clearInterval(pollTimer);
+            if (observer) {
+                observer.disconnect();
+            }
+            resolve({ ready: ready, reason: reason, elapsed_ms: Math.round(performance.now() - start) });
+        }
+
+        // 하드 데드라인
+        var deadlineTimer = setTimeout(function () {
+            finish(false, 'deadline');
+        }, timeoutMs);
+
+        // 리소스 요청이 끝날 때마다 마지막 네트워크 활동 시각 갱신
+        try {
+            observer = new PerformanceObserver(function () {
+                lastActivity = performance.now();
+            });
+            observer.observe({ type: 'resource', buffered: false });
+        } catch (e) {
+            observer = null;
+        }
+
+        function documentLoaded() {
+            if (document.readyState === 'complete') {
+                return Promise.resolve();
+            }
+            return new Promise(function (done) {
+                window.addEventListener('load', function () { done(); }, { once: true });
+            });
+        }
+
+        function fontsReady() {
+            if (document.fonts && document.fonts.ready) {
+                return document.fonts.ready.then(function () {}, function () {});
+            }
+            return Promise.resolve();
+        }
+
+        function imageReady(img) {
+            var loaded = img.complete ? Promise.resolve() : new Promise(function (done) {
+                img.addEventListener('load', function () { done(); }, { once: true });
+                img.addEventListener('error', function () { done(); }, { once: true });
+            });
+            return loaded.then(function () {
+                if (img.decode && img.naturalWidth > 0) {
+                    return img.decode().catch(function () {});
+                }
+            });
+        }
+
+        function imagesReady() {
+            return Promise.all(Array.prototype.map.call(document.images, imageReady));
+        }
+
+        function networkQuiet() {
+            return new Promise(function (done) {
+                pollTimer = setInterval(function () {
+                    var fontsLoading = document.fonts && document.fonts.status === 'loading';
+                    if (!fontsLoading && performance.now() - lastActivity >= quietMs) {
+                        done();
+                    }
+                }, Math.max(10, Math.min(50, quietMs)));
+            });
+        }
+
+        documentLoaded()
+            .then(fontsReady)
+            .then(imagesReady)
+            .then(function () {
+                lastActivity = Math.max(lastActivity, performance.now());
+                return networkQuiet();
+            })
+            .then(function () {
+                finish(true, 'ready');
+            }, function (e) {
+                finish(false, String(e));
+            });
+    });
+})
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page Readiness
+고정 대기 시간 대신 페이지 준비 완료 이벤트(폰트, 이미지 디코딩, 네트워크 조용한 구간)를 기다리는 공용 모듈
+감지 스크립트 본문은 page_readiness.js 하나를 Selenium/Puppeteer 백엔드가 함께 사용한다.
+애니메이션이 끝나기를 기다리지 않도록 애니메이션/트랜지션을 끄는 스타일시트와 가상 시간 예산도 여기서 정의한다.
+"""
+
+import re
+from pathlib import Path
+
+READINESS_SCRIPT_PATH = Path(__file__).resolve().parent / 'page_readiness.js'
+
+# 기본 설정
+DEFAULT_QUIET_MS = 500  # 네트워크 요청이 없어야 하는 구간 (ms)
+DEFAULT_TIMEOUT_MS = 10000  # 하드 데드라인 (ms)
+DEFAULT_VIRTUAL_TIME_MS = 5000  # 애니메이션 고정 시 타이머/애니메이션을 빨리 감을 가상 시간 (ms, 실제 대기 시간 아님)
+
+# 진입 애니메이션과 트랜지션을 끝 상태로 바로 보내는 스타일시트 (무한 반복 애니메이션은 한 번으로 제한)
+FREEZE_ANIMATIONS_STYLE = """<style id="freeze-animations">
+  *, *::before, *::after {
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    animation-fill-mode: both !important;
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    scroll-behavior: auto !important;
+    caret-color: transparent !important;
+  }
+</style>"""
+
+HEAD_END_PATTERN = re.compile(r"</head\s*>", re.IGNORECASE)
+BODY_START_PATTERN = re.compile(r"<body\b", re.IGNORECASE)
+
+
+def load_page_script(script_path):
+    """페이지 주입용 JS 파일에서 함수 식 부분만 문자열로 반환 (머리 주석 제외)"""
+    source = Path(script_path).read_text(encoding='utf-8')
+    return source[source.index('(function'):].strip().rstrip(';')
+
+
+READINESS_SCRIPT = load_page_script(READINESS_SCRIPT_PATH)
+
+
+def freeze_animations(html_content):
+    """HTML에 애니메이션/트랜지션을 끄는 스타일시트 삽입
+
+    페이지 스타일보다 뒤에 오도록 </head> 바로 앞에 넣는다 (head가 없으면 <body> 앞, 둘 다 없으면 맨 앞).
+    """
+    for pattern in (HEAD_END_PATTERN, BODY_START_PATTERN):
+        match = pattern.search(html_content)
+        if match:
+            return f"{html_content[:match.start()]}{FREEZE_ANIMATIONS_STYLE}\n{html_content[match.start():]}"
+    return f"{FREEZE_ANIMATIONS_STYLE}\n{html_content}"
+
+
+def wait_for_page_ready(driver, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS):
+    """Selenium WebDriver에서 현재 페이지가 준비될 때까지 대기
+
+    반환값: {'ready': bool, 'reason': str, 'elapsed_ms': int}
+    """
+    # 스크립트 자체 데드라인보다 조금 길게 설정
+    driver.set_script_timeout(timeout_ms / 1000 + 5)
+    script = (
+        "var done = arguments[arguments.length - 1];\n"
+        f"({READINESS_SCRIPT})(arguments[0], arguments[1]).then(done, function (e) {{\n"
+        "    done({ready: false, reason: String(e), elapsed_ms: 0});\n"
+        "});"
+    )
+    result = driver.execute_async_script(script, quiet_ms, timeout_ms)
+    if not result.get('ready'):
+        print(f"  페이지 준비 대기 중단 ({result.get('reason')}, {result.get('elapsed_ms')}ms)")
+    else:
+        print(f"  페이지 준비 완료 ({result.get('elapsed_ms')}ms)")
+    return result
+
+
+def html2image_flags(timeout_ms=DEFAULT_TIMEOUT_MS, device_scale=1):
+    """html2image(Chrome CLI 스크린샷)용 플래그
+
+    html2image는 페이지 안에서 스크립트를 기다릴 수 없으므로, Chrome의 가상 시간 예산을 사용하여
+    네트워크 요청이 끝나고 타이머가 진행될 때까지(최대 timeout_ms) 캡처를 미룬다.
+    device_scale이 1이 아니면 스크린샷을 CSS 크기 x device_scale 픽셀로 렌더링한다.
+    """
+    flags = [
+        '--default-background-color=000000',  # html2image 기본 플래그 유지
+        '--hide-scrollbars',
+        f'--virtual-time-budget={int(timeout_ms)}',
+    ]
+    if device_scale != 1:
+        flags.append(f'--force-device-scale-factor={device_scale}')
+    return flags
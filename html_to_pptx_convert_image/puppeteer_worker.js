@@ -0,0 +1,341 @@
+#!/usr/bin/env node
+/**
+ * Puppeteer Render Worker
+ * 실행 시 브라우저를 한 번만 띄우고, stdin으로 받은 렌더 작업(JSON 한 줄)을 처리하여
+ * 결과를 stdout에 JSON 한 줄로 반환하는 상주 워커
+ *
+ * 요청: {"id": 1, "path": "C:/.../temp_01.html",
+ *        "viewport": {"width": 1920, "height": 1080, "deviceScaleFactor": 1},
+ *        "output": {"path": "C:/.../slide_01.png"},
+ *        "readiness": {"quietMs": 500, "timeoutMs": 10000, "virtualTimeMs": 5000},
+ *        "measure": {"rootSelector": ".slide-container", "minHeight": 1080, "maxHeight": 8640},
+ *        "fitContent": true}
+ *        (output 생략 시 PNG를 base64로 반환)
+ *        measure가 있으면 준비 완료 후 실제 DOM 크기를 측정하여 metrics로 반환하고 뷰포트 영역만 캡처한다.
+ *        fitContent가 true이면 측정한 높이로 뷰포트를 맞춘 뒤, false이면 뷰포트 크기 그대로 캡처한다.
+ *        readiness.virtualTimeMs가 있으면 로드 후 그만큼의 가상 시간을 빨리 감아 타이머/애니메이션을 끝낸 뒤 대기한다.
+ *        "requestPolicy": [{"action": "deny", "pattern": "^https://(.*)$", "types": ["image"]}, ...]을 주면
+ *        페이지 요청을 규칙대로 허용/차단/바꿔쓰고 (request_policy.py), 차단/바꿔쓴 요청을 응답의 requests로 반환한다.
+ *        "clip": {"width": 1920}을 주면 measure.rootSelector 요소 영역만 width 너비로 확대하여 캡처한다
+ *        (요소가 없으면 뷰포트 캡처).
+ * 응답: {"id": 1, "ok": true, "path": "...", "png_base64": "...", "metrics": {...}, "requests": [...],
+ *        "timings": {"load_ms": 0, "wait_ms": 0, "measure_ms": 0, "screenshot_ms": 0, "total_ms": 0}}
+ *
+ * 옵션: --browser-url=http://127.0.0.1:9222  (이미 실행 중인 브라우저에 접속)
+ *       --tabs=4  (동시에 사용할 탭 수, 작업은 도착 순서와 관계없이 병렬 처리되며 응답은 id로 구분)
+ *
+ * stdout은 프로토콜 전용이므로 로그는 모두 stderr로 출력한다.
+ */
+
+const puppeteer = require('puppeteer');
+const fs = require('fs');
+const readline = require('readline');
+const path = require('path');
+const { pathToFileURL } = require('url');
+
+// 페이지 주입용 공용 스크립트에서 함수 식 부분만 읽기 (page_readiness.load_page_script와 동일)
+function loadPageScript(fileName) {
+    const source = fs.readFileSync(path.join(__dirname, fileName), 'utf8');
+    return source.slice(source.indexOf('(function')).trim().replace(/;$/, '');
+}
+
+const READINESS_SCRIPT = loadPageScript('page_readiness.js');
+const MEASURE_SCRIPT = loadPageScript('page_measure.js');
+
+// 기본 준비 대기 설정 (page_readiness.py와 동일)
+const DEFAULT_QUIET_MS = 500;
+const DEFAULT_TIMEOUT_MS = 10000;
+
+function parseArgs(argv) {
+    const options = { browserUrl: null, tabs: 1 };
+    for (const arg of argv) {
+        if (arg.startsWith('--browser-url=')) {
+            options.browserUrl = arg.slice('--browser-url='.length);
+        } else if (arg.startsWith('--tabs=')) {
+            options.tabs = Math.max(1, parseInt(arg.slice('--tabs='.length), 10) || 1);
+        }
+    }
+    return options;
+}
+
+/**
+ * 한 브라우저 안에서 최대 size개의 탭을 재사용하는 탭 풀
+ */
+class TabPool {
+    constructor(browser, size) {
+        this.browser = browser;
+        this.size = size;
+        this.idle = [];
+        this.waiters = [];
+        this.created = 0;
+    }
+
+    async acquire() {
+        if (this.idle.length > 0) {
+            return this.idle.pop();
+        }
+        if (this.created < this.size) {
+            this.created += 1;
+            return this.browser.newPage();
+        }
+        return new Promise(resolve => this.waiters.push(resolve));
+    }
+
+    release(page) {
+        const waiter = this.waiters.shift();
+        if (waiter) {
+            waiter(page);
+        } else {
+            this.idle.push(page);
+        }
+    }
+
+    async closeAll() {
+        await Promise.all(this.idle.map(page => page.close().catch(() => {})));
+        this.idle = [];
+    }
+}
+
+function send(message) {
+    process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+function elapsed(start) {
+    return Math.round(Number(process.hrtime.bigint() - start) / 1e6);
+}
+
+async function openBrowser(options) {
+    if (options.browserUrl) {
+        const browser = await puppeteer.connect({ browserURL: options.browserUrl });
+        return { browser, owned: false };
+    }
+    const browser = await puppeteer.launch({
+        headless: true,
+        args: ['--no-sandbox', '--disable-setuid-sandbox']
+    });
+    return { browser, owned: true };
+}
+
+/**
+ * 요청 가로채기 규칙 적용 결과 (request_policy.py의 RequestPolicy.decide와 같은 규칙: 처음 맞는 규칙, 기본 허용)
+ */
+function decideRequest(rules, url, resourceType) {
+    for (const rule of rules) {
+        if (rule.types && !rule.types.includes(resourceType)) {
+            continue;
+        }
+        let groups = [];
+        if (rule.regex) {
+            const match = rule.regex.exec(url);
+            if (!match) {
+                continue;
+            }
+            groups = match.slice(1);
+        }
+        if (rule.action === 'rewrite') {
+            const target = rule.to.replace(/\{(\d+)\}/g, (_, n) => groups[Number(n) - 1] || '');
+            return { action: 'rewrite', url: target };
+        }
+        return { action: rule.action, url };
+    }
+    return { action: 'allow', url };
+}
+
+function handleRequest(page, request) {
+    const policy = page.requestPolicy;
+    if (!policy) {
+        request.continue();
+        return;
+    }
+    const url = request.url();
+    const type = request.resourceType();
+    const decision = decideRequest(policy.rules, url, type);
+    if (decision.action === 'deny') {
+        policy.log.push({ url, type, action: 'deny' });
+        request.abort('blockedbyclient');
+    } else if (decision.action === 'rewrite') {
+        policy.log.push({ url, type, action: 'rewrite', to: decision.url });
+        request.continue({ url: decision.url });
+    } else {
+        request.continue();
+    }
+}
+
+async function applyRequestPolicy(page, rules) {
+    // 탭마다 가로채기는 한 번만 켜고, 규칙과 기록은 작업마다 새로 설정
+    page.requestPolicy = rules ? {
+        rules: rules.map(rule => ({ ...rule, regex: rule.pattern ? new RegExp(rule.pattern) : null })),
+        log: []
+    } : null;
+    if (rules && !page.interceptingRequests) {
+        await page.setRequestInterception(true);
+        page.on('request', request => handleRequest(page, request));
+        page.interceptingRequests = true;
+    }
+}
+
+async function gotoWithVirtualTime(page, url, virtualTimeMs, timeoutMs) {
+    // 네트워크 요청이 진행 중일 때만 멈추고 타이머/애니메이션 시간은 기다리지 않고 빨리 감음
+    const client = await page.createCDPSession();
+    try {
+        let timer = null;
+        const expired = new Promise((resolve) => {
+            client.once('Emulation.virtualTimeBudgetExpired', () => resolve(true));
+            timer = setTimeout(() => resolve(false), timeoutMs);
+        });
+        await client.send('Emulation.setVirtualTimePolicy', {
+            policy: 'pauseIfNetworkFetchesPending',
+            budget: virtualTimeMs
+        });
+        await page.goto(url, { waitUntil: 'load', timeout: timeoutMs });
+        if (!await expired) {
+            console.error(`가상 시간 예산 대기 중단 (${timeoutMs}ms)`);
+        }
+        clearTimeout(timer);
+        // 준비 감지 스크립트의 타이머가 동작하도록 실제 시간으로 복귀
+        await client.send('Emulation.setVirtualTimePolicy', { policy: 'advance' });
+    } finally {
+        await client.detach().catch(() => null);
+    }
+}
+
+async function render(page, job) {
+    const viewport = job.viewport || { width: 1920, height: 1080 };
+    const timings = {};
+    const totalStart = process.hrtime.bigint();
+
+    const deviceScaleFactor = viewport.deviceScaleFactor || 1;
+    await page.setViewport({ width: viewport.width, height: viewport.height, deviceScaleFactor });
+    await applyRequestPolicy(page, job.requestPolicy || null);
+
+    const readiness = job.readiness || {};
+    const quietMs = readiness.quietMs || DEFAULT_QUIET_MS;
+    const timeoutMs = readiness.timeoutMs || DEFAULT_TIMEOUT_MS;
+
+    // HTML 파일 로드 (load 이벤트까지만, 나머지는 준비 감지로 대기)
+    let start = process.hrtime.bigint();
+    const url = pathToFileURL(path.resolve(job.path)).href;
+    if (readiness.virtualTimeMs) {
+        await gotoWithVirtualTime(page, url, readiness.virtualTimeMs, timeoutMs);
+    } else {
+        await page.goto(url, { waitUntil: 'load', timeout: timeoutMs });
+    }
+    timings.load_ms = elapsed(start);
+
+    // 폰트, 이미지 디코딩, 네트워크 조용한 구간까지 대기 (하드 데드라인 적용)
+    start = process.hrtime.bigint();
+    const remainingMs = Math.max(1, timeoutMs - timings.load_ms);  // 0은 puppeteer에서 무제한
+    const [pageState] = await Promise.all([
+        page.evaluate(`${READINESS_SCRIPT}(${quietMs}, ${remainingMs})`),
+        page.waitForNetworkIdle({ idleTime: quietMs, timeout: remainingMs }).catch(() => null)
+    ]);
+    timings.wait_ms = elapsed(start);
+    timings.ready = Boolean(pageState && pageState.ready);
+
+    // 실제 DOM 크기 측정 (fitContent이면 뷰포트를 콘텐츠 높이에 맞춰 fullPage 대신 정확한 크기로 한 번만 캡처)
+    let metrics = null;
+    if (job.measure) {
+        start = process.hrtime.bigint();
+        const measure = job.measure;
+        metrics = await page.evaluate(
+            `${MEASURE_SCRIPT}(${JSON.stringify(measure.rootSelector || null)}, ${measure.minHeight || viewport.height}, ${measure.maxHeight || viewport.height})`
+        );
+        if (job.fitContent && metrics.fit_height !== viewport.height) {
+            await page.setViewport({ width: viewport.width, height: metrics.fit_height, deviceScaleFactor });
+        }
+        timings.measure_ms = elapsed(start);
+    }
+
+    // 스크린샷 촬영
+    start = process.hrtime.bigint();
+    const output = job.output || {};
+    const screenshotOptions = { fullPage: !metrics && job.fullPage !== false, type: 'png' };
+    const root = job.clip && metrics ? metrics.root : null;
+    if (root && root.width > 0 && root.height > 0) {
+        // 루트 요소 영역만 출력 너비로 확대하여 캡처 (뷰포트 밖으로 길어진 요소도 포함)
+        screenshotOptions.clip = {
+            x: root.x, y: root.y, width: root.width, height: root.height,
+            scale: job.clip.width / root.width
+        };
+        screenshotOptions.captureBeyondViewport = true;
+    }
+    if (output.path) {
+        screenshotOptions.path = output.path;
+    } else {
+        screenshotOptions.encoding = 'base64';
+    }
+    const data = await page.screenshot(screenshotOptions);
+    timings.screenshot_ms = elapsed(start);
+    timings.total_ms = elapsed(totalStart);
+
+    const result = { id: job.id, ok: true, timings };
+    if (metrics) {
+        result.metrics = metrics;
+    }
+    if (page.requestPolicy && page.requestPolicy.log.length > 0) {
+        result.requests = page.requestPolicy.log;
+    }
+    if (output.path) {
+        result.path = output.path;
+    } else {
+        result.png_base64 = data;
+    }
+    return result;
+}
+
+async function handleLine(tabs, line) {
+    let job;
+    try {
+        job = JSON.parse(line);
+    } catch (e) {
+        send({ id: null, ok: false, error: `잘못된 JSON: ${e.message}` });
+        return;
+    }
+    const page = await tabs.acquire();
+    try {
+        send(await render(page, job));
+    } catch (e) {
+        // 한 슬라이드의 실패는 다른 작업에 영향을 주지 않음
+        send({ id: job.id, ok: false, error: e.message });
+    } finally {
+        tabs.release(page);
+    }
+}
+
+async function main() {
+    const options = parseArgs(process.argv.slice(2));
+    const { browser, owned } = await openBrowser(options);
+    const tabs = new TabPool(browser, options.tabs);
+
+    send({ type: 'ready', pid: process.pid, tabs: options.tabs });
+
+    const rl = readline.createInterface({ input: process.stdin, terminal: false });
+    const inflight = new Set();
+
+    rl.on('line', (line) => {
+        if (!line.trim()) {
+            return;
+        }
+        const task = handleLine(tabs, line);
+        inflight.add(task);
+        task.finally(() => inflight.delete(task));
+    });
+
+    rl.on('close', async () => {
+        // stdin이 닫히면 남은 작업을 마치고 종료
+        await Promise.all(inflight);
+        await tabs.closeAll();
+        if (owned) {
+            await browser.close();
+        } else {
+            browser.disconnect();
+        }
+        process.exit(0);
+    });
+}
+
+main().catch((e) => {
+    console.error(`Puppeteer 워커 오류: ${e.stack || e.message}`);
+    send({ type: 'fatal', error: e.message });
+    process.exit(1);
+});
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Puppeteer Worker Client
+puppeteer_worker.js 상주 워커를 한 번 실행하고 JSON 한 줄 프로토콜로 렌더 작업을 요청하는 클라이언트
+"""
+
+import asyncio
+import base64
+import json
+import queue
+import subprocess
+import threading
+from pathlib import Path
+
+from page_measure import DEFAULT_ROOT_SELECTOR, MAX_HEIGHT, MIN_HEIGHT
+from page_readiness import DEFAULT_QUIET_MS, DEFAULT_TIMEOUT_MS
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / 'puppeteer_worker.js'
+
+# 기본 설정
+DEFAULT_STARTUP_TIMEOUT = 60  # 브라우저 실행 대기 (초)
+DEFAULT_RENDER_TIMEOUT = 120  # 슬라이드 하나 렌더 대기 (초)
+
+# base64 PNG 응답 한 줄이 수십 MB가 될 수 있으므로 asyncio 스트림 버퍼 상한을 크게 설정
+STREAM_LIMIT = 256 * 1024 * 1024
+
+
+class PuppeteerWorkerError(RuntimeError):
+    """워커 실행 또는 렌더 작업 실패"""
+
+
+def worker_command(node_executable, worker_script, browser_url=None, tabs=1):
+    """워커 실행 명령 생성"""
+    command = [node_executable, str(worker_script)]
+    if browser_url:
+        command.append(f"--browser-url={browser_url}")
+    if tabs > 1:
+        command.append(f"--tabs={int(tabs)}")
+    return command
+
+
+def build_render_job(job_id, html_path, viewport, output_path=None, full_page=True,
+                     quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS, fit_content=True, scale=1,
+                     clip_selector=None, virtual_time_ms=None, request_rules=None):
+    """워커에 보낼 렌더 작업(JSON 한 줄) 생성
+
+    워커는 항상 실제 DOM 크기를 측정하여 metrics로 반환한다.
+    fit_content=True이면 viewport 높이는 초기값으로만 쓰고 측정한 높이로 뷰포트를 맞추며,
+    False이면 viewport x scale 픽셀 크기 그대로 캡처한다 (넘친 콘텐츠는 metrics로 확인).
+    clip_selector를 주면 그 요소의 영역만 viewport 너비로 확대하여 캡처한다 (요소가 없으면 뷰포트 캡처).
+    virtual_time_ms를 주면 로드 후 그만큼의 가상 시간을 빨리 감은 뒤 준비 감지를 시작한다.
+    request_rules(RequestPolicy.worker_rules())를 주면 페이지 요청을 규칙대로 허용/차단/바꿔쓰고 기록을 반환받는다.
+    """
+    job = {
+        'id': job_id,
+        'path': Path(html_path).resolve().as_posix(),
+        'viewport': {'width': int(viewport[0]), 'height': int(viewport[1]), 'deviceScaleFactor': scale},
+        'fullPage': full_page,
+        'readiness': {'quietMs': int(quiet_ms), 'timeoutMs': int(timeout_ms)},
+        'measure': {
+            'rootSelector': clip_selector or DEFAULT_ROOT_SELECTOR,
+            'minHeight': MIN_HEIGHT,
+            'maxHeight': MAX_HEIGHT,
+        },
+        'fitContent': fit_content and not clip_selector,
+    }
+    if clip_selector:
+        job['clip'] = {'width': int(viewport[0])}
+    if virtual_time_ms:
+        job['readiness']['virtualTimeMs'] = int(virtual_time_ms)
+    if request_rules is not None:
+        job['requestPolicy'] = request_rules
+    if output_path is not None:
+        job['output'] = {'path': Path(output_path).resolve().as_posix()}
+    return json.dumps(job, ensure_ascii=False) + '\n'
+
+
+def parse_render_result(message):
+    """워커 응답을 {'path', 'png', 'timings', 'metrics', 'requests'} 형태로 변환 (실패 시 예외)"""
+    if not message.get('ok'):
+        raise PuppeteerWorkerError(f"렌더 실패: {message.get('error')}")
+
+    png = base64.b64decode(message['png_base64']) if 'png_base64' in message else None
+    return {
+        'path': Path(message['path']) if message.get('path') else None,
+        'png': png,
+        'timings': message.get('timings', {}),
+        'metrics': message.get('metrics'),
+        'requests': message.get('requests', []),
+    }
+
+
+class PuppeteerWorker:
+    """Node 렌더 워커 프로세스 관리
+
+    사용 예:
+        with PuppeteerWorker() as worker:
+            result = worker.render(html_path, (1920, 1080), output_path=png_path)
+            print(result['timings'])
+    """
+
+    def __init__(self, browser_url=None, node_executable='node', worker_script=WORKER_SCRIPT,
+                 startup_timeout=DEFAULT_STARTUP_TIMEOUT, render_timeout=DEFAULT_RENDER_TIMEOUT):
+        self.browser_url = browser_url
+        self.node_executable = node_executable
+        self.worker_script = Path(worker_script)
+        self.startup_timeout = startup_timeout
+        self.render_timeout = render_timeout
+
+        self.process = None
+        self._messages = queue.Queue()
+        self._reader = None
+        self._next_id = 1
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """워커 실행 후 브라우저 준비 완료 신호 대기"""
+        if self.process is not None:
+            return
+
+        command = worker_command(self.node_executable, self.worker_script, self.browser_url)
+
+        # node_modules는 워커 스크립트 옆(package.json 위치)에서 찾는다
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=str(self.worker_script.parent),
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+        )
+        self._reader = threading.Thread(target=self._read_stdout, daemon=True)
+        self._reader.start()
+
+        message = self._wait_message(self.startup_timeout)
+        if message.get('type') != 'ready':
+            self.close()
+            raise PuppeteerWorkerError(f"Puppeteer 워커 시작 실패: {message.get('error', message)}")
+        print(f"Puppeteer 워커 시작 (pid {message.get('pid')})")
+
+    def _read_stdout(self):
+        """워커 stdout을 한 줄씩 읽어 메시지 큐에 전달"""
+        for line in self.process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                self._messages.put(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"  Puppeteer 워커 출력 무시: {line}")
+        # 프로세스 종료 신호
+        self._messages.put(None)
+
+    def _wait_message(self, timeout):
+        try:
+            message = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            raise PuppeteerWorkerError(f"Puppeteer 워커 응답 시간 초과 ({timeout}초)")
+        if message is None:
+            raise PuppeteerWorkerError("Puppeteer 워커가 종료되었습니다.")
+        return message
+
+    def render(self, html_path, viewport, output_path=None, full_page=True,
+               quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS, fit_content=True, scale=1,
+               clip_selector=None, virtual_time_ms=None, request_rules=None):
+        """HTML 파일 렌더링
+
+        output_path가 있으면 워커가 PNG를 파일로 저장하고, 없으면 PNG bytes를 반환받는다.
+        반환값: {'path': Path 또는 None, 'png': bytes 또는 None, 'timings': dict, 'metrics': 측정값 또는 None,
+                'requests': 차단/바꿔쓴 요청 리스트}
+        """
+        if self.process is None:
+            raise PuppeteerWorkerError("Puppeteer 워커가 실행되지 않았습니다.")
+
+        job_id = self._next_id
+        self._next_id += 1
+
+        job = build_render_job(job_id, html_path, viewport, output_path, full_page, quiet_ms, timeout_ms,
+                               fit_content, scale, clip_selector, virtual_time_ms, request_rules)
+        self.process.stdin.write(job)
+        self.process.stdin.flush()
+
+        while True:
+            message = self._wait_message(self.render_timeout)
+            if message.get('id') == job_id:
+                break
+
+        return parse_render_result(message)
+
+    def close(self):
+        """stdin을 닫아 워커가 남은 작업을 마치고 종료하도록 함"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        print("Puppeteer 워커 종료")
+        self.process = None
+
+
+class AsyncPuppeteerWorker:
+    """asyncio용 워커 클라이언트 (한 브라우저의 여러 탭에서 동시에 렌더링)
+
+    사용 예:
+        async with AsyncPuppeteerWorker(tabs=4) as worker:
+            results = await asyncio.gather(*(worker.render(p, (1920, 1080)) for p in paths))
+    """
+
+    def __init__(self, browser_url=None, tabs=1, node_executable='node', worker_script=WORKER_SCRIPT,
+                 startup_timeout=DEFAULT_STARTUP_TIMEOUT, render_timeout=DEFAULT_RENDER_TIMEOUT):
+        self.browser_url = browser_url
+        self.tabs = tabs
+        self.node_executable = node_executable
+        self.worker_script = Path(worker_script)
+        self.startup_timeout = startup_timeout
+        self.render_timeout = render_timeout
+
+        self.process = None
+        self._reader = None
+        self._pending = {}
+        self._next_id = 1
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """워커 실행 후 브라우저 준비 완료 신호 대기"""
+        if self.process is not None:
+            return
+
+        command = worker_command(self.node_executable, self.worker_script, self.browser_url, self.tabs)
+        self.process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=str(self.worker_script.parent),
+            limit=STREAM_LIMIT,
+        )
+
+        try:
+            line = await asyncio.wait_for(self.process.stdout.readline(), self.startup_timeout)
+        except asyncio.TimeoutError:
+            await self.close()
+            raise PuppeteerWorkerError(f"Puppeteer 워커 응답 시간 초과 ({self.startup_timeout}초)")
+
+        message = json.loads(line) if line.strip() else {}
+        if message.get('type') != 'ready':
+            await self.close()
+            raise PuppeteerWorkerError(f"Puppeteer 워커 시작 실패: {message.get('error', message)}")
+        print(f"Puppeteer 워커 시작 (pid {message.get('pid')}, 탭 {message.get('tabs', 1)}개)")
+
+        self._reader = asyncio.create_task(self._read_stdout())
+
+    async def _read_stdout(self):
+        """응답을 읽어 작업 id별 Future에 전달"""
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"  Puppeteer 워커 출력 무시: {line[:200]!r}")
+                continue
+            future = self._pending.pop(message.get('id'), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+
+        # 워커 종료 시 대기 중인 작업 모두 실패 처리
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(PuppeteerWorkerError("Puppeteer 워커가 종료되었습니다."))
+        self._pending.clear()
+
+    async def render(self, html_path, viewport, output_path=None, full_page=True,
+                     quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS, fit_content=True, scale=1,
+                     clip_selector=None, virtual_time_ms=None, request_rules=None):
+        """HTML 파일 렌더링 (PuppeteerWorker.render와 동일한 반환값)"""
+        if self.process is None:
+            raise PuppeteerWorkerError("Puppeteer 워커가 실행되지 않았습니다.")
+
+        job_id = self._next_id
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = future
+
+        job = build_render_job(job_id, html_path, viewport, output_path, full_page, quiet_ms, timeout_ms,
+                               fit_content, scale, clip_selector, virtual_time_ms, request_rules)
+        self.process.stdin.write(job.encode('utf-8'))
+        await self.process.stdin.drain()
+
+        try:
+            message = await asyncio.wait_for(future, self.render_timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(job_id, None)
+            raise PuppeteerWorkerError(f"렌더 시간 초과 ({self.render_timeout}초): {html_path}")
+
+        return parse_render_result(message)
+
+    async def close(self):
+        """stdin을 닫아 워커가 남은 작업을 마치고 종료하도록 함"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+        try:
+            await asyncio.wait_for(self.process.wait(), 30)
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+        if self._reader is not None:
+            await self._reader
+            self._reader = None
+        print("Puppeteer 워커 종료")
+        self.process = None
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render Backends
+HTML 파일 하나를 PNG bytes로 캡처하는 렌더 백엔드 모음 (이름으로 선택)
+변환기(slide_converter.SlideConverter)는 높이 조절, 후처리, PPTX 조립을 담당하고, 백엔드는 캡처만 담당한다.
+
+  html2image  Chrome CLI 스크린샷 (페이지 측정 불가, 가상 시간 예산으로 로딩 대기)
+  selenium    Selenium WebDriver + 공유 브라우저 풀
+  puppeteer   상주 Node 워커 (puppeteer_worker.js)
+  cdp         WebDriver를 거치지 않고 DevTools 프로토콜(WebSocket)로 직접 제어
+"""
+
+import base64
+import json
+import shutil
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from browser_pool import BrowserPool
+from page_measure import (CLIP_SCRIPT, DEFAULT_ROOT_SELECTOR, MAX_HEIGHT, MEASURE_SCRIPT, MIN_HEIGHT, measure_overflow,
+                          root_clip)
+from page_readiness import DEFAULT_QUIET_MS, DEFAULT_TIMEOUT_MS, READINESS_SCRIPT, html2image_flags
+from puppeteer_worker import PuppeteerWorker
+
+try:
+    from html2image import Html2Image
+    HTML2IMAGE_AVAILABLE = True
+except ImportError:
+    HTML2IMAGE_AVAILABLE = False
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+# 기본 설정
+CDP_TIMEOUT = 60  # DevTools 명령 응답 대기 (초)
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000)
+
+
+class RenderBackend:
+    """렌더 백엔드 공통 인터페이스
+
+    사용 예:
+        with create_backend('selenium') as backend:
+            result = backend.render(html_path, (1920, 1080))
+            png_data = result['png']
+
+    render()는 {'png': PNG bytes, 'metrics': page_measure 측정값 또는 None, 'timings': dict}를 반환한다.
+    virtual_time_ms가 있으면 지원하는 백엔드(html2image, puppeteer, cdp)는 페이지 로드 후 그만큼의 가상 시간을
+    빨리 감아 타이머와 JS 애니메이션이 끝난 상태에서 준비 감지와 캡처를 진행한다.
+    request_policy가 있으면 브라우저 백엔드(selenium, puppeteer, cdp)는 페이지 요청을 정책대로 허용/차단/바꿔쓰고,
+    차단/바꿔쓴 요청은 take_request_log()로 가져간다.
+    fit_content=True이면 size의 높이는 초기값으로만 쓰고 실제 DOM 높이로 뷰포트를 맞춰 캡처하며,
+    False이면 size x scale 픽셀 크기 그대로 캡처한다 (넘친 높이는 metrics로 확인).
+    clip_selector를 주면 뷰포트 대신 그 요소(.slide-container 등)의 영역만 size 너비로 확대하여 캡처한다
+    (요소가 없으면 고정 뷰포트 캡처, 넘친 높이는 page_measure.root_overflow로 확인).
+    """
+
+    name = None
+    # 실제 DOM 높이를 측정하는지 여부 (False이면 변환기가 텍스트 길이로 높이를 추정)
+    measures_in_browser = True
+    # 렌더 캐시 키에 쓰는 백엔드 이름 (render_cache.backend_version)
+    cache_name = None
+    # 통합 문서 한 번 로드 + 슬라이드별 clip 캡처(capture_clips) 지원 여부
+    supports_clips = False
+    # 로드 후 빨리 감을 가상 시간 (ms, None이면 사용 안 함, 변환기가 설정)
+    virtual_time_ms = None
+    # 요청 가로채기 정책 (request_policy.RequestPolicy, None이면 사용 안 함, 변환기가 설정)
+    request_policy = None
+    # 실행하는 동안 계속 빌려 두는 풀 브라우저 (browser_pool.PooledBrowser, puppeteer/cdp가 start에서 설정)
+    _leased_browser = None
+    # 열려 있는 with 블록 수 (바깥 블록이 끝날 때만 종료하므로 watch 모드가 재빌드 사이에 브라우저를 유지)
+    _holds = 0
+
+    def __enter__(self):
+        self.start()
+        self._holds += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._holds -= 1
+        if self._holds == 0:
+            self.close()
+
+    def start(self):
+        """브라우저/워커 실행 (이미 실행 중이면 무시)"""
+
+    def close(self):
+        """브라우저/워커 종료"""
+
+    @property
+    def browser_pool(self):
+        """병렬 탭/프로세스 렌더링이 함께 쓸 수 있는 브라우저 풀 (없으면 None)"""
+        return None
+
+    def render(self, html_path, size, fit_content=True, scale=1, clip_selector=None):
+        raise NotImplementedError
+
+    def count_leased_page(self):
+        """빌려 둔 풀 브라우저에 페이지를 하나 로드했음을 기록 (WebDriver를 거치지 않는 로드도 재시작 기준에 반영)"""
+        if self._leased_browser is not None:
+            self._leased_browser.pages_served += 1
+
+    def recycle_worn_browser(self):
+        """빌려 둔 브라우저가 풀의 재시작 페이지 수에 닿았으면 풀에 반환하고 다시 시작
+
+        반환된 브라우저는 풀이 재시작하고, start가 새 브라우저를 빌린다. 다음 페이지를 로드하기 전에 호출한다.
+        """
+        browser = self._leased_browser
+        if browser is not None and self.browser_pool.needs_restart(browser):
+            print(f"  {self.name} 백엔드: 브라우저 #{browser.browser_id} {browser.pages_served}페이지 처리, 다시 시작")
+            self.close()
+            self.start()
+
+    def take_request_log(self):
+        """마지막으로 가져간 뒤 정책으로 차단/바꿔쓴 요청 기록 [{'url', 'type', 'action', 'to'}, ...]"""
+        request_log, self._request_log = getattr(self, '_request_log', []), []
+        return request_log
+
+    def capture_clips(self, html_path, size, box_selector, scale=1):
+        """통합 문서를 한 번 로드하고 box_selector 요소마다 clip 영역 캡처
+
+        반환값: (상자 인덱스, PNG bytes, 넘친 높이 px, 단계별 시간 dict)를 문서 순서대로 내보내는 generator
+        """
+        raise NotImplementedError(f"{self.name} 백엔드는 clip 캡처를 지원하지 않습니다.")
+
+
+class Html2ImageBackend(RenderBackend):
+    """html2image(Chrome CLI 스크린샷) 백엔드
+
+    html2image는 파일로만 저장하므로 임시 디렉토리에 저장한 뒤 바로 읽고 삭제한다.
+    """
+
+    name = 'html2image'
+    measures_in_browser = False
+    cache_name = 'html2image'
+
+    def __init__(self, timeout_ms=DEFAULT_TIMEOUT_MS):
+        self.timeout_ms = timeout_ms
+        self.output_dir = None
+        # deviceScaleFactor는 Chrome 실행 플래그이므로 scale마다 인스턴스 생성
+        self._instances = {}
+
+    def start(self):
+        if not HTML2IMAGE_AVAILABLE:
+            raise ImportError("html2image가 설치되지 않았습니다. pip install html2image로 설치하세요.")
+        if self.output_dir is None:
+            self.output_dir = Path(tempfile.mkdtemp())
+
+    def close(self):
+        if self.output_dir is not None and self.output_dir.exists():
+            shutil.rmtree(self.output_dir)
+        self.output_dir = None
+        self._instances.clear()
+
+    def _html2image(self, scale):
+        hti = self._instances.get(scale)
+        if hti is None:
+            # 가상 시간 예산으로 로딩 완료까지 캡처 지연
+            hti = Html2Image(custom_flags=html2image_flags(self.timeout_ms, device_scale=scale))
+            hti.output_path = str(self.output_dir)
+            self._instances[scale] = hti
+        return hti
+
+    def render(self, html_path, size, fit_content=True, scale=1, clip_selector=None):
+        # 페이지를 측정할 수 없으므로 clip_selector는 무시 (변환기는 html2image에서 요소 clip을 사용하지 않음)
+        html_path = Path(html_path)
+        start = time.perf_counter()
+        generated_image = Path(self._html2image(scale).screenshot(
+            html_file=str(html_path),
+            save_as=f"{html_path.stem}.png",
+            size=tuple(size)
+        )[0])
+        png_data = generated_image.read_bytes() if generated_image.exists() else None
+        generated_image.unlink(missing_ok=True)
+        # html2image는 로드/대기/캡처가 Chrome 실행 한 번이므로 전체를 스크린샷 시간으로 기록
+        return {'png': png_data, 'metrics': None, 'timings': {'screenshot_ms': _elapsed_ms(start)}}
+
+
+class SeleniumBackend(RenderBackend):
+    """Selenium WebDriver 백엔드 (공유 브라우저 풀이 없으면 브라우저 하나짜리 풀을 직접 실행)"""
+
+    name = 'selenium'
+    cache_name = 'chrome'
+    supports_clips = True
+
+    def __init__(self, browser_pool=None, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS):
+        self.shared_pool = browser_pool
+        self.quiet_ms = quiet_ms
+        self.timeout_ms = timeout_ms
+        self._own_pool = None
+
+    @property
+    def browser_pool(self):
+        return self.shared_pool or self._own_pool
+
+    def start(self):
+        if self.browser_pool is None:
+            self._own_pool = BrowserPool(pool_size=1)
+
+    def close(self):
+        if self._own_pool is not None:
+            self._own_pool.close()
+            self._own_pool = None
+
+    def render(self, html_path, size, fit_content=True, scale=1, clip_selector=None):
+        metrics = None
+        timings = {}
+        with self.browser_pool.acquire() as browser:
+            browser.set_request_policy(self.request_policy)
+            try:
+                if clip_selector:
+                    png_data, metrics = browser.capture_root(html_path, size, clip_selector, self.quiet_ms,
+                                                             self.timeout_ms, scale=scale, timings=timings)
+                    return {'png': png_data, 'metrics': metrics, 'timings': timings}
+                png_data = browser.capture_png(html_path, size, self.quiet_ms, self.timeout_ms,
+                                               fit_content=fit_content, scale=scale, timings=timings)
+                if not fit_content:
+                    # 뷰포트는 그대로 두고 넘친 콘텐츠만 측정
+                    start = time.perf_counter()
+                    metrics, _ = measure_overflow(browser.driver, size[1])
+                    timings['measure_ms'] = _elapsed_ms(start)
+            finally:
+                self._request_log = self.take_request_log() + browser.take_request_log()
+        return {'png': png_data, 'metrics': metrics, 'timings': timings}
+
+    def capture_clips(self, html_path, size, box_selector, scale=1):
+        with self.browser_pool.acquire() as browser:
+            browser.set_request_policy(self.request_policy)
+            try:
+                yield from browser.capture_clips(html_path, size, box_selector, self.quiet_ms, self.timeout_ms,
+                                                 scale=scale)
+            finally:
+                self._request_log = self.take_request_log() + browser.take_request_log()
+
+
+class PuppeteerBackend(RenderBackend):
+    """상주 Puppeteer 워커 백엔드 (공유 브라우저 풀이 있으면 풀의 브라우저에 접속)"""
+
+    name = 'puppeteer'
+    cache_name = 'puppeteer'
+
+    def __init__(self, browser_pool=None):
+        self.shared_pool = browser_pool
+        self.worker = None
+        self._lease = None
+
+    @property
+    def browser_pool(self):
+        return self.shared_pool
+
+    def start(self):
+        if self.worker is not None:
+            return
+        browser_url = None
+        if self.shared_pool is not None:
+            # 워커가 사용하는 동안 풀의 브라우저 하나를 빌려 둠
+            self._lease = self.shared_pool.acquire()
+            self._leased_browser = self._lease.__enter__()
+            browser_url = self._leased_browser.debugger_url
+        try:
+            self.worker = PuppeteerWorker(browser_url=browser_url)
+            self.worker.start()
+        except Exception:
+            self.worker = None
+            self._release()
+            raise
+
+    def _release(self):
+        if self._lease is not None:
+            lease, self._lease = self._lease, None
+            self._leased_browser = None
+            lease.__exit__(None, None, None)
+
+    def close(self):
+        if self.worker is not None:
+            self.worker.close()
+            self.worker = None
+        self._release()
+
+    def render(self, html_path, size, fit_content=True, scale=1, clip_selector=None):
+        self.recycle_worn_browser()
+        request_rules = self.request_policy.worker_rules() if self.request_policy is not None else None
+        result = self.worker.render(html_path, size, fit_content=fit_content, scale=scale,
+                                    clip_selector=clip_selector, virtual_time_ms=self.virtual_time_ms,
+                                    request_rules=request_rules)
+        self.count_leased_page()
+        self._request_log = self.take_request_log() + result['requests']
+        return {'png': result['png'], 'metrics': result['metrics'], 'timings': result['timings']}
+
+
+class CDPBackend(RenderBackend):
+    """DevTools 프로토콜 직접 제어 백엔드
+
+    브라우저 풀의 Chrome에 새 탭을 열고 WebSocket으로 뷰포트 설정, 로드, 준비 대기, 측정, 캡처를 직접 보낸다.
+    WebDriver 명령 왕복과 JSON 변환을 거치지 않으므로 슬라이드당 오버헤드가 가장 작다.
+    websocket-client 패키지가 필요하다 (pip install websocket-client).
+    """
+
+    name = 'cdp'
+    cache_name = 'cdp'
+    supports_clips = True
+
+    def __init__(self, browser_pool=None, quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS):
+        self.shared_pool = browser_pool
+        self.quiet_ms = quiet_ms
+        self.timeout_ms = timeout_ms
+        self._own_pool = None
+        self._lease = None
+        self._http_url = None
+        self._target_id = None
+        self._socket = None
+        self._next_id = 1
+        self._awaited_events = {}  # 기다리는 이벤트 이름 -> 도착 여부 (명령 응답 대기 중에 온 이벤트 기록)
+        self._request_log = []
+
+    @property
+    def browser_pool(self):
+        return self.shared_pool or self._own_pool
+
+    def start(self):
+        if self._socket is not None:
+            return
+        if not WEBSOCKET_AVAILABLE:
+            raise ImportError("websocket-client가 설치되지 않았습니다. pip install websocket-client로 설치하세요.")
+        if self.browser_pool is None:
+            self._own_pool = BrowserPool(pool_size=1)
+
+        try:
+            # 풀의 브라우저 하나를 빌려 WebDriver가 쓰지 않는 새 탭을 연다
+            self._lease = self.browser_pool.acquire()
+            self._leased_browser = self._lease.__enter__()
+            self._http_url = self._leased_browser.debugger_url
+            request = urllib.request.Request(f"{self._http_url}/json/new?about:blank", method='PUT')
+            with urllib.request.urlopen(request, timeout=CDP_TIMEOUT) as response:
+                target = json.loads(response.read().decode('utf-8'))
+            self._target_id = target['id']
+            self._socket = websocket.create_connection(target['webSocketDebuggerUrl'], timeout=CDP_TIMEOUT,
+                                                       suppress_origin=True)
+            self.send('Page.enable')
+            if self.request_policy is not None:
+                # 탭의 모든 요청을 가로채 정책 적용 (응답은 send/wait_event가 이벤트를 읽을 때 보냄)
+                self.send('Fetch.enable', {'patterns': [{'urlPattern': '*', 'requestStage': 'Request'}]})
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except Exception:
+                pass
+            self._socket = None
+        if self._target_id is not None:
+            try:
+                urllib.request.urlopen(f"{self._http_url}/json/close/{self._target_id}", timeout=CDP_TIMEOUT).close()
+            except Exception as e:
+                print(f"  CDP 탭 닫기 실패: {e}")
+            self._target_id = None
+        if self._lease is not None:
+            lease, self._lease = self._lease, None
+            self._leased_browser = None
+            lease.__exit__(None, None, None)
+        if self._own_pool is not None:
+            self._own_pool.close()
+            self._own_pool = None
+
+    def post(self, method, params=None):
+        """응답을 기다리지 않고 DevTools 명령 전송 (명령 id 반환)"""
+        message_id = self._next_id
+        self._next_id += 1
+        self._socket.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+        return message_id
+
+    def handle_event(self, message):
+        """명령 응답을 기다리는 동안 받은 이벤트 처리 (기다리는 이벤트 기록, 가로챈 요청에 정책 응답)"""
+        method = message.get('method')
+        if method in self._awaited_events:
+            self._awaited_events[method] = True
+        elif method == 'Fetch.requestPaused' and self.request_policy is not None:
+            self.post(*self.request_policy.fetch_command(message['params'], self._request_log))
+
+    def send(self, method, params=None):
+        """DevTools 명령을 보내고 같은 id의 응답 결과 반환 (그 사이의 이벤트는 handle_event로 처리)"""
+        message_id = self.post(method, params)
+        while True:
+            message = json.loads(self._socket.recv())
+            if message.get('id') != message_id:
+                self.handle_event(message)
+                continue
+            if 'error' in message:
+                raise RuntimeError(f"CDP {method} 실패: {message['error'].get('message')}")
+            return message.get('result', {})
+
+    def expect_event(self, method):
+        """다음 method 이벤트를 기다릴 준비 (이후 명령 응답을 기다리는 동안 도착해도 놓치지 않음)"""
+        self._awaited_events[method] = False
+
+    def wait_event(self, method, timeout):
+        """expect_event로 등록한 이벤트가 도착할 때까지 대기 (timeout초 안에 오지 않으면 False)"""
+        deadline = time.monotonic() + timeout
+        try:
+            while not self._awaited_events.get(method):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._socket.settimeout(remaining)
+                try:
+                    message = json.loads(self._socket.recv())
+                except websocket.WebSocketTimeoutException:
+                    return False
+                if message.get('method') == method:
+                    return True
+                self.handle_event(message)
+            return True
+        finally:
+            self._socket.settimeout(CDP_TIMEOUT)
+            self._awaited_events.pop(method, None)
+
+    def navigate(self, html_path):
+        """HTML 파일로 이동 (virtual_time_ms가 있으면 로드 후 그만큼의 가상 시간을 빨리 감을 때까지 대기)"""
+        self.count_leased_page()
+        if not self.virtual_time_ms:
+            self.send('Page.navigate', {'url': Path(html_path).resolve().as_uri()})
+            return
+
+        # 네트워크 요청이 진행 중일 때는 멈추고, 그 외에는 타이머/애니메이션 시간을 기다리지 않고 진행
+        self.expect_event('Emulation.virtualTimeBudgetExpired')
+        self.send('Emulation.setVirtualTimePolicy', {
+            'policy': 'pauseIfNetworkFetchesPending',
+            'budget': int(self.virtual_time_ms),
+        })
+        self.send('Page.navigate', {'url': Path(html_path).resolve().as_uri()})
+        if not self.wait_event('Emulation.virtualTimeBudgetExpired', self.timeout_ms / 1000):
+            print(f"  가상 시간 예산 대기 중단 ({self.timeout_ms}ms)")
+        # 준비 감지 스크립트의 타이머가 동작하도록 실제 시간으로 복귀
+        self.send('Emulation.setVirtualTimePolicy', {'policy': 'advance'})
+
+    def evaluate(self, expression):
+        """페이지에서 식을 실행하고 (Promise면 완료까지 기다려) 값 반환"""
+        result = self.send('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': True,
+            'returnByValue': True,
+        })
+        if 'exceptionDetails' in result:
+            raise RuntimeError(f"페이지 스크립트 오류: {result['exceptionDetails'].get('text')}")
+        return result['result'].get('value')
+
+    def set_viewport(self, width, height, scale=1):
+        self.send('Emulation.setDeviceMetricsOverride', {
+            'width': int(width),
+            'height': int(height),
+            'deviceScaleFactor': scale,
+            'mobile': False,
+        })
+
+    def render(self, html_path, size, fit_content=True, scale=1, clip_selector=None):
+        self.recycle_worn_browser()
+        timings = {}
+        width, height = size
+        start = time.perf_counter()
+        self.set_viewport(width, height, scale)
+        self.navigate(html_path)
+        timings['load_ms'] = _elapsed_ms(start)
+
+        # 폰트, 이미지 디코딩, 네트워크 요청이 끝날 때까지 대기 (고정 대기 없음)
+        start = time.perf_counter()
+        readiness = self.evaluate(f"({READINESS_SCRIPT})({int(self.quiet_ms)}, {int(self.timeout_ms)})")
+        timings['wait_ms'] = _elapsed_ms(start)
+        if not readiness.get('ready'):
+            print(f"  페이지 준비 대기 중단 ({readiness.get('reason')}, {readiness.get('elapsed_ms')}ms)")
+
+        start = time.perf_counter()
+        fit_content = fit_content and not clip_selector
+        min_height = MIN_HEIGHT if fit_content else int(height)
+        metrics = self.evaluate(
+            f"({MEASURE_SCRIPT})({json.dumps(clip_selector or DEFAULT_ROOT_SELECTOR)}, {min_height}, {MAX_HEIGHT})"
+        )
+        clip = root_clip(metrics, width) if clip_selector else None
+        if fit_content:
+            # 측정한 콘텐츠 높이로 뷰포트를 맞춰 한 번만 캡처
+            self.set_viewport(width, metrics['fit_height'], scale)
+        timings['measure_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        if clip is not None:
+            # 루트 요소 영역만 슬라이드 너비로 확대하여 캡처 (후처리 크롭/리사이즈 불필요)
+            screenshot = self.send('Page.captureScreenshot', {
+                'format': 'png',
+                'clip': clip,
+                'captureBeyondViewport': True,
+            })
+        else:
+            if clip_selector:
+                print(f"  {clip_selector} 요소를 찾지 못해 뷰포트 전체를 캡처합니다.")
+            screenshot = self.send('Page.captureScreenshot', {'format': 'png'})
+        png_data = base64.b64decode(screenshot['data'])
+        timings['screenshot_ms'] = _elapsed_ms(start)
+        return {'png': png_data, 'metrics': metrics, 'timings': timings}
+
+    def capture_clips(self, html_path, size, box_selector, scale=1):
+        self.recycle_worn_browser()
+        timings = {}
+        width, height = size
+        start = time.perf_counter()
+        self.set_viewport(width, height, scale)
+        self.navigate(html_path)
+        timings['load_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        readiness = self.evaluate(f"({READINESS_SCRIPT})({int(self.quiet_ms)}, {int(self.timeout_ms)})")
+        timings['wait_ms'] = _elapsed_ms(start)
+        if not readiness.get('ready'):
+            print(f"  페이지 준비 대기 중단 ({readiness.get('reason')}, {readiness.get('elapsed_ms')}ms)")
+
+        start = time.perf_counter()
+        clips = self.evaluate(f"({CLIP_SCRIPT})({json.dumps(box_selector)})")
+        timings['measure_ms'] = _elapsed_ms(start)
+
+        for index, clip in enumerate(clips):
+            start = time.perf_counter()
+            screenshot = self.send('Page.captureScreenshot', {
+                'format': 'png',
+                'clip': {'x': clip['x'], 'y': clip['y'], 'width': clip['width'], 'height': clip['height'], 'scale': 1},
+                'captureBeyondViewport': True,
+            })
+            timings['screenshot_ms'] = _elapsed_ms(start)
+            yield index, base64.b64decode(screenshot['data']), clip['overflow'], timings
+            timings = {}
+
+
+BACKENDS = {
+    'html2image': Html2ImageBackend,
+    'selenium': SeleniumBackend,
+    'puppeteer': PuppeteerBackend,
+    'cdp': CDPBackend,
+}
+
+
+def create_backend(name, browser_pool=None, virtual_time_ms=None, request_policy=None):
+    """이름으로 렌더 백엔드 생성 (브라우저를 쓰는 백엔드는 browser_pool을 공유)"""
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 렌더 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+    if name == 'html2image':
+        backend = Html2ImageBackend()
+    else:
+        backend = BACKENDS[name](browser_pool=browser_pool)
+    backend.virtual_time_ms = virtual_time_ms
+    if name != 'html2image':
+        # html2image(Chrome CLI)는 요청을 가로챌 수 없음
+        backend.request_policy = request_policy
+    return backend
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render Cache
+슬라이드 이미지를 내용 기반 키로 디스크에 캐시하는 모듈
+키는 HTML 소스, 참조하는 로컬 CSS/JS/이미지, 렌더 설정(뷰포트, 출력 크기), 백엔드와 버전의 해시이다.
+캐시 hit은 브라우저를 띄우지 않고 저장된 PNG를 바로 사용하며, 전체 크기는 LRU 방식으로 제한한다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+# 기본 설정
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'html_to_pptx' / 'renders'
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 캐시 최대 크기 (1GB)
+CACHE_FORMAT_VERSION = 1  # 렌더/후처리 방식이 바뀌면 올려서 기존 캐시를 무효화
+
+# HTML에서 로컬 자산 참조 추출 (link href, script/img src, CSS url())
+ASSET_PATTERN = re.compile(
+    r'''(?:href|src)\s*=\s*["']([^"']+)["']|url\(\s*["']?([^"')]+)["']?\s*\)''',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
+def backend_version(backend):
+    """렌더 백엔드 패키지 버전 (알 수 없으면 'unknown')"""
+    if backend == 'puppeteer':
+        package_json = Path(__file__).resolve().parent / 'node_modules' / 'puppeteer' / 'package.json'
+        try:
+            return json.loads(package_json.read_text(encoding='utf-8'))['version']
+        except (OSError, ValueError, KeyError):
+            return 'unknown'
+
+    package = {'html2image': 'html2image', 'chrome': 'selenium', 'cdp': 'websocket-client'}.get(backend, backend)
+    try:
+        from importlib.metadata import version
+        return version(package)
+    except Exception:
+        return 'unknown'
+
+
+def local_asset_paths(html_path, html_content):
+    """HTML이 참조하는 로컬 파일 경로 목록 (http/https/data URL 제외, 중복 제거, 정렬)"""
+    base_dir = Path(html_path).resolve().parent
+    paths = set()
+    for match in ASSET_PATTERN.finditer(html_content):
+        reference = (match.group(1) or match.group(2)).strip()
+        parsed = urlparse(reference)
+        if parsed.scheme in ('http', 'https', 'data', 'about', 'javascript', 'mailto') or reference.startswith('//'):
+            continue
+        if parsed.scheme == 'file':
+            path = Path(unquote(parsed.path))
+        elif parsed.scheme and len(parsed.scheme) > 1:
+            continue
+        else:
+            # 상대 경로 또는 Windows 드라이브 경로 (C:/...)
+            path = base_dir / unquote(reference.split('#')[0].split('?')[0])
+        if path.suffix:
+            paths.add(path.resolve())
+    return sorted(paths)
+
+
+def _asset_hash(path, memo):
+    """자산 파일 내용 해시 (없으면 'missing'), memo에 (경로, 수정 시각, 크기)별로 저장"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return 'missing'
+    memo_key = (path, stat.st_mtime_ns, stat.st_size)
+    if memo_key not in memo:
+        memo[memo_key] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return memo[memo_key]
+
+
+def render_key(html_path, settings, asset_memo=None):
+    """HTML 소스, 참조하는 로컬 자산, 렌더 설정으로 슬라이드 내용 키(sha256 hex) 계산
+
+    렌더 캐시 키와 증분 PPTX 빌드의 슬라이드 태그에 함께 사용한다.
+    """
+    asset_memo = {} if asset_memo is None else asset_memo
+    html_path = Path(html_path)
+    source = html_path.read_bytes()
+
+    digest = hashlib.sha256()
+    digest.update(f"format:{CACHE_FORMAT_VERSION}\n".encode('utf-8'))
+    backend = settings.get('backend', '')
+    digest.update(f"backend:{backend}@{backend_version(backend)}\n".encode('utf-8'))
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(b"\nhtml:")
+    digest.update(hashlib.sha256(source).digest())
+
+    for asset in local_asset_paths(html_path, source.decode('utf-8', errors='replace')):
+        digest.update(f"\nasset:{asset.as_posix()}:{_asset_hash(asset, asset_memo)}".encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """내용 주소 기반 슬라이드 이미지 캐시 (디스크, 크기 제한 LRU)
+
+    사용 예:
+        cache = RenderCache()
+        key = cache.key_for(html_path, {'backend': 'chrome', 'render_size': None})
+        png = cache.get(key)
+        if png is None:
+            png = render(html_path)
+            cache.put(key, png)
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = None
+        # 같은 실행 안에서 자산 파일을 여러 번 읽지 않도록 (경로, 수정 시각, 크기)별 해시 저장
+        self._asset_hashes = {}
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    def key_for(self, html_path, settings):
+        """HTML 소스, 로컬 자산, 렌더 설정으로 캐시 키(sha256 hex) 계산"""
+        return render_key(html_path, settings, self._asset_hashes)
+
+    def get(self, key):
+        """캐시된 PNG bytes 반환 (없으면 None). hit이면 LRU 순서를 갱신한다."""
+        entry = self._entry_path(key)
+        try:
+            png_data = entry.read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        # 마지막 사용 시각 = 파일 수정 시각 (LRU 기준)
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self.hits += 1
+        return png_data
+
+    def put(self, key, png_data):
+        """PNG bytes 저장 후 최대 크기를 넘으면 오래 쓰지 않은 항목부터 삭제"""
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        previous_size = entry.stat().st_size if entry.exists() else 0
+
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        fd, temp_name = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(png_data)
+        os.replace(temp_name, entry)
+
+        self._total_bytes = self.total_bytes() - previous_size + len(png_data)
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def total_bytes(self):
+        """현재 캐시 전체 크기 (처음 한 번만 디렉토리를 스캔)"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(entry.stat().st_size for entry in self.cache_dir.glob('*/*.png'))
+        return self._total_bytes
+
+    def evict(self):
+        """최대 크기 이하가 될 때까지 마지막 사용 시각이 오래된 항목부터 삭제"""
+        entries = []
+        for entry in self.cache_dir.glob('*/*.png'):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        if removed:
+            print(f"렌더 캐시 정리: {removed}개 삭제 (현재 {total / (1024 * 1024):.1f}MB)")
+
+
+def render_with_cache(cache, html_files, settings, render_files):
+    """캐시 hit은 바로 사용하고 miss인 슬라이드만 render_files로 렌더링한 뒤 저장
+
+    render_files: HTML 파일 리스트를 받아 같은 순서의 PNG bytes(실패 시 None) 리스트를 반환하는 함수
+    반환값: html_files 순서의 슬라이드 이미지 리스트
+    """
+    if cache is None:
+        return render_files(html_files)
+
+    keys = [cache.key_for(html_file, settings) for html_file in html_files]
+    slide_images = [cache.get(key) for key in keys]
+    missing = [i for i, image in enumerate(slide_images) if image is None]
+    print(f"렌더 캐시: hit {len(html_files) - len(missing)}개, miss {len(missing)}개")
+
+    if missing:
+        rendered = render_files([html_files[i] for i in missing])
+        for i, png_data in zip(missing, rendered):
+            slide_images[i] = png_data
+            if png_data is not None:
+                cache.put(keys[i], png_data)
+
+    return slide_images
+
+
+def iter_with_cache(cache, html_files, settings, iter_render_files):
+    """render_with_cache의 스트리밍 버전: hit은 하나씩 읽어 바로 내보내고, miss는 렌더링되는 대로 저장 후 내보냄
+
+    iter_render_files: HTML 파일 리스트를 받아 (인덱스, PNG bytes 또는 None)을 완료 순서대로 내보내는 함수
+    반환값: (html_files 기준 인덱스, 슬라이드 이미지)를 내보내는 generator
+    """
+    if cache is None:
+        yield from iter_render_files(html_files)
+        return
+
+    keys = [cache.key_for(html_file, settings) for html_file in html_files]
+    missing = []
+    for i, key in enumerate(keys):
+        png_data = cache.get(key)
+        if png_data is None:
+            missing.append(i)
+        else:
+            yield i, png_data
+    print(f"렌더 캐시: hit {len(html_files) - len(missing)}개, miss {len(missing)}개")
+
+    if missing:
+        for j, png_data in iter_render_files([html_files[i] for i in missing]):
+            if png_data is not None:
+                cache.put(keys[missing[j]], png_data)
+            yield missing[j], png_data
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Render Farm
+CPU 코어마다 브라우저를 하나씩 가진 워커 프로세스로 슬라이드를 나누어 렌더링하는 멀티 프로세스 모드
+각 워커는 자기 작업 큐를 먼저 처리하고, 비면 다른 워커의 큐에서 작업을 가져온다 (work stealing).
+메인 프로세스는 완료되는 대로 반환된 PNG로 PPTX를 조립한다.
+"""
+
+import multiprocessing
+import os
+import queue
+import random
+import time
+
+from page_readiness import DEFAULT_QUIET_MS, DEFAULT_TIMEOUT_MS
+
+# 기본 설정
+DEFAULT_PROCESSES = max(1, (os.cpu_count() or 2) - 1)
+SLIDE_WIDTH = 1920
+STEAL_POLL_SECONDS = 0.05  # 큐에서 작업을 기다리는 최대 시간
+
+
+def _next_job(own_queue, other_queues):
+    """자기 큐에서 작업을 꺼내고, 비어 있으면 다른 워커의 큐에서 훔쳐온다"""
+    try:
+        return own_queue.get(timeout=STEAL_POLL_SECONDS)
+    except queue.Empty:
+        pass
+
+    victims = list(other_queues)
+    random.shuffle(victims)
+    for victim in victims:
+        try:
+            return victim.get(timeout=STEAL_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return None
+
+
+def _render_with_chrome(job_source, results, worker_id, options):
+    """Selenium Chrome 브라우저 하나로 작업 처리"""
+    from browser_pool import BrowserPool
+    from page_measure import measure_overflow, root_overflow
+    from request_policy import RequestPolicy
+
+    options = dict(options)
+    clip_selector = options.pop('clip_selector', None)
+    # WebDriver로는 가상 시간 예산 만료 이벤트를 받을 수 없으므로 Chrome 렌더러는 스타일시트 고정만 사용
+    options.pop('virtual_time_ms', None)
+    request_rules = options.pop('request_rules', None)
+    request_policy = RequestPolicy(request_rules) if request_rules is not None else None
+    with BrowserPool(pool_size=1) as pool:
+        while True:
+            job = job_source()
+            if job is None:
+                break
+            index, html_path, viewport = job
+            start = time.perf_counter()
+            try:
+                overflow = 0
+                with pool.acquire() as browser:
+                    browser.set_request_policy(request_policy)
+                    if clip_selector:
+                        png, metrics = browser.capture_root(html_path, viewport, clip_selector, options['quiet_ms'],
+                                                            options['timeout_ms'], scale=options['scale'])
+                        overflow = root_overflow(metrics, viewport)
+                    else:
+                        png = browser.capture_png(html_path, viewport, **options)
+                        if not options['fit_content']:
+                            _, overflow = measure_overflow(browser.driver, viewport[1])
+                    request_log = browser.take_request_log()
+                results.put((index, png, None, overflow, request_log, worker_id, time.perf_counter() - start))
+            except Exception as e:
+                results.put((index, None, str(e), 0, [], worker_id, time.perf_counter() - start))
+
+
+def _render_with_puppeteer(job_source, results, worker_id, options):
+    """Puppeteer 워커(브라우저 하나)로 작업 처리"""
+    from page_measure import root_overflow, slide_overflow
+    from puppeteer_worker import PuppeteerWorker
+    from request_policy import RequestPolicy
+
+    options = dict(options)
+    request_rules = options.pop('request_rules', None)
+    if request_rules is not None:
+        options['request_rules'] = RequestPolicy(request_rules).worker_rules()
+
+    with PuppeteerWorker() as worker:
+        while True:
+            job = job_source()
+            if job is None:
+                break
+            index, html_path, viewport = job
+            start = time.perf_counter()
+            try:
+                result = worker.render(html_path, viewport, **options)
+                overflow = 0
+                if options['clip_selector'] and result['metrics']:
+                    overflow = root_overflow(result['metrics'], viewport)
+                elif not options['fit_content'] and result['metrics']:
+                    overflow = slide_overflow(result['metrics'], viewport[1])
+                results.put((index, result['png'], None, overflow, result['requests'], worker_id,
+                             time.perf_counter() - start))
+            except Exception as e:
+                results.put((index, None, str(e), 0, [], worker_id, time.perf_counter() - start))
+
+
+RENDERERS = {
+    'chrome': _render_with_chrome,
+    'puppeteer': _render_with_puppeteer,
+}
+
+
+def _farm_worker(worker_id, job_queues, results, backend, options):
+    """워커 프로세스 진입점 (자기 브라우저를 실행하고 큐가 모두 빌 때까지 렌더링)"""
+    own_queue = job_queues[worker_id]
+    other_queues = [q for i, q in enumerate(job_queues) if i != worker_id]
+    try:
+        RENDERERS[backend](
+            lambda: _next_job(own_queue, other_queues),
+            results, worker_id, options
+        )
+    except Exception as e:
+        # 브라우저 실행 실패 등: 남은 작업은 다른 워커가 가져간다
+        print(f"렌더 워커 #{worker_id} 오류: {e}")
+
+
+def iter_in_processes(jobs, processes=DEFAULT_PROCESSES, backend='chrome',
+                      quiet_ms=DEFAULT_QUIET_MS, timeout_ms=DEFAULT_TIMEOUT_MS, fit_content=True, scale=1,
+                      clip_selector=None, virtual_time_ms=None, request_rules=None):
+    """렌더 작업을 워커 프로세스에 분배하고 완료되는 대로 결과 반환
+
+    jobs: [(html_path, (width, height)), ...]
+    fit_content=False이면 (width, height) x scale 픽셀 크기 그대로 캡처하고 넘친 높이를 함께 반환
+    clip_selector를 주면 그 요소 영역만 width 너비로 확대하여 캡처 (요소가 없으면 고정 뷰포트 캡처)
+    virtual_time_ms를 주면 puppeteer 렌더러는 로드 후 그만큼의 가상 시간을 빨리 감음
+    request_rules(RequestPolicy.to_dicts())를 주면 워커 브라우저의 요청에 정책 적용
+    반환값: (작업 인덱스, png bytes 또는 None, 오류 메시지 또는 None, 넘친 높이 px, 차단/바꿔쓴 요청 리스트)를
+            완료 순서대로 내보내는 generator
+            (처리되지 못한 작업도 마지막에 오류와 함께 반환)
+    """
+    if backend not in RENDERERS:
+        raise ValueError(f"지원하지 않는 렌더 백엔드: {backend}")
+
+    options = {'quiet_ms': quiet_ms, 'timeout_ms': timeout_ms, 'fit_content': fit_content, 'scale': scale,
+               'clip_selector': clip_selector, 'virtual_time_ms': virtual_time_ms, 'request_rules': request_rules}
+    processes = max(1, min(processes, len(jobs)))
+    context = multiprocessing.get_context('spawn')
+    job_queues = [context.Queue() for _ in range(processes)]
+    results = context.Queue()
+
+    # 연속된 슬라이드를 같은 워커에 배정 (초기 분배, 이후 work stealing으로 균형 조정)
+    chunk = -(-len(jobs) // processes)
+    for index, (html_path, viewport) in enumerate(jobs):
+        job_queues[index // chunk].put((index, str(html_path), tuple(viewport)))
+
+    workers = [
+        context.Process(
+            target=_farm_worker,
+            args=(worker_id, job_queues, results, backend, options),
+            daemon=True,
+        )
+        for worker_id in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    print(f"렌더 팜 시작: 프로세스 {processes}개, 슬라이드 {len(jobs)}개 ({backend})")
+
+    received = set()
+    per_worker = {}
+    try:
+        while len(received) < len(jobs):
+            try:
+                index, png, error, overflow, request_log, worker_id, elapsed = results.get(timeout=1)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    break
+                continue
+            received.add(index)
+            per_worker[worker_id] = per_worker.get(worker_id, 0) + 1
+            print(f"  슬라이드 {index + 1} 렌더 완료 (워커 #{worker_id}, {elapsed:.2f}초)")
+            yield index, png, error, overflow, request_log
+
+        for index in range(len(jobs)):
+            if index not in received:
+                yield index, None, "렌더 워커가 작업을 처리하지 못했습니다.", 0, []
+    finally:
+        for worker in workers:
+            if len(received) < len(jobs):
+                # 중단된 경우 남은 작업을 기다리지 않음
+                worker.terminate()
+            worker.join(timeout=30)
+            if worker.is_alive():
+                worker.terminate()
+
+        print(f"렌더 팜 종료: 워커별 처리 수 {dict(sorted(per_worker.items()))}")
+
+
+def iter_slides_in_processes(converter, html_files, processes=DEFAULT_PROCESSES, backend='chrome'):
+    """변환기의 prepare_slide/finish_slide를 사용하여 폴더 전체를 멀티 프로세스로 렌더링하며 완료되는 대로 반환
+
+    반환값: (슬라이드 인덱스, 슬라이드 이미지 PNG bytes 또는 None)을 완료 순서대로 내보내는 generator
+    """
+    # 1단계: 임시 HTML 준비 (워커별 초기 분배를 위해 먼저 모두 준비)
+    prepared = []
+    for i, html_file in enumerate(html_files):
+        try:
+            temp_html_path, calculated_height = converter.prepare_slide(html_file.name, i + 1)
+        except Exception as e:
+            print(f"HTML 준비 오류 ({html_file.name}): {e}")
+            yield i, None
+            continue
+        prepared.append((i, temp_html_path, calculated_height))
+
+    jobs = [(temp_html_path, (SLIDE_WIDTH, calculated_height)) for _, temp_html_path, calculated_height in prepared]
+    if not jobs:
+        return
+
+    # 2단계: 워커 프로세스에서 렌더링
+    # 출력 크기가 지정되거나 루트 요소 clip 캡처이면 고정 뷰포트 + deviceScaleFactor로 최종 픽셀 크기 그대로 렌더링
+    clip_selector = converter.clip_selector if converter.clips_to_root() else None
+    fit_content = converter.render_size is None and clip_selector is None
+    try:
+        # 3단계: 메인 프로세스에서 도착하는 대로 이미지 후처리 (PNG bytes를 파일로 저장하지 않음)
+        request_rules = converter.request_policy.to_dicts() if converter.request_policy is not None else None
+        for job_index, png, error, overflow, request_log in iter_in_processes(
+                jobs, processes, backend, fit_content=fit_content, scale=converter.device_scale,
+                clip_selector=clip_selector, virtual_time_ms=converter.virtual_time_ms,
+                request_rules=request_rules):
+            index, temp_html_path, _ = prepared[job_index]
+            html_file = html_files[index]
+            slide_png = None
+            if png is None:
+                print(f"HTML 변환 오류 ({html_file.name}): {error}")
+            else:
+                converter.report_requests(html_file.name, request_log)
+                converter.report_overflow(html_file.name, overflow)
+                try:
+                    # 워커 프로세스 안의 렌더 단계는 기록하지 않고 메인 프로세스 후처리만 기록
+                    with converter.tracer.slide(html_file.name):
+                        slide_png = converter.finish_slide(png)
+                except Exception as e:
+                    print(f"이미지 후처리 오류 ({html_file.name}): {e}")
+
+            # 임시 HTML 파일 삭제
+            if temp_html_path.exists():
+                temp_html_path.unlink()
+
+            yield index, slide_png
+    finally:
+        # 중단된 경우 남은 임시 HTML 파일 삭제
+        for _, temp_html_path, _ in prepared:
+            if temp_html_path.exists():
+                temp_html_path.unlink()
+
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request Policy
+렌더링 중 페이지가 보내는 요청(분석 스크립트, 원격 이미지, 폰트 등)을 URL 패턴과 리소스 종류로
+허용(allow), 차단(deny), 바꿔쓰기(rewrite)하는 요청 가로채기 정책
+
+정적 슬라이드에 필요 없는 요청이 네트워크 조용한 구간(networkidle)을 늦추지 않도록 하며,
+차단/바꿔쓴 요청은 슬라이드마다 기록하여 어떤 페이지가 어떤 요청 때문에 느려졌는지 확인할 수 있다.
+
+규칙은 위에서부터 처음 맞는 것 하나만 적용하고, 맞는 규칙이 없으면 허용한다.
+    {"action": "deny", "url": "*://*google-analytics.com/*"}
+    {"action": "deny", "types": ["image"], "url": "https://*"}
+    {"action": "rewrite", "url": "https://cdn.example.com/*", "to": "http://127.0.0.1:8000/{1}"}
+url은 *를 와일드카드로 쓰는 glob 패턴이며 (생략하면 모든 URL), rewrite의 to에서 {1}, {2}...는 *에 맞은 부분이다.
+types는 리소스 종류 (document, stylesheet, image, media, font, script, xhr, fetch, ping, other 등, 소문자)이다.
+
+Chrome 탭 하나의 요청을 DevTools 프로토콜(Fetch 도메인)로 가로채는 RequestInterceptor는
+WebDriver가 제어하는 탭(Selenium 백엔드, 렌더 팜)에서 사용한다. websocket-client 패키지가 필요하다.
+"""
+
+import json
+import re
+import threading
+import urllib.request
+from pathlib import Path
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+# 기본 설정
+ACTIONS = ('allow', 'deny', 'rewrite')
+INTERCEPT_POLL_SECONDS = 0.2  # 가로채기 스레드가 종료 요청을 확인하는 주기
+
+# 슬라이드 모양에 영향이 없는 분석/추적 요청과 ping(sendBeacon, <a ping>)만 막는 기본 정책
+DEFAULT_RULES = [
+    {'action': 'deny', 'types': ['ping']},
+    {'action': 'deny', 'url': '*://*google-analytics.com/*'},
+    {'action': 'deny', 'url': '*://*googletagmanager.com/*'},
+    {'action': 'deny', 'url': '*://*doubleclick.net/*'},
+    {'action': 'deny', 'url': '*://connect.facebook.net/*'},
+    {'action': 'deny', 'url': '*://*hotjar.com/*'},
+    {'action': 'deny', 'url': '*://*clarity.ms/*'},
+]
+
+PLACEHOLDER_PATTERN = re.compile(r'\{(\d+)\}')
+
+
+def glob_to_regex(pattern):
+    """*를 와일드카드로 쓰는 URL glob 패턴을 정규식 문자열로 변환 (*마다 캡처 그룹, Python/JavaScript 공용)"""
+    parts = [re.escape(part) for part in pattern.split('*')]
+    return '^' + '(.*)'.join(parts) + '$'
+
+
+class RequestRule:
+    """요청 정책 규칙 하나 (action, url glob 패턴, 리소스 종류, rewrite 대상)"""
+
+    def __init__(self, action, url=None, types=None, to=None):
+        if action not in ACTIONS:
+            raise ValueError(f"지원하지 않는 요청 정책 동작: {action} (사용 가능: {', '.join(ACTIONS)})")
+        if action == 'rewrite' and not to:
+            raise ValueError(f"rewrite 규칙에는 바꿀 URL(to)이 필요합니다: {url}")
+        self.action = action
+        self.url = url
+        self.types = {name.lower() for name in types} if types else None
+        self.to = to
+        self._pattern = re.compile(glob_to_regex(url)) if url else None
+
+    def match(self, url, resource_type):
+        """규칙이 요청에 맞으면 url 패턴의 *에 맞은 부분 리스트, 맞지 않으면 None"""
+        if self.types is not None and (resource_type or 'other').lower() not in self.types:
+            return None
+        if self._pattern is None:
+            return []
+        match = self._pattern.match(url)
+        return list(match.groups()) if match else None
+
+    def rewrite(self, groups):
+        """rewrite 대상 URL ({n}을 url 패턴의 n번째 *에 맞은 부분으로 치환)"""
+        def replace(match):
+            index = int(match.group(1)) - 1
+            return groups[index] if 0 <= index < len(groups) else ''
+        return PLACEHOLDER_PATTERN.sub(replace, self.to)
+
+    def to_dict(self):
+        rule = {'action': self.action}
+        if self.url:
+            rule['url'] = self.url
+        if self.types:
+            rule['types'] = sorted(self.types)
+        if self.to:
+            rule['to'] = self.to
+        return rule
+
+
+class RequestPolicy:
+    """요청 가로채기 정책 (규칙 리스트, 처음 맞는 규칙 적용, 기본은 허용)
+
+    사용 예:
+        policy = RequestPolicy.default()
+        action, url = policy.decide('https://www.google-analytics.com/analytics.js', 'script')
+        # -> ('deny', 'https://www.google-analytics.com/analytics.js')
+    """
+
+    def __init__(self, rules=()):
+        self.rules = [rule if isinstance(rule, RequestRule) else RequestRule(**rule) for rule in rules]
+
+    @classmethod
+    def default(cls):
+        """분석/추적 요청만 막는 기본 정책"""
+        return cls(DEFAULT_RULES)
+
+    @classmethod
+    def from_file(cls, path):
+        """JSON 파일(규칙 리스트 또는 {"rules": [...]})에서 정책 읽기"""
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        return cls(data['rules'] if isinstance(data, dict) else data)
+
+    def decide(self, url, resource_type=None):
+        """요청에 적용할 (동작, URL) 반환 (rewrite이면 바꾼 URL, 그 외에는 원래 URL)"""
+        for rule in self.rules:
+            groups = rule.match(url, resource_type)
+            if groups is None:
+                continue
+            if rule.action == 'rewrite':
+                return 'rewrite', rule.rewrite(groups)
+            return rule.action, url
+        return 'allow', url
+
+    def to_dicts(self):
+        """규칙을 JSON으로 보낼 수 있는 dict 리스트로 변환 (렌더 캐시 키, 정책 파일)"""
+        return [rule.to_dict() for rule in self.rules]
+
+    def worker_rules(self):
+        """Puppeteer 워커에 보낼 규칙 (url glob 대신 정규식 문자열 pattern 사용)"""
+        rules = []
+        for rule in self.rules:
+            worker_rule = rule.to_dict()
+            if 'url' in worker_rule:
+                worker_rule['pattern'] = glob_to_regex(worker_rule.pop('url'))
+            rules.append(worker_rule)
+        return rules
+
+    def fetch_command(self, params, request_log=None):
+        """Fetch.requestPaused 이벤트 params에 응답할 DevTools (명령, params)
+
+        차단/바꿔쓴 요청은 request_log 리스트에 {'url', 'type', 'action', 'to'} dict로 추가한다.
+        """
+        request = params['request']
+        url = request['url']
+        resource_type = (params.get('resourceType') or 'other').lower()
+        action, new_url = self.decide(url, resource_type)
+        if action != 'allow' and request_log is not None:
+            entry = {'url': url, 'type': resource_type, 'action': action}
+            if action == 'rewrite':
+                entry['to'] = new_url
+            request_log.append(entry)
+        if action == 'deny':
+            return 'Fetch.failRequest', {'requestId': params['requestId'], 'errorReason': 'BlockedByClient'}
+        if action == 'rewrite':
+            return 'Fetch.continueRequest', {'requestId': params['requestId'], 'url': new_url}
+        return 'Fetch.continueRequest', {'requestId': params['requestId']}
+
+
+def format_request_log(request_log, limit=5):
+    """차단/바꿔쓴 요청 기록을 출력용 줄 리스트로 변환 (limit개까지, 나머지는 개수만)"""
+    lines = []
+    for entry in request_log[:limit]:
+        if entry['action'] == 'rewrite':
+            lines.append(f"rewrite {entry['type']}: {entry['url']} -> {entry['to']}")
+        else:
+            lines.append(f"{entry['action']} {entry['type']}: {entry['url']}")
+    if len(request_log) > limit:
+        lines.append(f"... 외 {len(request_log) - limit}개")
+    return lines
+
+
+class RequestInterceptor:
+    """Chrome 탭 하나의 요청을 별도 DevTools 연결(WebSocket)로 가로채 정책을 적용하는 백그라운드 스레드
+
+    WebDriver는 DevTools 이벤트를 받을 수 없으므로, 같은 브라우저의 DevTools 주소로 탭에 직접 접속하여
+    Fetch.requestPaused마다 허용/차단/바꿔쓰기로 응답한다. 연결이 끊기면 Chrome이 가로채기를 해제한다.
+
+    사용 예:
+        interceptor = RequestInterceptor(debugger_url, target_id, policy)
+        interceptor.start()
+        ... 페이지 로드 ...
+        blocked = interceptor.take_log()
+        interceptor.close()
+    """
+
+    def __init__(self, debugger_url, target_id, policy):
+        self.debugger_url = debugger_url
+        self.target_id = target_id
+        self.policy = policy
+        self._log = []
+        self._lock = threading.Lock()
+        self._socket = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._next_id = 1
+
+    def start(self):
+        """탭에 접속하여 Fetch 가로채기를 켠 뒤 이벤트 처리 스레드 시작"""
+        if self._thread is not None:
+            return
+        if not WEBSOCKET_AVAILABLE:
+            raise ImportError("websocket-client가 설치되지 않았습니다. pip install websocket-client로 설치하세요.")
+
+        with urllib.request.urlopen(f"{self.debugger_url}/json/list", timeout=10) as response:
+            targets = json.loads(response.read().decode('utf-8'))
+        target = next((target for target in targets if target.get('id') == self.target_id), None)
+        if target is None:
+            raise RuntimeError(f"가로챌 탭을 찾을 수 없습니다: {self.target_id}")
+
+        self._socket = websocket.create_connection(target['webSocketDebuggerUrl'], timeout=INTERCEPT_POLL_SECONDS,
+                                                   suppress_origin=True)
+        # Fetch.enable 응답을 받은 뒤부터 요청이 가로채지므로, 응답이 올 때까지 기다린 다음 스레드에 넘김
+        enable_id = self._post('Fetch.enable', {'patterns': [{'urlPattern': '*', 'requestStage': 'Request'}]})
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            if message.get('id') == enable_id:
+                break
+            self._handle(message)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _post(self, method, params):
+        """응답을 기다리지 않고 DevTools 명령 전송 (명령 id 반환)"""
+        message_id = self._next_id
+        self._next_id += 1
+        self._socket.send(json.dumps({'id': message_id, 'method': method, 'params': params}))
+        return message_id
+
+    def _handle(self, message):
+        if message.get('method') != 'Fetch.requestPaused':
+            return
+        request_log = []
+        method, params = self.policy.fetch_command(message['params'], request_log)
+        self._post(method, params)
+        if request_log:
+            with self._lock:
+                self._log.extend(request_log)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                message = json.loads(self._socket.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            except Exception:
+                # 탭/브라우저가 닫힘
+                break
+            try:
+                self._handle(message)
+            except Exception as e:
+                print(f"  요청 가로채기 오류: {e}")
+
+    def take_log(self):
+        """지금까지 차단/바꿔쓴 요청 기록을 반환하고 비움"""
+        with self._lock:
+            request_log, self._log = self._log, []
+        return request_log
+
+    def close(self):
+        """스레드 종료 후 연결 해제 (Chrome이 가로채기를 해제)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except Exception:
+                pass
+            self._socket = None
@@ -0,0 +1,21 @@
+/**
+ * Slide Clips
+ * 여러 슬라이드를 이어 붙인 통합 문서에서 슬라이드 상자마다 캡처할 영역을 구하는 스크립트
+ *
+ * (boxSelector)로 호출하면 문서 순서대로 다음 값의 배열을 반환한다.
+ *   x, y, width, height : 슬라이드 상자의 문서 기준 영역 (Page.captureScreenshot clip 값)
+ *   overflow            : 상자(overflow: hidden) 밖으로 넘쳐 잘린 콘텐츠 높이 px
+ */
+(function (boxSelector) {
+    var boxes = Array.prototype.slice.call(document.querySelectorAll(boxSelector));
+    return boxes.map(function (box) {
+        var rect = box.getBoundingClientRect();
+        return {
+            x: Math.round(rect.left + window.scrollX),
+            y: Math.round(rect.top + window.scrollY),
+            width: Math.round(rect.width),
+            height: Math.round(rect.height),
+            overflow: Math.max(0, box.scrollHeight - box.clientHeight)
+        };
+    });
+})
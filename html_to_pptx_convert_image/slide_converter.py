@@ -0,0 +1,741 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slide Converter
+렌더 백엔드(render_backends)를 이름으로 선택하는 통합 HTML to PPTX 변환기
+높이 조절, 이미지 후처리, PPTX 조립, 렌더 캐시, 증분 빌드는 백엔드와 관계없이 여기서 한 번만 구현한다.
+"""
+
+import io
+import os
+import sys
+import time
+from pathlib import Path
+from pptx import Presentation
+from pptx.util import Inches
+import tempfile
+import shutil
+from bs4 import BeautifulSoup
+from browser_pool import BrowserPool
+from combined_render import SLIDE_BOX_SELECTOR, build_combined_document
+from page_measure import MIN_HEIGHT, root_overflow, slide_overflow
+from page_readiness import DEFAULT_VIRTUAL_TIME_MS, freeze_animations
+from concurrent_render import iter_slides_concurrently
+from render_backends import BACKENDS, create_backend
+from render_farm import iter_slides_in_processes
+from slide_pipeline import DEFAULT_QUEUE_SIZE, collect_slides, stream_slides
+from incremental_pptx import patch_pptx, reorder_slides, tag_slide
+from asset_mirror import AssetMirror
+from render_cache import RenderCache, iter_with_cache, render_key, render_with_cache
+from request_policy import RequestPolicy, format_request_log
+from slide_image import SLIDE_SIZE, device_scale_for, fit_png_to_slide, png_size, resolve_render_size
+from stage_trace import StageTracer, traced
+from tailwind_purge import TailwindPurger
+from watch_mode import watch_and_rebuild
+
+# 기본 설정
+DEFAULT_BACKEND = 'selenium'
+DEFAULT_HTML_DIR = r"C:\Project\gigabitamin\genspark\smart_gate\html"
+DEFAULT_OUTPUT_DIR = r"C:\Project\gigabitamin\genspark\smart_gate"
+
+class SlideConverter:
+    def __init__(self, html_dir, output_path, backend=DEFAULT_BACKEND, browser_pool=None, concurrency=1,
+                 processes=1, render_size=None, render_cache=None, incremental=False,
+                 queue_size=DEFAULT_QUEUE_SIZE, trace_path=None, asset_mirror=None, css_purger=None,
+                 combined=False, clip_selector=None, freeze_animations=False, request_policy=None):
+        self.html_dir = Path(html_dir)
+        self.output_path = Path(output_path)
+        # 최종 출력 픽셀 크기 (예: (1920, 1080), (1280, 720), (3840, 2160) 또는 '720p', '2x')
+        # 지정하면 deviceScaleFactor로 브라우저가 바로 이 크기로 렌더링하고 리사이즈/크롭을 건너뜀
+        self.render_size = resolve_render_size(render_size)
+        self.device_scale = device_scale_for(self.render_size) if self.render_size else 1
+        # 고정 크기 렌더링에서 슬라이드 높이를 넘친 슬라이드 [(파일명, 넘친 높이 px), ...]
+        self.overflow_slides = []
+        # 렌더 캐시 (render_cache.RenderCache, None이면 항상 렌더링)
+        self.render_cache = render_cache
+        # 증분 빌드 (기존 PPTX가 있으면 바뀐 슬라이드만 교체)
+        self.incremental = incremental
+        # 렌더링과 PPTX 조립 사이 대기열 크기 (렌더 완료 후 조립을 기다리는 슬라이드 최대 수)
+        self.queue_size = queue_size
+        # 동시에 렌더링할 탭 수 (1이면 순차 렌더링)
+        self.concurrency = concurrency
+        # 렌더 워커 프로세스 수 (1보다 크면 프로세스마다 브라우저를 하나씩 실행)
+        self.processes = processes
+        # 공유 브라우저 풀 (browser_pool.BrowserPool, 없으면 백엔드가 필요할 때 직접 실행)
+        self.browser_pool = browser_pool
+        # 애니메이션 고정 (애니메이션/트랜지션을 끄는 스타일시트를 넣고, 지원하는 백엔드는 가상 시간을 빨리 감음)
+        self.freeze_animations = freeze_animations
+        self.virtual_time_ms = DEFAULT_VIRTUAL_TIME_MS if freeze_animations else None
+        # 요청 가로채기 정책 (request_policy.RequestPolicy, 지정하면 분석/원격 요청 등을 규칙대로 차단/바꿔쓰기)
+        self.request_policy = request_policy
+        # 정책으로 차단/바꿔쓴 요청이 있는 슬라이드 [(파일명, 요청 기록 리스트), ...]
+        self.request_log_slides = []
+        # 순차 렌더링에 사용할 렌더 백엔드 (render_backends.BACKENDS의 이름)
+        self.backend = create_backend(backend, browser_pool, virtual_time_ms=self.virtual_time_ms,
+                                      request_policy=request_policy)
+        # 단계별 시간 트레이스 (trace_path를 지정하면 Chrome trace-event 형식으로 저장)
+        self.trace_path = Path(trace_path) if trace_path else None
+        self.tracer = StageTracer(enabled=self.trace_path is not None)
+        # 오프라인 자산 (asset_mirror.AssetMirror, 지정하면 CDN URL을 static/과 로컬 폰트 캐시로 바꿔 렌더링)
+        self.asset_mirror = asset_mirror
+        # 덱 전용 Tailwind 스타일시트 (tailwind_purge.TailwindPurger, 지정하면 사용하는 클래스 규칙만 남겨 렌더링)
+        self.css_purger = css_purger
+        # 통합 문서 렌더링 (폴더 전체를 1920x1080 상자로 이어 붙인 문서를 한 번 로드하고 슬라이드별 clip 캡처)
+        self.combined = combined
+        # 슬라이드 루트 요소 선택자 (예: '.slide-container', 지정하면 높이 조절 없이 요소 영역만 슬라이드 크기로 캡처)
+        self.clip_selector = clip_selector
+        self.temp_dir = None
+    
+    @traced('calculate_content_height')
+    def calculate_content_height(self, html_content):
+        """HTML 내용의 실제 높이를 추정"""
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # 텍스트 내용 길이 기반으로 높이 추정
+        text_content = soup.get_text()
+        text_length = len(text_content)
+        
+        # 이미지 개수 확인
+        images = soup.find_all('img')
+        image_count = len(images)
+        
+        # 테이블 개수 확인
+        tables = soup.find_all('table')
+        table_count = len(tables)
+        
+        # 기본 높이 계산 (텍스트 길이 기반)
+        base_height = 800  # 기본 높이
+        text_height = text_length * 0.5  # 텍스트당 0.5px
+        image_height = image_count * 200  # 이미지당 200px
+        table_height = table_count * 150  # 테이블당 150px
+        
+        estimated_height = int(base_height + text_height + image_height + table_height)
+        
+        # 최소/최대 높이 제한
+        min_height = 1080
+        max_height = 2160
+        
+        final_height = max(min_height, min(estimated_height, max_height))
+        
+        print(f"내용 분석: 텍스트 {text_length}자, 이미지 {image_count}개, 테이블 {table_count}개")
+        print(f"추정 높이: {final_height}px")
+        
+        return final_height
+    
+    @traced('adjust_html_height')
+    def adjust_html_height(self, html_content, target_height_px=None):
+        """HTML 내용의 높이를 자동으로 조절하여 잘리지 않도록 함"""
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # 목표 높이가 지정되지 않은 경우 자동 계산
+        if target_height_px is None:
+            target_height_px = self.calculate_content_height(html_content)
+        
+        # body 태그에 최소 높이 설정
+        body = soup.find('body')
+        if body:
+            # 기존 스타일 확인
+            existing_style = body.get('style', '')
+            
+            # 최소 높이 설정 (픽셀 단위)
+            min_height_style = f"min-height: {target_height_px}px; height: auto;"
+            
+            if existing_style:
+                # 기존 스타일과 병합
+                body['style'] = f"{existing_style}; {min_height_style}"
+            else:
+                body['style'] = min_height_style
+        
+        # html 태그에도 높이 설정
+        html_tag = soup.find('html')
+        if html_tag:
+            existing_style = html_tag.get('style', '')
+            html_style = f"height: auto; min-height: {target_height_px}px;"
+            
+            if existing_style:
+                html_tag['style'] = f"{existing_style}; {html_style}"
+            else:
+                html_tag['style'] = html_style
+        
+        # CSS 스타일 추가
+        style_tag = soup.find('style')
+        if not style_tag:
+            style_tag = soup.new_tag('style')
+            soup.head.append(style_tag)
+        
+        # 기존 CSS에 높이 관련 스타일 추가
+        additional_css = f"""
+        /* 자동 높이 조절을 위한 추가 스타일 */
+        html, body {{
+            height: auto !important;
+            min-height: {target_height_px}px !important;
+            overflow-x: hidden;
+            overflow-y: visible;
+            margin: 0;
+            padding: 0;
+        }}
+        
+        .page-body, .page {{
+            height: auto !important;
+            min-height: {target_height_px}px !important;
+            margin: 0;
+            padding: 20px;
+            box-sizing: border-box;
+        }}
+        
+        /* 모든 컨테이너 요소의 높이 자동 조절 */
+        div, section, article, main {{
+            height: auto !important;
+            min-height: fit-content;
+        }}
+        
+        /* 테이블 높이 자동 조절 */
+        table {{
+            height: auto !important;
+            min-height: fit-content;
+        }}
+        
+        /* 이미지 높이 자동 조절 */
+        img {{
+            max-width: 100%;
+            height: auto;
+        }}
+        """
+        
+        if style_tag.string:
+            style_tag.string += additional_css
+        else:
+            style_tag.string = additional_css
+        
+        return str(soup)
+    
+    def setup_temp_directory(self):
+        """임시 디렉토리 설정"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        print(f"임시 디렉토리 생성: {self.temp_dir}")
+        
+    def cleanup_temp_directory(self):
+        """임시 디렉토리 정리"""
+        if self.temp_dir and self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+            print("임시 디렉토리 정리 완료")
+    
+    def measures_in_browser(self):
+        """렌더 경로가 실제 DOM 높이를 측정하는지 여부 (html2image 순차 렌더링만 추정 높이 사용)"""
+        return self.backend.measures_in_browser or self.processes > 1
+    
+    def renders_in_tabs(self):
+        """병렬 탭 렌더링 사용 여부 (상주 Puppeteer 워커의 탭을 쓰므로 puppeteer 백엔드만)"""
+        return self.concurrency > 1 and self.backend.name == 'puppeteer'
+    
+    def clips_to_root(self):
+        """루트 요소 영역 clip 캡처 사용 여부 (페이지를 측정하는 렌더 경로만, html2image 순차 렌더링은 제외)"""
+        return self.clip_selector is not None and self.measures_in_browser()
+    
+    def report_overflow(self, html_file, overflow):
+        """고정 크기 렌더링에서 슬라이드 높이를 넘친 콘텐츠 기록 (조용히 잘리지 않도록 경고)"""
+        if overflow > 0:
+            self.overflow_slides.append((html_file, overflow))
+            print(f"  경고: {html_file} 콘텐츠가 슬라이드 높이를 {overflow}px 넘쳐 잘립니다.")
+    
+    def report_requests(self, html_file, request_log):
+        """요청 정책으로 차단/바꿔쓴 요청을 슬라이드별로 기록 (어떤 페이지가 어떤 요청으로 느려졌는지 확인용)"""
+        if request_log:
+            self.request_log_slides.append((html_file, request_log))
+            print(f"  요청 정책 적용: {len(request_log)}개")
+            for line in format_request_log(request_log):
+                print(f"    {line}")
+    
+    def rewrite_assets(self, html_content):
+        """렌더링할 HTML의 스타일시트/CDN 참조를 덱 전용 Tailwind 스타일시트와 로컬 자산 서버로 교체
+        
+        애니메이션 고정이 켜져 있으면 애니메이션/트랜지션을 끄는 스타일시트도 함께 넣는다.
+        """
+        if self.css_purger is not None:
+            # Tailwind link를 덱 전용으로 줄인 스타일시트로 교체
+            with self.tracer.span('rewrite_tailwind_link'):
+                html_content = self.css_purger.rewrite_html(html_content)
+        
+        if self.asset_mirror is not None:
+            # CDN 자산을 loopback 자산 서버 URL로 교체 (브라우저가 외부 네트워크를 기다리지 않음)
+            with self.tracer.span('rewrite_cdn_urls'):
+                html_content = self.asset_mirror.rewrite_html(html_content)
+        
+        if self.freeze_animations:
+            # 진입 애니메이션/트랜지션을 끝 상태로 바로 보내 애니메이션 완료를 기다리지 않음
+            html_content = freeze_animations(html_content)
+        
+        return html_content
+    
+    def prepare_slide(self, html_file, slide_number):
+        """슬라이드 렌더 준비 (높이를 조절한 임시 HTML 생성)
+        
+        반환값: (임시 HTML 경로, 계산된 높이)
+        """
+        with self.tracer.slide(html_file):
+            # HTML 파일 경로
+            html_path = self.html_dir / html_file
+            
+            print(f"변환 중: {html_file} -> 슬라이드 {slide_number}")
+            
+            # HTML 파일 읽기
+            with self.tracer.span('read_html'):
+                with open(html_path, 'r', encoding='utf-8') as f:
+                    html_content = f.read()
+            
+            if self.clips_to_root():
+                # 루트 요소 영역만 캡처하므로 원본 레이아웃 그대로 렌더링 (높이 조절 스타일을 넣지 않음)
+                adjusted_html = html_content
+                calculated_height = SLIDE_SIZE[1]
+            elif self.measures_in_browser():
+                # 최소 높이만 지정하고, 실제 높이는 렌더 후 브라우저에서 DOM을 측정하여 결정
+                adjusted_html = self.adjust_html_height(html_content, target_height_px=MIN_HEIGHT)
+                calculated_height = MIN_HEIGHT  # 초기 뷰포트 높이
+            else:
+                # html2image는 페이지를 측정할 수 없으므로 텍스트 길이 기반 추정 높이 사용 (한 번만 계산)
+                calculated_height = self.calculate_content_height(html_content)
+                adjusted_html = self.adjust_html_height(html_content, target_height_px=calculated_height)
+                print(f"추정 이미지 높이: {calculated_height}px")
+            
+            adjusted_html = self.rewrite_assets(adjusted_html)
+            
+            # 임시 HTML 파일 생성
+            temp_html_path = self.temp_dir / f"temp_{html_file}"
+            with self.tracer.span('write_temp_html'):
+                with open(temp_html_path, 'w', encoding='utf-8') as f:
+                    f.write(adjusted_html)
+        
+        return temp_html_path, calculated_height
+    
+    def finish_slide(self, png_data):
+        """렌더된 PNG(bytes)를 메모리에서 PPT 슬라이드 크기에 맞게 후처리"""
+        if not png_data:
+            print("스크린샷 데이터가 생성되지 않았습니다.")
+            return None
+        
+        # 이미지 크기 확인 (PNG 헤더만 읽음)
+        actual_width, actual_height = png_size(png_data)
+        print(f"생성된 이미지 크기: {actual_width}x{actual_height}")
+        
+        # 이미지 크기 조정 (PPT 슬라이드에 맞게 리사이즈, 디코딩/인코딩은 각각 한 번)
+        # 출력 크기로 바로 렌더링한 경우 크기가 같으므로 리사이즈 없이 그대로 사용
+        with self.tracer.span('fit_png_to_slide'):
+            slide_png = fit_png_to_slide(png_data, self.render_size or SLIDE_SIZE)
+        final_width, final_height = png_size(slide_png)
+        print(f"리사이즈 후 이미지 크기: {final_width}x{final_height}")
+        
+        return slide_png
+    
+    def convert_html_to_image(self, html_file, slide_number):
+        """렌더 백엔드로 HTML 파일을 이미지로 변환 (페이지 완전 로딩 대기)"""
+        try:
+            with self.tracer.slide(html_file):
+                temp_html_path, calculated_height = self.prepare_slide(html_file, slide_number)
+                
+                render_start = time.perf_counter()
+                if self.clips_to_root():
+                    # 루트 요소 영역을 슬라이드 너비 x deviceScaleFactor로 캡처 (PNG가 곧 슬라이드 크기)
+                    result = self.backend.render(temp_html_path, SLIDE_SIZE, fit_content=False,
+                                                 scale=self.device_scale, clip_selector=self.clip_selector)
+                    self.report_overflow(html_file, root_overflow(result['metrics'], SLIDE_SIZE))
+                elif self.render_size:
+                    # 고정 슬라이드 뷰포트 + deviceScaleFactor로 출력 크기 그대로 캡처
+                    result = self.backend.render(temp_html_path, SLIDE_SIZE, fit_content=False,
+                                                 scale=self.device_scale)
+                    if result['metrics']:
+                        self.report_overflow(html_file, slide_overflow(result['metrics'], SLIDE_SIZE[1]))
+                    else:
+                        # 페이지를 측정할 수 없는 백엔드는 추정 높이로 넘침 여부 보고
+                        self.report_overflow(html_file, calculated_height - SLIDE_SIZE[1])
+                else:
+                    # 실제 DOM 높이로 뷰포트를 맞춰 캡처 (calculated_height는 초기 높이)
+                    result = self.backend.render(temp_html_path, (SLIDE_SIZE[0], calculated_height))
+                
+                self.report_requests(html_file, self.backend.take_request_log())
+                
+                # 브라우저 로드/대기/측정/스크린샷 단계를 render span 아래에 기록
+                self.tracer.record('render', render_start, time.perf_counter() - render_start)
+                timings = result['timings']
+                self.tracer.record_timings(render_start, timings, prefix='render.')
+                stage_times = [f"{name} {value}ms" for name, value in timings.items() if name.endswith('_ms')]
+                if stage_times:
+                    print("  렌더 시간: " + ", ".join(stage_times))
+                
+                slide_png = self.finish_slide(result['png'])
+                
+                # 임시 HTML 파일 삭제
+                if temp_html_path.exists():
+                    temp_html_path.unlink()
+                
+                return slide_png
+            
+        except Exception as e:
+            print(f"HTML 변환 오류 ({html_file}): {e}")
+            return None
+    
+    def create_pptx(self, slide_source, slide_count, slide_tags=None):
+        """렌더링되는 슬라이드 이미지(PNG bytes)를 도착하는 대로 추가하여 PPTX 생성
+
+        slide_source: (슬라이드 인덱스, PNG bytes 또는 None)을 완료 순서대로 내보내는 iterable
+        slide_count: 전체 슬라이드 수
+        slide_tags: 슬라이드별 (HTML 파일명, 내용 키) 리스트 (다음 증분 빌드에서 바뀐 슬라이드를 찾는 데 사용)
+        """
+        try:
+            # 새 프레젠테이션 생성
+            prs = Presentation()
+            
+            # 슬라이드 크기 설정 (16:9 비율) - 더 큰 크기로 설정
+            prs.slide_width = Inches(20)   # 1920px (1인치 = 75px 기준)
+            prs.slide_height = Inches(11.25)  # 1080px
+            
+            print(f"PPT 슬라이드 크기: {prs.slide_width} x {prs.slide_height}")
+            
+            added = {}  # 슬라이드 인덱스 -> 추가된 슬라이드
+            
+            def add_slide(i, image_data):
+                if not image_data:
+                    print(f"슬라이드 {i+1} 이미지 없음")
+                    return
+                
+                slide_name = slide_tags[i][0] if slide_tags else f"슬라이드 {i+1}"
+                
+                # 빈 슬라이드 추가
+                slide_layout = prs.slide_layouts[6]  # 빈 레이아웃
+                with self.tracer.span('add_slide', slide=slide_name):
+                    slide = prs.slides.add_slide(slide_layout)
+                
+                # 이미지 추가 - 슬라이드 전체 크기로 설정
+                left = Inches(0)
+                top = Inches(0)
+                width = Inches(20)   # 1920px
+                height = Inches(11.25)  # 1080px
+                
+                # 이미지 삽입 (메모리의 PNG를 파일 없이 바로 사용)
+                with self.tracer.span('add_picture', slide=slide_name):
+                    picture = slide.shapes.add_picture(io.BytesIO(image_data), left, top, width, height)
+                
+                # 이미지가 슬라이드를 완전히 채우도록 설정
+                picture.left = 0
+                picture.top = 0
+                picture.width = prs.slide_width
+                picture.height = prs.slide_height
+                
+                # 증분 빌드용 태그 (원본 HTML 파일명, 내용 키)
+                if slide_tags:
+                    tag_slide(slide, *slide_tags[i])
+                
+                added[i] = slide
+                print(f"슬라이드 {i+1} 추가 완료 - 크기: {picture.width} x {picture.height}")
+            
+            # 렌더링은 백그라운드 스레드에서 계속하고, 완료된 슬라이드는 바로 추가한 뒤 PNG 버퍼 해제
+            stream_slides(slide_source, add_slide, self.queue_size)
+            
+            # 완료 순서대로 추가된 슬라이드를 HTML 파일 순서로 정렬
+            with self.tracer.span('reorder_slides'):
+                reorder_slides(prs, [added[i] for i in sorted(added)])
+            print(f"추가된 슬라이드: {len(added)}/{slide_count}개")
+            
+            # PPTX 파일 저장
+            with self.tracer.span('prs.save'):
+                prs.save(self.output_path)
+            print(f"PPTX 파일 저장 완료: {self.output_path}")
+            
+        except Exception as e:
+            print(f"PPTX 생성 오류: {e}")
+            raise
+    
+    def iter_slides_concurrently(self, html_files):
+        """한 브라우저의 여러 탭에서 슬라이드를 병렬 렌더링 (완료 순서대로 (인덱스, PNG bytes) 반환)"""
+        if self.browser_pool is not None:
+            with self.browser_pool.acquire() as browser:
+                for item in iter_slides_concurrently(self, html_files, self.concurrency,
+                                                     browser_url=browser.debugger_url):
+                    # 워커가 DevTools로 직접 로드하므로 풀의 재시작 기준에 쓸 페이지 수를 직접 셈
+                    browser.pages_served += 1
+                    yield item
+            return
+        yield from iter_slides_concurrently(self, html_files, self.concurrency)
+    
+    def farm_backend(self):
+        """렌더 팜 워커가 사용할 렌더러 (render_farm.RENDERERS의 이름)"""
+        return 'puppeteer' if self.backend.name == 'puppeteer' else 'chrome'
+    
+    def renders_combined(self):
+        """통합 문서 렌더링 사용 여부 (clip 캡처를 지원하는 백엔드만, 병렬 탭/프로세스 설정보다 우선)"""
+        return self.combined and self.backend.supports_clips
+    
+    def iter_slides_combined(self, html_files):
+        """HTML 파일들을 통합 문서 하나로 만들어 한 번 로드하고 슬라이드 상자마다 clip 캡처하며 (인덱스, PNG bytes) 반환"""
+        print(f"통합 문서 렌더링: 슬라이드 {len(html_files)}개를 한 페이지로 로드")
+        with self.tracer.span('build_combined_document'):
+            html_contents = [html_file.read_text(encoding='utf-8') for html_file in html_files]
+            combined_html = self.rewrite_assets(build_combined_document(html_contents, SLIDE_SIZE))
+            combined_path = self.temp_dir / "temp_combined.html"
+            combined_path.write_text(combined_html, encoding='utf-8')
+        
+        captured = set()
+        try:
+            with self.backend:
+                for index, png_data, overflow, timings in self.backend.capture_clips(
+                        combined_path, SLIDE_SIZE, SLIDE_BOX_SELECTOR, scale=self.device_scale):
+                    html_file = html_files[index]
+                    with self.tracer.slide(html_file.name):
+                        # 캡처가 끝난 시점에서 거슬러 올라가 기록 (첫 슬라이드에는 통합 문서 로드/대기/측정 포함)
+                        render_ms = sum(value for name, value in timings.items() if name.endswith('_ms'))
+                        self.tracer.record_timings(time.perf_counter() - render_ms / 1000, timings, prefix='render.')
+                        print(f"변환 중: {html_file.name} -> 슬라이드 {index + 1} (clip)")
+                        self.report_overflow(html_file.name, overflow)
+                        try:
+                            slide_png = self.finish_slide(png_data)
+                        except Exception as e:
+                            print(f"이미지 후처리 오류 ({html_file.name}): {e}")
+                            slide_png = None
+                    captured.add(index)
+                    yield index, slide_png
+        except Exception as e:
+            print(f"통합 문서 렌더링 오류: {e}")
+        finally:
+            if combined_path.exists():
+                combined_path.unlink()
+            # 통합 문서의 요청은 슬라이드를 구분할 수 없으므로 문서 단위로 기록
+            self.report_requests(combined_path.name, self.backend.take_request_log())
+        
+        # 상자를 찾지 못했거나 중간에 실패한 슬라이드는 비워 둠
+        for index in range(len(html_files)):
+            if index not in captured:
+                yield index, None
+    
+    def iter_html_files(self, html_files):
+        """HTML 파일들을 슬라이드 이미지(PNG bytes)로 렌더링하며 완료되는 대로 (인덱스, PNG bytes) 반환"""
+        if self.renders_combined():
+            yield from self.iter_slides_combined(html_files)
+        elif self.processes > 1:
+            yield from iter_slides_in_processes(self, html_files, self.processes, backend=self.farm_backend())
+        elif self.renders_in_tabs():
+            yield from self.iter_slides_concurrently(html_files)
+        else:
+            # 렌더가 끝나면 백엔드 종료 (공유 브라우저 풀은 유지)
+            with self.backend:
+                for i, html_file in enumerate(html_files):
+                    yield i, self.convert_html_to_image(html_file.name, i + 1)
+    
+    def render_html_files(self, html_files):
+        """HTML 파일들을 슬라이드 이미지(PNG bytes)로 렌더링 (결과는 슬라이드 순서 유지)"""
+        return collect_slides(self.iter_html_files(html_files), len(html_files))
+    
+    def render_with_cache(self, html_files):
+        """렌더 캐시 hit은 바로 사용하고 miss인 슬라이드만 render_html_files로 렌더링"""
+        return render_with_cache(self.render_cache, html_files, self.cache_settings(), self.render_html_files)
+    
+    def iter_with_cache(self, html_files):
+        """render_with_cache의 스트리밍 버전 (슬라이드를 완료 순서대로 (인덱스, PNG bytes)로 반환)"""
+        return iter_with_cache(self.render_cache, html_files, self.cache_settings(), self.iter_html_files)
+    
+    def cache_settings(self):
+        """렌더 캐시 키에 포함할 렌더 설정 (같은 HTML이라도 설정이 바뀌면 다시 렌더링)"""
+        if self.renders_combined():
+            backend = self.backend.cache_name
+        elif self.processes > 1:
+            backend = self.farm_backend()
+        else:
+            backend = self.backend.cache_name
+        settings = {
+            'converter': type(self).__name__,
+            'backend': backend,
+            'slide_width': 1920,
+            'render_size': self.render_size,
+            'device_scale': self.device_scale,
+        }
+        if self.asset_mirror is not None:
+            # 로컬 static/ 자산으로 렌더링한 결과는 CDN으로 렌더링한 결과와 따로 캐시
+            settings['offline_assets'] = self.asset_mirror.fingerprint()
+        if self.css_purger is not None and self.css_purger.purged_path is not None:
+            # 줄인 스타일시트로 렌더링한 결과는 그 스타일시트 내용으로 따로 캐시 (덱 클래스 구성이나 원본이 바뀌면 다시 렌더링)
+            settings['purged_css'] = self.css_purger.fingerprint()
+        if self.renders_combined():
+            # 고정 1920x1080 상자로 clip 캡처한 결과는 페이지별 렌더링 결과와 따로 캐시
+            settings['combined'] = True
+        elif self.clips_to_root():
+            # 루트 요소 영역만 캡처한 결과는 뷰포트 캡처 결과와 따로 캐시 (선택자가 바뀌어도 다시 렌더링)
+            settings['clip_selector'] = self.clip_selector
+        if self.freeze_animations:
+            # 애니메이션 끝 상태로 캡처한 결과는 애니메이션 도중에 캡처될 수 있는 결과와 따로 캐시
+            settings['freeze_animations'] = self.virtual_time_ms
+        if self.request_policy is not None:
+            # 요청을 차단/바꿔쓴 결과는 정책 규칙이 바뀌면 다시 렌더링
+            settings['request_policy'] = self.request_policy.to_dicts()
+        return settings
+    
+    def reset_run_state(self):
+        """실행마다 새로 모으는 기록 초기화 (watch 모드 재빌드에서 이전 실행의 기록이 쌓이지 않도록)"""
+        self.overflow_slides = []
+        self.request_log_slides = []
+        self.tracer = StageTracer(enabled=self.trace_path is not None)
+    
+    def convert(self):
+        """전체 변환 프로세스 실행"""
+        self.reset_run_state()
+        try:
+            # HTML 파일 목록 가져오기
+            html_files = sorted([f for f in self.html_dir.glob("*.html")])
+            
+            if not html_files:
+                print("HTML 파일을 찾을 수 없습니다.")
+                return False
+            
+            print(f"발견된 HTML 파일: {len(html_files)}개 (렌더 백엔드: {self.backend.name})")
+            if self.combined and not self.renders_combined():
+                print(f"{self.backend.name} 백엔드는 clip 캡처를 지원하지 않아 슬라이드마다 따로 렌더링합니다.")
+            if (self.concurrency > 1 and self.processes <= 1 and not self.renders_combined()
+                    and not self.renders_in_tabs()):
+                print(f"{self.backend.name} 백엔드는 병렬 탭 렌더링을 지원하지 않아 순차 렌더링합니다 "
+                      "(병렬 탭은 puppeteer 백엔드만 지원).")
+            if (self.request_policy is not None and self.backend.request_policy is None
+                    and not self.measures_in_browser()):
+                print(f"{self.backend.name} 백엔드는 요청을 가로챌 수 없어 요청 정책 없이 렌더링합니다.")
+            for html_file in html_files:
+                print(f"  - {html_file.name}")
+            
+            # 임시 디렉토리 설정
+            self.setup_temp_directory()
+            
+            # 오프라인 자산 서버 시작 (렌더 워커 프로세스의 브라우저도 loopback으로 접속)
+            if self.asset_mirror is not None:
+                self.asset_mirror.start()
+            
+            # 덱 전체 HTML에서 쓰는 클래스로 Tailwind 스타일시트 축소 (클래스 집합이 같으면 캐시 사용)
+            if self.css_purger is not None:
+                with self.tracer.span('purge_tailwind'):
+                    self.css_purger.purge_for(html_files)
+            
+            settings = self.cache_settings()
+            with self.tracer.span('render_key'):
+                slide_keys = [render_key(html_file, settings) for html_file in html_files]
+            
+            if self.incremental and self.output_path.exists():
+                # 기존 PPTX에서 바뀐 슬라이드만 교체 (렌더링도 바뀐 슬라이드만)
+                with self.tracer.span('patch_pptx'):
+                    patched = patch_pptx(self.output_path, html_files, slide_keys, self.render_with_cache)
+            else:
+                patched = None
+            
+            if patched is None:
+                # HTML 파일들을 렌더링하면서 완료된 슬라이드부터 바로 PPTX에 추가 (렌더 캐시 hit은 브라우저 없이 바로 사용)
+                # 다음 증분 빌드를 위해 슬라이드마다 파일명과 내용 키 태그 저장
+                slide_tags = [(html_file.name, key) for html_file, key in zip(html_files, slide_keys)]
+                self.create_pptx(self.iter_with_cache(html_files), len(html_files), slide_tags)
+            
+            if self.request_log_slides:
+                print(f"요청 정책으로 차단/바꿔쓴 요청이 있는 슬라이드 {len(self.request_log_slides)}개:")
+                for name, request_log in self.request_log_slides:
+                    print(f"  - {name}: {len(request_log)}개")
+            
+            if self.overflow_slides:
+                print(f"슬라이드 높이를 넘친 슬라이드 {len(self.overflow_slides)}개:")
+                for name, overflow in self.overflow_slides:
+                    print(f"  - {name}: +{overflow}px")
+            
+            return True
+            
+        except Exception as e:
+            print(f"변환 프로세스 오류: {e}")
+            return False
+        
+        finally:
+            # 임시 디렉토리 정리
+            self.cleanup_temp_directory()
+            
+            if self.asset_mirror is not None:
+                self.asset_mirror.close()
+            
+            # 단계별 시간 트레이스 저장 (trace_path를 지정한 경우)
+            if self.tracer.enabled:
+                self.tracer.write(self.trace_path)
+                self.tracer.print_summary()
+
+def run_main(converter_cls, title, output_name, default_pool_size=0, choose_backend=False):
+    """변환기 스크립트 공통 main (명령행 옵션 해석, 캐시/자산/요청 정책/브라우저 풀 준비 후 변환 실행)
+    
+    converter_cls: SlideConverter 또는 렌더 백엔드를 정해 둔 하위 클래스
+    output_name: DEFAULT_OUTPUT_DIR 아래에 저장할 PPTX 파일 이름
+    choose_backend=True이면 --backend=이름으로 렌더 백엔드를 선택 (SlideConverter 전용)
+    """
+    args = sys.argv[1:]
+    values = dict(arg[2:].split('=', 1) for arg in args if arg.startswith('--') and '=' in arg)
+    
+    # 설정
+    html_dir = DEFAULT_HTML_DIR
+    output_path = os.path.join(DEFAULT_OUTPUT_DIR, output_name)
+    # 렌더 백엔드 (html2image, selenium, puppeteer, cdp), --backend=이름으로 변경
+    backend = values.get('backend', DEFAULT_BACKEND) if choose_backend else None
+    # 공유 브라우저 풀 크기 (0이면 백엔드가 브라우저를 직접 실행, html2image는 사용 안 함), --pool-size=N으로 변경
+    pool_size = int(values.get('pool-size', default_pool_size))
+    concurrency = int(values.get('concurrency', 1))  # 동시에 렌더링할 탭 수 (1이면 순차 렌더링, puppeteer 백엔드만)
+    processes = int(values.get('processes', 1))  # 렌더 워커 프로세스 수 (1보다 크면 프로세스마다 브라우저 실행)
+    render_size = values.get('render-size')  # 출력 픽셀 크기 ('1080p', '720p', '2x'), None이면 렌더 후 리사이즈
+    use_cache = '--no-cache' not in args  # 렌더 캐시 사용 여부 (--no-cache로 끄기)
+    incremental = '--incremental' in args  # 기존 PPTX에서 바뀐 슬라이드만 교체
+    watch = '--watch' in args  # HTML/static 변경을 감시하며 바뀐 슬라이드만 다시 빌드
+    queue_size = 8  # 렌더 완료 후 PPTX 조립을 기다리는 슬라이드 최대 수 (메모리 상한)
+    # 단계별 시간 트레이스 저장 위치 (--trace로 켜기, chrome://tracing 또는 Perfetto에서 열기)
+    trace_path = Path(output_path).parent / 'trace.json' if '--trace' in args else None
+    offline = '--offline' in args  # CDN 자산을 static/과 로컬 폰트 캐시에서 제공 (폐쇄망 빌드)
+    purge_css = '--purge-css' in args  # 덱에서 쓰는 Tailwind 규칙만 남긴 스타일시트로 렌더링 (--purge-css로 켜기)
+    combined = '--combined' in args  # 폴더 전체를 한 페이지로 로드하고 슬라이드마다 clip 캡처 (selenium, cdp)
+    # 슬라이드 루트 요소 영역만 캡처 (--clip으로 켜기, --clip=선택자로 변경), 리사이즈/크롭 없이 슬라이드 크기 그대로
+    clip_selector = values.get('clip', '.slide-container' if '--clip' in args else None)
+    # 애니메이션/트랜지션을 끄고 가상 시간으로 타이머를 빨리 감아 애니메이션 완료를 기다리지 않음
+    freeze = '--freeze-animations' in args
+    # 분석/추적 요청 차단 (--block-requests로 켜기), 규칙 파일을 지정하면 그 규칙 사용 (--request-policy=파일)
+    block_requests = '--block-requests' in args
+    request_policy_file = values.get('request-policy')  # 요청 정책 JSON 파일 (allow/deny/rewrite 규칙 리스트)
+    
+    if watch and pool_size == 0 and 'pool-size' not in values and backend != 'html2image':
+        # watch 모드는 재빌드마다 Chrome을 새로 띄우지 않도록 브라우저 풀 하나를 유지 (--pool-size=0이면 사용 안 함)
+        pool_size = 1
+    
+    if choose_backend and backend not in BACKENDS:
+        print(f"지원하지 않는 렌더 백엔드: {backend} (사용 가능: {', '.join(BACKENDS)})")
+        sys.exit(1)
+    
+    print(f"{title} 시작" + (f" (렌더 백엔드: {backend})" if choose_backend else ""))
+    print(f"HTML 디렉토리: {html_dir}")
+    print(f"출력 파일: {output_path}")
+    print("-" * 50)
+    
+    if request_policy_file:
+        request_policy = RequestPolicy.from_file(request_policy_file)
+    else:
+        request_policy = RequestPolicy.default() if block_requests else None
+    options = dict(concurrency=concurrency, processes=processes, render_size=render_size,
+                   render_cache=RenderCache() if use_cache else None, incremental=incremental,
+                   queue_size=queue_size, trace_path=trace_path,
+                   asset_mirror=AssetMirror() if offline else None,
+                   css_purger=TailwindPurger() if purge_css else None, combined=combined,
+                   clip_selector=clip_selector, freeze_animations=freeze, request_policy=request_policy)
+    if choose_backend:
+        options['backend'] = backend
+    
+    # 변환기 생성 및 실행 (watch 모드는 같은 변환기와 브라우저 풀로 계속 재빌드)
+    if pool_size > 0 and backend != 'html2image':
+        with BrowserPool(pool_size=pool_size) as browser_pool:
+            converter = converter_cls(html_dir, output_path, browser_pool=browser_pool, **options)
+            success = watch_and_rebuild(converter) if watch else converter.convert()
+    else:
+        converter = converter_cls(html_dir, output_path, **options)
+        success = watch_and_rebuild(converter) if watch else converter.convert()
+    
+    if success:
+        print("-" * 50)
+        print("변환 완료!")
+        print(f"출력 파일: {output_path}")
+    else:
+        print("-" * 50)
+        print("변환 실패!")
+        sys.exit(1)
+
+def main():
+    run_main(SlideConverter, "HTML to PPTX 변환기", "smart_gate_pptx.pptx", default_pool_size=2, choose_backend=True)
+
+if __name__ == "__main__":
+    main()
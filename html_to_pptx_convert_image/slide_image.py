@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slide Image
+캡처한 PNG를 파일로 저장하지 않고 메모리(bytes)에서 슬라이드 크기로 맞추는 공용 모듈
+슬라이드마다 디코딩/인코딩은 최대 한 번만 하고, 결과 bytes는 BytesIO로 PPTX에 바로 삽입한다.
+"""
+
+import io
+import struct
+
+from PIL import Image
+
+# 기본 설정
+SLIDE_SIZE = (1920, 1080)  # PPT 슬라이드 이미지 크기 (HTML 슬라이드 설계 기준 CSS 크기)
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 브라우저가 바로 렌더링할 수 있는 출력 크기 (deviceScaleFactor = 출력 너비 / 1920)
+RENDER_SIZES = {
+    '1080p': (1920, 1080),
+    '720p': (1280, 720),
+    '2x': (3840, 2160),
+}
+
+
+def device_scale_for(render_size, css_size=SLIDE_SIZE):
+    """CSS 슬라이드 크기를 render_size 픽셀로 렌더링하기 위한 deviceScaleFactor
+
+    render_size는 (너비, 높이) 또는 RENDER_SIZES의 이름. 화면 비율이 다르면 ValueError.
+    """
+    width, height = RENDER_SIZES.get(render_size, render_size)
+    scale = width / css_size[0]
+    if round(css_size[1] * scale) != height:
+        raise ValueError(f"렌더 크기 {width}x{height}는 슬라이드 비율({css_size[0]}x{css_size[1]})과 다릅니다.")
+    return scale
+
+
+def resolve_render_size(render_size):
+    """RENDER_SIZES 이름 또는 (너비, 높이)를 (너비, 높이) 튜플로 변환 (None은 그대로)"""
+    if render_size is None:
+        return None
+    return tuple(RENDER_SIZES.get(render_size, render_size))
+
+
+def png_size(png_data):
+    """PNG 헤더(IHDR)에서 이미지 크기를 읽음 (디코딩 없음)"""
+    if png_data[:8] != PNG_SIGNATURE:
+        raise ValueError("PNG 데이터가 아닙니다.")
+    return struct.unpack('>II', png_data[16:24])
+
+
+def fit_png_to_slide(png_data, target_size=SLIDE_SIZE):
+    """PNG bytes를 슬라이드 크기에 맞게 리사이즈/크롭/패딩하여 PNG bytes로 반환
+
+    규칙은 기존 resize_image_to_fit와 같다 (너비 기준 리사이즈, 상단부터 크롭, 부족하면 흰색 패딩).
+    이미 목표 크기이면 디코딩하지 않고 그대로 반환한다.
+    """
+    target_width, target_height = target_size
+    if png_size(png_data) == (target_width, target_height):
+        return png_data
+
+    with Image.open(io.BytesIO(png_data)) as img:
+        original_width, original_height = img.size
+
+        # 원본 비율 계산
+        original_ratio = original_width / original_height
+        target_ratio = target_width / target_height
+
+        if original_ratio > target_ratio:
+            # 원본이 더 넓은 경우 - 높이를 기준으로 리사이즈
+            new_height = target_height
+            new_width = int(target_height * original_ratio)
+        else:
+            # 원본이 더 높은 경우 - 너비를 기준으로 리사이즈
+            new_width = target_width
+            new_height = int(target_width / original_ratio)
+
+        print(f"리사이즈 크기: {new_width}x{new_height}")
+        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+    # 너비가 더 긴 경우 중앙에서, 높이가 더 긴 경우 상단부터 크롭 (위쪽이 잘리지 않도록)
+    left = (new_width - target_width) // 2 if new_width > target_width else 0
+    right = left + target_width
+    bottom = min(new_height, target_height)
+    cropped_img = resized_img.crop((left, 0, right, bottom))
+
+    # 최종 크기가 목표 크기가 되도록 흰색 배경 중앙에 붙이기 (필요시)
+    if cropped_img.size != (target_width, target_height):
+        final_img = Image.new('RGB', (target_width, target_height), 'white')
+        paste_x = (target_width - cropped_img.width) // 2
+        paste_y = (target_height - cropped_img.height) // 2
+        final_img.paste(cropped_img, (paste_x, paste_y))
+        cropped_img = final_img
+
+    buffer = io.BytesIO()
+    cropped_img.save(buffer, 'PNG')
+    return buffer.getvalue()
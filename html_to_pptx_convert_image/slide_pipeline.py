@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slide Pipeline
+렌더링과 PPTX 조립을 겹쳐 실행하는 생산자/소비자 파이프라인
+생산자 스레드가 렌더된 슬라이드를 크기가 제한된 큐에 넣고, 호출한 스레드(소비자)는 도착하는 대로
+프레젠테이션에 추가한 뒤 PNG 버퍼를 바로 놓아준다. 큐가 가득 차면 렌더링이 잠시 멈추므로
+슬라이드 수가 많아도 대기 중인 이미지는 큐 크기 이상으로 쌓이지 않는다.
+"""
+
+import queue
+import threading
+
+# 기본 설정
+DEFAULT_QUEUE_SIZE = 8  # 렌더 완료 후 조립을 기다리는 슬라이드 최대 수
+QUEUE_POLL_SECONDS = 0.1  # 큐 대기 중 중단 요청(Ctrl+C 등)을 확인하는 주기
+
+_DONE = object()  # 생산자 종료 표시
+
+
+def _produce(slide_source, slides, stop):
+    """생산자 스레드: slide_source의 (인덱스, PNG bytes) 항목을 큐에 넣음"""
+    try:
+        for item in slide_source:
+            # 큐가 가득 차면 소비자가 꺼낼 때까지 대기 (중단 요청 시 렌더링 중지)
+            while not stop.is_set():
+                try:
+                    slides.put(item, timeout=QUEUE_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set():
+                break
+    except Exception as e:
+        slides.put(e)
+    finally:
+        # 남은 렌더 작업 정리 (브라우저 반납, 워커 종료 등)
+        close = getattr(slide_source, 'close', None)
+        if close is not None:
+            close()
+        slides.put(_DONE)
+
+
+def stream_slides(slide_source, add_slide, queue_size=DEFAULT_QUEUE_SIZE):
+    """slide_source를 백그라운드 스레드에서 렌더링하면서 도착하는 슬라이드를 add_slide로 바로 조립
+
+    slide_source: (슬라이드 인덱스, PNG bytes 또는 None)을 완료 순서대로 내보내는 iterable
+    add_slide: (인덱스, PNG bytes 또는 None)을 받는 함수 (호출한 스레드에서 실행)
+    생산자에서 발생한 예외는 호출한 스레드에서 다시 발생시킨다.
+    """
+    slides = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    producer = threading.Thread(target=_produce, args=(slide_source, slides, stop),
+                                name='slide-producer', daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            try:
+                item = slides.get(timeout=QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            index, png_data = item
+            # 조립 후 참조를 끊어 PNG 버퍼를 바로 해제
+            item = None
+            add_slide(index, png_data)
+            png_data = None
+    finally:
+        if producer.is_alive():
+            # 조립 오류나 중단 시: 생산자를 멈추고 큐를 비워 대기 중인 put을 풀어줌
+            stop.set()
+            while producer.is_alive():
+                try:
+                    slides.get(timeout=QUEUE_POLL_SECONDS)
+                except queue.Empty:
+                    pass
+        producer.join()
+
+
+def collect_slides(slide_source, count):
+    """(인덱스, PNG bytes) 항목들을 슬라이드 순서의 리스트로 모음 (받지 못한 슬라이드는 None)"""
+    slide_images = [None] * count
+    for index, png_data in slide_source:
+        slide_images[index] = png_data
+    return slide_images
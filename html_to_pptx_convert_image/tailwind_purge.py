@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tailwind Purge
+덱의 HTML에서 사용하는 클래스 이름을 모아 tailwind.min.css에서 해당 규칙과 base/preflight만 남긴
+덱 전용 스타일시트를 만들고, 슬라이드가 원본 대신 이 스타일시트로 렌더링되도록 link를 바꿔 쓰는 모듈
+(2.9MB 전체 스타일시트를 슬라이드마다 파싱/매칭하지 않도록 하여 스타일 계산 시간을 줄임)
+
+결과는 덱의 클래스 집합 해시로 디스크에 캐시하므로, 클래스 구성이 같으면 다시 만들지 않는다.
+"""
+
+import hashlib
+import re
+import tempfile
+from pathlib import Path
+
+# 기본 설정
+DEFAULT_STYLESHEET = Path(__file__).resolve().parent / 'static' / 'tailwind.min.css'
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'html_to_pptx' / 'purged_css'
+PURGE_FORMAT_VERSION = 1  # 선택 규칙이 바뀌면 올려서 기존 캐시를 무효화
+MAX_CACHED_STYLESHEETS = 32  # 캐시에 남길 덱 스타일시트 수 (오래 쓰지 않은 것부터 삭제)
+
+# Tailwind 기본 추출기와 같은 방식: 따옴표/공백/꺾쇠로 나눈 모든 토큰을 클래스 후보로 사용
+# (class 속성뿐 아니라 스크립트에서 추가하는 클래스도 남기기 위함)
+CLASS_TOKEN_PATTERN = re.compile(r'''[^<>"'`\s]*[^<>"'`\s:]''')
+# 선택자 안의 클래스 (.name, 이스케이프 포함: .md\:flex, .w-1\/2, .\32xl\:container)
+SELECTOR_CLASS_PATTERN = re.compile(r'\.((?:\\[0-9a-fA-F]{1,6}\s?|\\.|[\w-])+)')
+CSS_ESCAPE_PATTERN = re.compile(r'\\([0-9a-fA-F]{1,6})\s?|\\(.)')
+# 중괄호 구조 분석용 토큰 (문자열과 주석 안의 중괄호는 무시)
+CSS_TOKEN_PATTERN = re.compile(r'''/\*.*?\*/|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|[{}]''', re.DOTALL)
+ANIMATION_NAME_PATTERN = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+# HTML에서 Tailwind 스타일시트를 가리키는 link href (CDN, 로컬 static/, 자산 서버 URL)
+TAILWIND_HREF_PATTERN = re.compile(r'''(<link\b[^>]*\bhref\s*=\s*["'])([^"']*tailwind(?:\.min)?\.css)(["'])''',
+                                   re.IGNORECASE)
+
+
+def _unescape_css(name):
+    """CSS 식별자 이스케이프 해제 (\\: -> :, \\32 -> 2)"""
+    def replace(match):
+        if match.group(1):
+            return chr(int(match.group(1), 16))
+        return match.group(2)
+    return CSS_ESCAPE_PATTERN.sub(replace, name)
+
+
+def parse_css_blocks(css):
+    """CSS를 최상위 블록 리스트로 분석
+
+    반환값: [(머리말, 본문 또는 None), ...]
+    - 일반 규칙: (선택자, 선언)
+    - @media 등: (at-rule 머리말, 안쪽 CSS 문자열)
+    - 본문 없는 at-rule(@charset, @import)과 보존 주석(/*! */): (텍스트, None)
+    """
+    blocks = []
+    depth = 0
+    start = 0  # 현재 블록 머리말 시작 위치
+    body_start = 0
+    for match in CSS_TOKEN_PATTERN.finditer(css):
+        token = match.group()
+        if token.startswith('/*'):
+            if depth == 0:
+                prelude = css[start:match.start()].strip()
+                if prelude:
+                    blocks.append((prelude, None))
+                if token.startswith('/*!'):
+                    blocks.append((token, None))
+                start = match.end()
+        elif token == '{':
+            if depth == 0:
+                body_start = match.end()
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                prelude = css[start:body_start - 1].strip()
+                blocks.append((prelude, css[body_start:match.start()]))
+                start = match.end()
+            elif depth < 0:
+                depth = 0
+                start = match.end()
+
+    # 본문 없는 at-rule (@charset "..."; @import ...;)
+    rest = css[start:].strip()
+    if rest:
+        blocks.append((rest, None))
+
+    # ';'로 끝나는 본문 없는 at-rule이 다음 규칙 머리말에 붙은 경우 분리
+    split_blocks = []
+    for prelude, body in blocks:
+        while body is not None and prelude.startswith('@') and ';' in prelude:
+            statement, prelude = prelude.split(';', 1)
+            split_blocks.append((statement + ';', None))
+            prelude = prelude.strip()
+        split_blocks.append((prelude, body))
+    return split_blocks
+
+
+def split_selectors(selector_text):
+    """선택자 목록을 최상위 쉼표로 분리 (:not(a,b) 안의 쉼표는 무시)"""
+    selectors = []
+    depth = 0
+    current = []
+    for char in selector_text:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == ',' and depth == 0:
+            selectors.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    selectors.append(''.join(current).strip())
+    return [selector for selector in selectors if selector]
+
+
+def selector_classes(selector):
+    """선택자가 요구하는 클래스 이름 집합 (이스케이프 해제)"""
+    # 속성 선택자 안의 값([class~="a.b"])은 클래스로 보지 않음
+    selector = re.sub(r'\[[^\]]*\]', '', selector)
+    return {_unescape_css(name) for name in SELECTOR_CLASS_PATTERN.findall(selector)}
+
+
+def used_class_names(html_contents):
+    """HTML 내용들에서 클래스 이름 후보 집합 추출"""
+    names = set()
+    for html_content in html_contents:
+        names.update(CLASS_TOKEN_PATTERN.findall(html_content))
+    return names
+
+
+def _purge_blocks(blocks, used):
+    """사용하는 클래스에 맞는 규칙만 남긴 CSS 조각 리스트와 사용된 animation 이름 집합"""
+    kept = []
+    animations = set()
+    for prelude, body in blocks:
+        if body is None:
+            kept.append(prelude)
+            continue
+
+        if prelude.startswith('@'):
+            at_rule = prelude.split(None, 1)[0].lower()
+            if at_rule in ('@media', '@supports', '@layer', '@document'):
+                inner, inner_animations = _purge_blocks(parse_css_blocks(body), used)
+                if inner:
+                    kept.append(f"{prelude}{{{''.join(inner)}}}")
+                    animations.update(inner_animations)
+            elif at_rule.endswith('keyframes'):
+                # 사용된 animation이 참조할 때만 남김 (아래에서 다시 거름)
+                kept.append((prelude.split(None, 1)[1].strip() if ' ' in prelude else '', f"{prelude}{{{body}}}"))
+            else:
+                # @font-face, @page 등은 그대로 유지
+                kept.append(f"{prelude}{{{body}}}")
+            continue
+
+        # 클래스가 없는 선택자(base/preflight, 요소/속성/* 선택자)는 항상 유지
+        selectors = [selector for selector in split_selectors(prelude) if selector_classes(selector) <= used]
+        if selectors:
+            kept.append(f"{','.join(selectors)}{{{body}}}")
+            for value in ANIMATION_NAME_PATTERN.findall(body):
+                animations.update(re.findall(r'[\w-]+', value))
+    return kept, animations
+
+
+def purge_css(css, used):
+    """CSS에서 used 클래스 집합에 맞는 규칙과 base/preflight만 남긴 CSS 반환"""
+    kept, animations = _purge_blocks(parse_css_blocks(css), used)
+    parts = []
+    for item in kept:
+        if isinstance(item, tuple):
+            name, text = item
+            if name in animations:
+                parts.append(text)
+        else:
+            parts.append(item)
+    # 보존 주석(라이선스)은 원래 위치에 한 줄씩
+    return ''.join(f"{part}\n" if part.startswith('/*!') else part for part in parts)
+
+
+def rewrite_tailwind_links(html_content, stylesheet_url):
+    """HTML의 Tailwind 스타일시트 link href를 stylesheet_url로 교체
+
+    반환값: (바뀐 HTML, 교체 횟수)
+    """
+    return TAILWIND_HREF_PATTERN.subn(lambda match: f"{match.group(1)}{stylesheet_url}{match.group(3)}", html_content)
+
+
+class TailwindPurger:
+    """덱 단위로 사용하지 않는 Tailwind 규칙을 제거한 스타일시트를 만들고 클래스 집합 해시로 캐시
+
+    사용 예:
+        purger = TailwindPurger()
+        stylesheet = purger.purge_for(html_files)  # 덱 전체 HTML 기준 (한 번)
+        html = purger.rewrite_html(html)           # 슬라이드마다 link 교체
+    """
+
+    def __init__(self, stylesheet=DEFAULT_STYLESHEET, cache_dir=DEFAULT_CACHE_DIR):
+        self.stylesheet = Path(stylesheet)
+        self.cache_dir = Path(cache_dir)
+        self.purged_path = None  # 현재 덱의 스타일시트 (purge_for 이후)
+
+    def cache_key(self, used):
+        """원본 스타일시트 내용과 클래스 집합으로 캐시 키(sha256 hex) 계산"""
+        digest = hashlib.sha256()
+        digest.update(f"format:{PURGE_FORMAT_VERSION}\n".encode('utf-8'))
+        digest.update(hashlib.sha256(self.stylesheet.read_bytes()).digest())
+        digest.update('\n'.join(sorted(used)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def purge_for(self, html_files):
+        """덱의 HTML 파일들에서 쓰는 클래스로 줄인 스타일시트 경로 반환 (캐시에 있으면 그대로 사용)
+
+        Tailwind 스타일시트를 참조하는 HTML이 없으면 None (link를 바꿔 쓰지 않음)
+        """
+        html_contents = [Path(html_file).read_text(encoding='utf-8') for html_file in html_files]
+        if not any(TAILWIND_HREF_PATTERN.search(html_content) for html_content in html_contents):
+            self.purged_path = None
+            return None
+
+        used = used_class_names(html_contents)
+        key = self.cache_key(used)
+        purged_path = self.cache_dir / f"tailwind.{key[:32]}.css"
+
+        if purged_path.exists():
+            # 마지막 사용 시각 = 파일 수정 시각 (정리 기준)
+            purged_path.touch()
+            print(f"Tailwind 스타일시트 캐시 사용: {purged_path.name}")
+        else:
+            purged = purge_css(self.stylesheet.read_text(encoding='utf-8'), used)
+            purged_path.parent.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=purged_path.parent,
+                                             suffix='.tmp', delete=False) as f:
+                f.write(purged)
+            Path(f.name).replace(purged_path)
+            original_kb = self.stylesheet.stat().st_size / 1024
+            print(f"Tailwind 스타일시트 축소: {original_kb:.0f}KB -> {len(purged.encode('utf-8')) / 1024:.0f}KB "
+                  f"(클래스 후보 {len(used)}개)")
+            self.evict()
+
+        self.purged_path = purged_path
+        return purged_path
+
+    def evict(self):
+        """캐시된 스타일시트가 MAX_CACHED_STYLESHEETS개를 넘으면 오래 쓰지 않은 것부터 삭제"""
+        entries = sorted(self.cache_dir.glob('tailwind.*.css'), key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in entries[MAX_CACHED_STYLESHEETS:]:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+    def fingerprint(self):
+        """현재 덱 스타일시트 내용 해시 (렌더 캐시 키에 포함, purge_for 이전이거나 바꿔 쓰지 않으면 None)"""
+        if self.purged_path is None:
+            return None
+        return hashlib.sha256(self.purged_path.read_bytes()).hexdigest()[:16]
+
+    def rewrite_html(self, html_content):
+        """HTML의 Tailwind link를 현재 덱의 스타일시트(file URL)로 교체 (purge_for 이전이면 그대로)"""
+        if self.purged_path is None:
+            return html_content
+        html_content, _ = rewrite_tailwind_links(html_content, self.purged_path.resolve().as_uri())
+        return html_content
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 PPTX 빌드 테스트
+브라우저 없이 슬라이드 태그 저장/읽기와 patch_pptx의 교체/추가/삭제/순서 정렬을 확인한다.
+"""
+
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+
+from pptx import Presentation
+
+from incremental_pptx import add_image_slide, patch_pptx, read_slide_tag, tag_slide
+
+
+def solid_png(rgb, size=4):
+    """size x size 단색 PNG bytes"""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    rows = b''.join(b'\x00' + bytes(rgb) * size for _ in range(size))
+    header = struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b'')
+
+
+def picture_blob(slide):
+    """슬라이드 첫 그림 도형의 이미지 bytes"""
+    return next(shape for shape in slide.shapes if hasattr(shape, 'image')).image.blob
+
+
+def test_slide_tags():
+    """태그를 저장하고 다시 읽을 수 있는지, 태그가 아닌 이름은 None인지 확인"""
+    prs = Presentation()
+    slide = add_image_slide(prs, solid_png((255, 0, 0)))
+    assert read_slide_tag(slide) is None, "태그가 없는 슬라이드에서 태그를 읽었습니다"
+
+    tag_slide(slide, '01.html', 'a' * 64)
+    assert read_slide_tag(slide) == ('01.html', 'a' * 64), read_slide_tag(slide)
+
+    slide._element.cSld.set('name', 'other|01.html|key')
+    assert read_slide_tag(slide) is None, "다른 접두어의 이름을 태그로 읽었습니다"
+    print("슬라이드 태그 저장/읽기 확인")
+
+
+def test_patch_pptx():
+    """바뀐 슬라이드만 렌더링하여 교체하고, 추가/삭제 후 HTML 파일 순서로 정렬되는지 확인"""
+    with tempfile.TemporaryDirectory() as root:
+        root = Path(root)
+        pptx_path = root / 'deck.pptx'
+        red, green, blue, gray = (solid_png(rgb) for rgb in [(255, 0, 0), (0, 255, 0), (0, 0, 255), (128, 128, 128)])
+
+        prs = Presentation()
+        for name, key, png_data in [('01.html', 'k1', red), ('02.html', 'k2', green), ('03.html', 'k3', blue)]:
+            tag_slide(add_image_slide(prs, png_data), name, key)
+        prs.save(pptx_path)
+
+        # 01 유지, 02 변경, 03 삭제, 00 추가 (00이 맨 앞으로 와야 함)
+        html_files = [root / '00.html', root / '01.html', root / '02.html']
+        slide_keys = ['k0', 'k1', 'k2-new']
+        rendered = []
+
+        def render_files(files):
+            rendered.extend(html_file.name for html_file in files)
+            return [gray if html_file.name == '00.html' else blue for html_file in files]
+
+        result = patch_pptx(pptx_path, html_files, slide_keys, render_files)
+        print(f"패치 결과: {result}, 렌더링된 파일: {rendered}")
+        assert result == {'changed': 1, 'added': 1, 'removed': 1}, result
+        assert rendered == ['00.html', '02.html'], rendered
+
+        slides = list(Presentation(pptx_path).slides)
+        tags = [read_slide_tag(slide) for slide in slides]
+        assert tags == [('00.html', 'k0'), ('01.html', 'k1'), ('02.html', 'k2-new')], tags
+        assert [picture_blob(slide) for slide in slides] == [gray, red, blue]
+
+
+def test_patch_untagged():
+    """태그가 없는 슬라이드가 있으면 None을 반환하여 전체 생성으로 넘어가는지 확인"""
+    with tempfile.TemporaryDirectory() as root:
+        pptx_path = Path(root) / 'deck.pptx'
+        prs = Presentation()
+        add_image_slide(prs, solid_png((255, 0, 0)))
+        prs.save(pptx_path)
+        assert patch_pptx(pptx_path, [Path(root) / '01.html'], ['k1'], lambda files: []) is None
+
+
+if __name__ == "__main__":
+    print("슬라이드 태그 테스트")
+    print("=" * 50)
+    test_slide_tags()
+
+    print("\n증분 패치 테스트")
+    print("=" * 50)
+    test_patch_pptx()
+
+    print("\n태그 없는 PPTX 테스트")
+    print("=" * 50)
+    test_patch_untagged()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+렌더 캐시 테스트
+브라우저 없이 캐시 키 무효화(HTML, 로컬 자산, 렌더 설정)와 LRU 정리, 스트리밍 hit/miss를 확인한다.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from render_cache import RenderCache, iter_with_cache, local_asset_paths, render_key
+
+SETTINGS = {'backend': 'chrome', 'slide_width': 1920, 'render_size': None}
+
+
+def make_slide(root):
+    """로컬 CSS/이미지와 CDN 스크립트를 참조하는 슬라이드 생성"""
+    root = Path(root)
+    (root / 'css').mkdir()
+    (root / 'css' / 'slide.css').write_text('body { color: red; }', encoding='utf-8')
+    (root / 'logo.png').write_bytes(b'logo-v1')
+    html_path = root / '01.html'
+    html_path.write_text(
+        '<link href="css/slide.css" rel="stylesheet">'
+        '<script src="https://cdn.tailwindcss.com"></script>'
+        '<div style="background: url(\'logo.png\')"></div>',
+        encoding='utf-8'
+    )
+    return html_path
+
+
+def test_local_assets():
+    """로컬 자산만 추출하는지 확인 (원격 URL 제외)"""
+    with tempfile.TemporaryDirectory() as root:
+        html_path = make_slide(root)
+        names = [path.name for path in local_asset_paths(html_path, html_path.read_text(encoding='utf-8'))]
+        print(f"로컬 자산: {names}")
+        assert sorted(names) == ['logo.png', 'slide.css'], names
+
+
+def test_key_invalidation():
+    """HTML, 참조 자산, 렌더 설정이 바뀌면 키가 바뀌고, 그대로면 같은 키인지 확인"""
+    with tempfile.TemporaryDirectory() as root:
+        html_path = make_slide(root)
+        key = render_key(html_path, SETTINGS)
+        assert render_key(html_path, dict(SETTINGS)) == key, "같은 입력인데 키가 다릅니다"
+
+        changed_settings = dict(SETTINGS, render_size=(1280, 720))
+        assert render_key(html_path, changed_settings) != key, "렌더 설정 변경이 키에 반영되지 않았습니다"
+
+        (Path(root) / 'css' / 'slide.css').write_text('body { color: blue; }', encoding='utf-8')
+        css_key = render_key(html_path, SETTINGS)
+        assert css_key != key, "CSS 변경이 키에 반영되지 않았습니다"
+
+        (Path(root) / 'logo.png').write_bytes(b'logo-v2')
+        image_key = render_key(html_path, SETTINGS)
+        assert image_key != css_key, "이미지 변경이 키에 반영되지 않았습니다"
+
+        html_path.write_text(html_path.read_text(encoding='utf-8') + '<p>추가</p>', encoding='utf-8')
+        assert render_key(html_path, SETTINGS) != image_key, "HTML 변경이 키에 반영되지 않았습니다"
+        print("키 무효화: HTML/CSS/이미지/렌더 설정 변경 모두 반영")
+
+
+def test_lru_eviction():
+    """최대 크기를 넘으면 마지막 사용 시각이 가장 오래된 항목부터 삭제되는지 확인"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = RenderCache(cache_dir=cache_dir, max_bytes=250)
+        keys = [f"{i:02d}" + 'a' * 62 for i in range(3)]
+        for i, key in enumerate(keys[:2]):
+            cache.put(key, bytes(100))
+            # 수정 시각 차이를 확실히 두어 LRU 순서 고정
+            past = time.time() - 100 + i * 10
+            os.utime(cache._entry_path(key), (past, past))
+
+        # 첫 번째 항목을 사용하면 두 번째 항목이 가장 오래된 항목이 됨
+        assert cache.get(keys[0]) == bytes(100)
+        cache.put(keys[2], bytes(100))
+
+        remaining = [key for key in keys if cache._entry_path(key).exists()]
+        print(f"LRU 정리 후 남은 항목: {len(remaining)}개, 전체 {cache.total_bytes()} bytes")
+        assert remaining == [keys[0], keys[2]], remaining
+        assert cache.total_bytes() == 200
+        assert cache.get(keys[1]) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_iter_with_cache():
+    """hit은 렌더링하지 않고, miss만 렌더링 후 저장되는지 확인 (두 번째 실행은 모두 hit)"""
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as cache_dir:
+        html_files = []
+        for i in range(3):
+            html_path = Path(root) / f"{i:02d}.html"
+            html_path.write_text(f"<p>슬라이드 {i}</p>", encoding='utf-8')
+            html_files.append(html_path)
+        cache = RenderCache(cache_dir=cache_dir)
+        rendered = []
+
+        def iter_render_files(files):
+            for index, html_file in enumerate(files):
+                rendered.append(html_file.name)
+                yield index, html_file.name.encode('utf-8')
+
+        first = dict(iter_with_cache(cache, html_files, SETTINGS, iter_render_files))
+        second = dict(iter_with_cache(cache, html_files, SETTINGS, iter_render_files))
+        print(f"렌더링된 파일: {rendered}")
+        assert rendered == ['00.html', '01.html', '02.html'], rendered
+        assert first == second == {i: f"{i:02d}.html".encode('utf-8') for i in range(3)}
+
+
+if __name__ == "__main__":
+    print("로컬 자산 추출 테스트")
+    print("=" * 50)
+    test_local_assets()
+
+    print("\n캐시 키 무효화 테스트")
+    print("=" * 50)
+    test_key_invalidation()
+
+    print("\nLRU 정리 테스트")
+    print("=" * 50)
+    test_lru_eviction()
+
+    print("\n스트리밍 캐시 테스트")
+    print("=" * 50)
+    test_iter_with_cache()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 정책 테스트
+브라우저 없이 glob 패턴 매칭, 규칙 순서(처음 맞는 규칙), rewrite 치환, 기본 정책, 규칙 변환과 Fetch 응답을 확인한다.
+"""
+
+import json
+import re
+import tempfile
+from pathlib import Path
+
+from request_policy import RequestPolicy, RequestRule, format_request_log, glob_to_regex
+
+
+def test_glob_to_regex():
+    """*만 와일드카드이고 나머지 문자(., ?, +)는 그대로 맞는지 확인"""
+    pattern = re.compile(glob_to_regex('*://*google-analytics.com/*'))
+    match = pattern.match('https://www.google-analytics.com/analytics.js')
+    assert match and match.groups() == ('https', 'www.', 'analytics.js'), match
+    assert pattern.match('https://www.google-analyticsXcom/a.js') is None, ". 을 와일드카드로 처리했습니다"
+    assert re.match(glob_to_regex('https://a.com/x?y=1+2'), 'https://a.com/x?y=1+2')
+    assert re.match(glob_to_regex('https://a.com/x'), 'https://a.com/x/extra') is None, "패턴 끝이 고정되지 않았습니다"
+    print("glob 패턴 변환 확인")
+
+
+def test_rule_order_and_rewrite():
+    """처음 맞는 규칙만 적용되고, 리소스 종류 조건과 rewrite {n} 치환이 맞는지 확인"""
+    policy = RequestPolicy([
+        {'action': 'allow', 'url': 'https://cdn.example.com/keep/*'},
+        {'action': 'rewrite', 'url': 'https://cdn.example.com/*', 'to': 'http://127.0.0.1:8000/{1}'},
+        {'action': 'deny', 'types': ['Image'], 'url': 'https://*'},
+    ])
+    assert policy.decide('https://cdn.example.com/keep/a.css', 'stylesheet') == \
+        ('allow', 'https://cdn.example.com/keep/a.css')
+    assert policy.decide('https://cdn.example.com/img/a.png', 'image') == ('rewrite', 'http://127.0.0.1:8000/img/a.png')
+    assert policy.decide('https://other.com/a.png', 'image') == ('deny', 'https://other.com/a.png')
+    assert policy.decide('https://other.com/a.js', 'script') == ('allow', 'https://other.com/a.js')
+    assert policy.decide('http://other.com/a.png', 'image') == ('allow', 'http://other.com/a.png')
+
+    rule = RequestRule('rewrite', url='https://*/*', to='{2}@{1}{3}')
+    assert rule.rewrite(rule.match('https://a.com/b', None)) == 'b@a.com', "범위 밖 {n}은 빈 문자열이어야 합니다"
+
+    for bad in [{'action': 'block'}, {'action': 'rewrite', 'url': 'https://*'}]:
+        try:
+            RequestRule(**bad)
+        except ValueError as e:
+            print(f"잘못된 규칙 거부: {e}")
+        else:
+            raise AssertionError(f"잘못된 규칙을 받아들였습니다: {bad}")
+
+
+def test_default_policy():
+    """기본 정책이 분석/추적 요청과 ping만 막고 슬라이드 자원은 허용하는지 확인"""
+    policy = RequestPolicy.default()
+    denied = [('https://www.google-analytics.com/analytics.js', 'script'),
+              ('https://www.googletagmanager.com/gtag/js?id=G-1', 'script'),
+              ('https://connect.facebook.net/en_US/fbevents.js', 'script'),
+              ('https://example.com/collect', 'ping')]
+    allowed = [('https://cdn.tailwindcss.com/', 'script'),
+               ('https://fonts.googleapis.com/css2?family=Noto+Sans+KR', 'stylesheet'),
+               ('file:///C:/slides/logo.png', 'image'),
+               ('https://example.com/collect', None)]
+    for url, resource_type in denied:
+        assert policy.decide(url, resource_type)[0] == 'deny', f"막아야 할 요청을 허용했습니다: {url}"
+    for url, resource_type in allowed:
+        assert policy.decide(url, resource_type)[0] == 'allow', f"허용해야 할 요청을 막았습니다: {url}"
+    print(f"기본 정책: 차단 {len(denied)}개, 허용 {len(allowed)}개 확인")
+
+
+def test_round_trip():
+    """to_dicts로 저장한 정책 파일을 다시 읽으면 같은 규칙이고, 워커 규칙은 정규식 pattern을 쓰는지 확인"""
+    rules = [{'action': 'deny', 'types': ['script', 'image'], 'url': 'https://*.ads.com/*'},
+             {'action': 'rewrite', 'url': 'https://cdn.example.com/*', 'to': 'http://127.0.0.1:8000/{1}'},
+             {'action': 'deny', 'types': ['ping']}]
+    policy = RequestPolicy(rules)
+    with tempfile.TemporaryDirectory() as root:
+        for data in [policy.to_dicts(), {'rules': policy.to_dicts()}]:
+            path = Path(root) / 'policy.json'
+            path.write_text(json.dumps(data), encoding='utf-8')
+            assert RequestPolicy.from_file(path).to_dicts() == policy.to_dicts()
+    assert policy.to_dicts()[0]['types'] == ['image', 'script'], "types가 정렬되지 않아 캐시 키가 흔들립니다"
+
+    worker_rules = policy.worker_rules()
+    assert 'url' not in worker_rules[0] and worker_rules[0]['pattern'] == glob_to_regex('https://*.ads.com/*')
+    assert worker_rules[2] == {'action': 'deny', 'types': ['ping']}
+    print("정책 파일 저장/읽기와 워커 규칙 변환 확인")
+
+
+def test_fetch_command():
+    """Fetch.requestPaused 응답 명령과 차단/바꿔쓰기 기록 확인"""
+    policy = RequestPolicy([
+        {'action': 'deny', 'url': '*://*google-analytics.com/*'},
+        {'action': 'rewrite', 'url': 'https://cdn.example.com/*', 'to': 'http://127.0.0.1:8000/{1}'},
+    ])
+    request_log = []
+
+    def paused(request_id, url, resource_type):
+        params = {'requestId': request_id, 'request': {'url': url}, 'resourceType': resource_type}
+        return policy.fetch_command(params, request_log)
+
+    assert paused('1', 'https://www.google-analytics.com/a.js', 'Script') == \
+        ('Fetch.failRequest', {'requestId': '1', 'errorReason': 'BlockedByClient'})
+    assert paused('2', 'https://cdn.example.com/a.css', 'Stylesheet') == \
+        ('Fetch.continueRequest', {'requestId': '2', 'url': 'http://127.0.0.1:8000/a.css'})
+    assert paused('3', 'https://other.com/a.css', 'Stylesheet') == ('Fetch.continueRequest', {'requestId': '3'})
+    assert request_log == [
+        {'url': 'https://www.google-analytics.com/a.js', 'type': 'script', 'action': 'deny'},
+        {'url': 'https://cdn.example.com/a.css', 'type': 'stylesheet', 'action': 'rewrite',
+         'to': 'http://127.0.0.1:8000/a.css'},
+    ], request_log
+
+    lines = format_request_log(request_log * 3, limit=2)
+    print("\n".join(lines))
+    assert lines[1] == 'rewrite stylesheet: https://cdn.example.com/a.css -> http://127.0.0.1:8000/a.css'
+    assert lines[-1] == '... 외 4개'
+
+
+if __name__ == "__main__":
+    print("glob 패턴 테스트")
+    print("=" * 50)
+    test_glob_to_regex()
+
+    print("\n규칙 순서/rewrite 테스트")
+    print("=" * 50)
+    test_rule_order_and_rewrite()
+
+    print("\n기본 정책 테스트")
+    print("=" * 50)
+    test_default_policy()
+
+    print("\n정책 변환 테스트")
+    print("=" * 50)
+    test_round_trip()
+
+    print("\nFetch 응답 테스트")
+    print("=" * 50)
+    test_fetch_command()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tailwind 스타일시트 축소 테스트
+브라우저 없이 사용 클래스에 따라 규칙(변형/미디어/keyframes 포함)이 남거나 빠지는지, link 교체와 캐시를 확인한다.
+"""
+
+import tempfile
+from pathlib import Path
+
+from tailwind_purge import (TailwindPurger, parse_css_blocks, purge_css, rewrite_tailwind_links,
+                            selector_classes, used_class_names)
+
+SAMPLE_CSS = (
+    '/*! tailwindcss v2.2.19 | MIT License */'
+    '*,::after,::before{box-sizing:border-box}'
+    'html{line-height:1.5}'
+    '.flex{display:flex}'
+    '.grid{display:grid}'
+    '.hover\\:bg-blue-500:hover{background-color:#3b82f6}'
+    '.hover\\:bg-red-500:hover{background-color:#ef4444}'
+    '.w-1\\/2{width:50%}'
+    '.flex,.grid-cols-3{gap:1rem}'
+    '@media (min-width:768px){.md\\:flex{display:flex}.md\\:grid{display:grid}}'
+    '@keyframes spin{to{transform:rotate(360deg)}}'
+    '@keyframes ping{75%,to{transform:scale(2);opacity:0}}'
+    '.animate-spin{animation:spin 1s linear infinite}'
+    '.animate-ping{animation:ping 1s cubic-bezier(0,0,.2,1) infinite}'
+    '@font-face{font-family:x;src:url(x.woff2)}'
+)
+SAMPLE_HTML = ('<div class="flex hover:bg-blue-500 w-1/2 md:flex animate-spin">'
+               '<script>el.classList.add("grid")</script></div>')
+
+
+def test_selector_classes():
+    """선택자의 이스케이프된 클래스와 속성 선택자 처리 확인"""
+    assert selector_classes('.hover\\:bg-blue-500:hover') == {'hover:bg-blue-500'}
+    assert selector_classes('.w-1\\/2') == {'w-1/2'}
+    assert selector_classes('.\\32xl\\:container') == {'2xl:container'}
+    assert selector_classes('[class~="a.b"] .c') == {'c'}
+    assert selector_classes('*,::after') == set()
+    print("선택자 클래스 추출 확인")
+
+
+def test_purge_variants():
+    """사용한 변형(hover:, md:, w-1/2)과 스크립트에서 추가한 클래스는 남고, 나머지는 빠지는지 확인"""
+    purged = purge_css(SAMPLE_CSS, used_class_names([SAMPLE_HTML]))
+    print(f"축소 결과: {len(SAMPLE_CSS)} -> {len(purged)}자")
+
+    kept = ['/*! tailwindcss', 'box-sizing:border-box', 'html{line-height:1.5}', '.flex{display:flex}',
+            '.grid{display:grid}', '.hover\\:bg-blue-500:hover', '.w-1\\/2{width:50%}', '.flex{gap:1rem}',
+            '@media (min-width:768px){.md\\:flex{display:flex}}', '@keyframes spin', '.animate-spin', '@font-face']
+    dropped = ['bg-red-500', 'grid-cols-3', 'md\\:grid', '@keyframes ping', '.animate-ping']
+    for text in kept:
+        assert text in purged, f"남아야 할 규칙이 빠졌습니다: {text}"
+    for text in dropped:
+        assert text not in purged, f"빠져야 할 규칙이 남았습니다: {text}"
+
+
+def test_parse_blocks():
+    """본문 없는 at-rule과 중첩 블록 분석 확인"""
+    blocks = parse_css_blocks('@charset "utf-8";@import url(a.css);.a{color:red}@media print{.b{color:blue}}')
+    assert blocks == [('@charset "utf-8";', None), ('@import url(a.css);', None), ('.a', 'color:red'),
+                      ('@media print', '.b{color:blue}')], blocks
+
+
+def test_rewrite_and_cache():
+    """Tailwind link만 교체되고, 클래스 구성이 같으면 캐시된 스타일시트를 다시 쓰는지 확인"""
+    html = ('<link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">'
+            '<link href="static/all.min.css" rel="stylesheet">')
+    rewritten, count = rewrite_tailwind_links(html, 'file:///deck.css')
+    assert count == 1 and 'file:///deck.css' in rewritten and 'static/all.min.css' in rewritten, rewritten
+
+    with tempfile.TemporaryDirectory() as root:
+        root = Path(root)
+        stylesheet = root / 'tailwind.min.css'
+        stylesheet.write_text(SAMPLE_CSS, encoding='utf-8')
+        slide = root / '01.html'
+        slide.write_text(html + SAMPLE_HTML, encoding='utf-8')
+        purger = TailwindPurger(stylesheet=stylesheet, cache_dir=root / 'cache')
+
+        first = purger.purge_for([slide])
+        assert first is not None and first.exists()
+        assert purger.purge_for([slide]) == first, "같은 클래스 구성인데 다른 스타일시트를 만들었습니다"
+        assert first.resolve().as_uri() in purger.rewrite_html(html)
+        first_fingerprint = purger.fingerprint()
+
+        slide.write_text(html + '<div class="grid-cols-3"></div>', encoding='utf-8')
+        assert purger.purge_for([slide]) != first, "클래스 구성이 바뀌었는데 캐시를 사용했습니다"
+        assert purger.fingerprint() != first_fingerprint, "스타일시트가 바뀌었는데 렌더 캐시 키가 같습니다"
+
+        plain = root / '02.html'
+        plain.write_text('<p>Tailwind 없음</p>', encoding='utf-8')
+        assert purger.purge_for([plain]) is None
+        assert purger.rewrite_html(html) == html and purger.fingerprint() is None
+        print("link 교체와 덱 스타일시트 캐시 확인")
+
+
+if __name__ == "__main__":
+    print("선택자 클래스 테스트")
+    print("=" * 50)
+    test_selector_classes()
+
+    print("\n규칙 선택 테스트")
+    print("=" * 50)
+    test_purge_variants()
+
+    print("\nCSS 블록 분석 테스트")
+    print("=" * 50)
+    test_parse_blocks()
+
+    print("\nlink 교체/캐시 테스트")
+    print("=" * 50)
+    test_rewrite_and_cache()
+    print("\n모든 테스트 통과")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Watch Mode
+HTML 디렉토리와 HTML이 참조하는 로컬 자산(static/ CSS, JS, 이미지)을 감시하다가
+저장이 끝나면(디바운스) 바뀐 슬라이드만 다시 렌더링하여 PPTX를 갱신하는 모드
+렌더 백엔드(브라우저, Puppeteer 워커, CDP 탭)는 감시를 시작할 때 한 번 실행하여 감시가 끝날 때까지 유지하므로
+재빌드마다 새로 띄우지 않는다. html2image 백엔드는 슬라이드마다 Chrome을 실행하므로 경고만 출력한다.
+"""
+
+import time
+
+from render_cache import local_asset_paths
+
+# 기본 설정
+DEFAULT_POLL_INTERVAL = 0.2  # 파일 변경 확인 주기 (초)
+DEFAULT_DEBOUNCE = 0.4  # 마지막 변경 후 이만큼 조용하면 재빌드 (초)
+
+
+class WatchedFiles:
+    """HTML 파일과 참조 자산의 수정 시각 스냅샷 (HTML이 바뀐 경우에만 참조 자산 목록을 다시 파싱)"""
+
+    def __init__(self, html_dir):
+        self.html_dir = html_dir
+        self._assets = {}  # HTML 경로 -> (수정 시각, 참조 자산 경로 리스트)
+
+    def _referenced_assets(self, html_path, mtime):
+        cached = self._assets.get(html_path)
+        if cached is None or cached[0] != mtime:
+            try:
+                html_content = html_path.read_text(encoding='utf-8', errors='replace')
+            except OSError:
+                return []
+            cached = (mtime, local_asset_paths(html_path, html_content))
+            self._assets[html_path] = cached
+        return cached[1]
+
+    def snapshot(self):
+        """감시 대상 파일의 {경로: 수정 시각} (없어진 자산은 None)"""
+        state = {}
+        for html_path in sorted(self.html_dir.glob("*.html")):
+            try:
+                mtime = html_path.stat().st_mtime_ns
+            except OSError:
+                continue
+            state[html_path] = mtime
+            for asset in self._referenced_assets(html_path, mtime):
+                if asset not in state:
+                    try:
+                        state[asset] = asset.stat().st_mtime_ns
+                    except OSError:
+                        state[asset] = None
+        return state
+
+
+def changed_paths(previous, current):
+    """두 스냅샷 사이에 추가/수정/삭제된 경로 목록"""
+    return sorted(
+        (path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)),
+        key=str
+    )
+
+
+def watch_and_rebuild(converter, poll_interval=DEFAULT_POLL_INTERVAL, debounce=DEFAULT_DEBOUNCE):
+    """처음 한 번 변환한 뒤, 파일이 바뀔 때마다 증분 빌드로 PPTX 갱신 (Ctrl+C로 종료)
+
+    반환값: 마지막 변환 성공 여부
+    """
+    # 재빌드는 항상 증분 빌드 (바뀐 슬라이드만 렌더링하여 이미지 교체)
+    converter.incremental = True
+    watched = WatchedFiles(converter.html_dir)
+    if converter.backend.name == 'html2image':
+        print("경고: html2image 백엔드는 슬라이드마다 Chrome을 새로 실행하므로 재빌드가 느립니다. "
+              "--pool-size=N 또는 --backend=selenium/cdp로 브라우저를 유지하세요.")
+
+    # 백엔드를 감시 동안 계속 실행 (convert() 안의 with 블록은 안쪽 블록이므로 종료하지 않음)
+    with converter.backend:
+        return _watch_loop(converter, watched, poll_interval, debounce)
+
+
+def _watch_loop(converter, watched, poll_interval, debounce):
+    """처음 변환 후 변경을 기다리며 재빌드하는 반복 (Ctrl+C로 종료, 마지막 변환 성공 여부 반환)"""
+    previous = watched.snapshot()
+    success = converter.convert()
+    print(f"변경 감시 시작: {converter.html_dir} (파일 {len(previous)}개, Ctrl+C로 종료)")
+
+    try:
+        while True:
+            time.sleep(poll_interval)
+            current = watched.snapshot()
+            if current == previous:
+                continue
+
+            # 연속 저장이 끝날 때까지 대기 (디바운스)
+            while True:
+                time.sleep(debounce)
+                settled = watched.snapshot()
+                if settled == current:
+                    break
+                current = settled
+
+            for path in changed_paths(previous, current):
+                print(f"변경 감지: {path}")
+            previous = current
+
+            start = time.perf_counter()
+            success = converter.convert()
+            status = "완료" if success else "실패"
+            print(f"재빌드 {status} ({time.perf_counter() - start:.2f}초)")
+    except KeyboardInterrupt:
+        print("변경 감시 종료")
+
+    return success
@@ -20,6 +20,7 @@ import tempfile
 import shutil
 from html2image import Html2Image
 from PIL import Image
+from svg_raster import svg_file_to_png
 
 class DebugHTMLConverter:
     def __init__(self, html_file, output_path):
@@ -76,6 +77,10 @@ class DebugHTMLConverter:
             print(f"아이콘 다운로드 오류: {e}")
             return None
     
+    def svg_to_png(self, svg_file, size=64):
+        """SVG를 PNG로 변환 (svg_raster 프로세스 안 변환 우선, 지원하지 않는 SVG만 HTML2Image 스크린샷)"""
+        return svg_file_to_png(svg_file, size, self.temp_dir) or self.svg_to_png_with_html2image(svg_file, size)
+    
     def svg_to_png_with_html2image(self, svg_file, size=64):
         """SVG를 HTML2Image로 PNG 변환"""
         try:
@@ -235,7 +240,7 @@ class DebugHTMLConverter:
                 print(f"아이콘 처리: {icon_class}")
                 svg_file = self.download_fontawesome_svg(icon_class, icon_color)
                 if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 20)
+                    png_file = self.svg_to_png(svg_file, 20)
                     if png_file and png_file.exists():
                         icon_x = x + 0.1
                         icon_y = y + (height - 0.25) / 2
@@ -313,7 +318,7 @@ class DebugHTMLConverter:
                 print(f"버튼 아이콘 처리: {icon_class}")
                 svg_file = self.download_fontawesome_svg(icon_class, text_color)
                 if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 20)
+                    png_file = self.svg_to_png(svg_file, 20)
                     if png_file and png_file.exists():
                         icon_x = x + 0.1
                         icon_y = y + (height - 0.25) / 2
@@ -584,7 +589,7 @@ class DebugHTMLConverter:
                     # 아이콘 이미지 추가
                     svg_file = self.download_fontawesome_svg('fa-history', '#2563eb')
                     if svg_file:
-                        png_file = self.svg_to_png_with_html2image(svg_file, 32)
+                        png_file = self.svg_to_png(svg_file, 32)
                         if png_file and png_file.exists():
                             slide.shapes.add_picture(
                                 str(png_file), 
@@ -639,7 +644,7 @@ class DebugHTMLConverter:
                     
                     svg_file = self.download_fontawesome_svg('fa-bullseye', '#2563eb')
                     if svg_file:
-                        png_file = self.svg_to_png_with_html2image(svg_file, 32)
+                        png_file = self.svg_to_png(svg_file, 32)
                         if png_file and png_file.exists():
                             slide.shapes.add_picture(
                                 str(png_file), 
@@ -691,7 +696,7 @@ class DebugHTMLConverter:
                     
                     svg_file = self.download_fontawesome_svg('fa-star', '#2563eb')
                     if svg_file:
-                        png_file = self.svg_to_png_with_html2image(svg_file, 32)
+                        png_file = self.svg_to_png(svg_file, 32)
                         if png_file and png_file.exists():
                             slide.shapes.add_picture(
                                 str(png_file), 
@@ -749,7 +754,7 @@ class DebugHTMLConverter:
                     if icon_class:
                         svg_file = self.download_fontawesome_svg(icon_class, '#3b82f6')
                         if svg_file:
-                            png_file = self.svg_to_png_with_html2image(svg_file, 24)
+                            png_file = self.svg_to_png(svg_file, 24)
                             if png_file and png_file.exists():
                                 slide.shapes.add_picture(
                                     str(png_file), 
@@ -894,7 +899,7 @@ class DebugHTMLConverter:
                         if icon_class:
                             svg_file = self.download_fontawesome_svg(icon_class, '#3b82f6')
                             if svg_file:
-                                png_file = self.svg_to_png_with_html2image(svg_file, 20)
+                                png_file = self.svg_to_png(svg_file, 20)
                                 if png_file and png_file.exists():
                                     slide.shapes.add_picture(
                                         str(png_file), 
@@ -1004,7 +1009,7 @@ class DebugHTMLConverter:
                                 if sub_icon_class:
                                     svg_file = self.download_fontawesome_svg(sub_icon_class, '#3b82f6')
                                     if svg_file:
-                                        png_file = self.svg_to_png_with_html2image(svg_file, 16)
+                                        png_file = self.svg_to_png(svg_file, 16)
                                         if png_file and png_file.exists():
                                             slide.shapes.add_picture(
                                                 str(png_file), 
@@ -1092,7 +1097,7 @@ class DebugHTMLConverter:
                             if icon_class:
                                 svg_file = self.download_fontawesome_svg(icon_class, '#2563eb')
                                 if svg_file:
-                                    png_file = self.svg_to_png_with_html2image(svg_file, 24)
+                                    png_file = self.svg_to_png(svg_file, 24)
                                     if png_file and png_file.exists():
                                         slide.shapes.add_picture(
                                             str(png_file), 
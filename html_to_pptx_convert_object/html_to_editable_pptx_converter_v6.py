@@ -16,19 +16,24 @@ from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from bs4 import BeautifulSoup
 import re
-import requests
 from urllib.parse import urljoin, urlparse
 import base64
 import tempfile
 import shutil
 from html2image import Html2Image
 from PIL import Image
+from icon_store import prefetch_html_icons
+from icon_font import check_icon_font, get_icon_font
+from icon_place import place_icon
+from stage_trace import StageTracer, traced
 
 class HTMLEditablePPTXConverterV6:
-    def __init__(self, html_file, output_path):
+    def __init__(self, html_file, output_path, tracer=None, vector_icons=False):
         self.html_file = Path(html_file)
         self.output_path = Path(output_path)
         self.temp_dir = None
+        self.tracer = tracer  # 단계별 시간 기록기 (None이면 기록하지 않음)
+        self.vector_icons = vector_icons  # True이면 아이콘을 PNG 대신 편집 가능한 자유형 벡터 도형으로 추가
         self.hti = Html2Image()
         
     def setup_temp_directory(self):
@@ -134,52 +139,13 @@ class HTMLEditablePPTXConverterV6:
         </html>
         """
     
-    def download_fontawesome_svg(self, icon_class, color='#2563eb'):
-        """FontAwesome 아이콘 SVG 다운로드"""
-        try:
-            clean_class = icon_class.replace('fas ', '').replace('fab ', '').replace('far ', '').replace('fa-', '')
-            
-            # 다양한 경로 시도
-            paths = [
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/6.x/svgs/solid/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/6.x/svgs/brands/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/6.x/svgs/regular/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/5.x/svgs/solid/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/5.x/svgs/brands/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/5.x/svgs/regular/{clean_class}.svg",
-            ]
-            
-            for path in paths:
-                try:
-                    print(f"아이콘 다운로드 시도: {icon_class} -> {path}")
-                    response = requests.get(path, timeout=10)
-                    if response.status_code == 200:
-                        svg_content = response.text
-                        
-                        # 색상 적용
-                        svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
-                        svg_content = svg_content.replace('fill="#000"', f'fill="{color}"')
-                        svg_content = svg_content.replace('fill="black"', f'fill="{color}"')
-                        
-                        # SVG 파일 저장
-                        svg_file = self.temp_dir / f"{clean_class}.svg"
-                        with open(svg_file, 'w', encoding='utf-8') as f:
-                            f.write(svg_content)
-                        
-                        print(f"아이콘 다운로드 성공: {svg_file}")
-                        return svg_file
-                        
-                except Exception as e:
-                    print(f"경로 실패: {e}")
-                    continue
-            
-            print(f"아이콘 다운로드 실패: {icon_class}")
-            return None
-            
-        except Exception as e:
-            print(f"아이콘 다운로드 오류 ({icon_class}): {e}")
-            return None
+    def add_icon(self, slide, icon_class, color, px_size, left, top, width, height):
+        """아이콘 추가 (icon_place.place_icon, 프로세스 안에서 변환할 수 없는 SVG만 HTML2Image 스크린샷), 추가한 도형 반환"""
+        return place_icon(slide, icon_class, color, px_size, left, top, width, height, self.temp_dir,
+                          vector_icons=self.vector_icons, screenshot=self.svg_to_png_with_html2image,
+                          tracer=self.tracer)
     
+    @traced('icon_rasterize')
     def svg_to_png_with_html2image(self, svg_file, size=64):
         """SVG를 HTML2Image로 PNG 변환"""
         try:
@@ -362,22 +328,15 @@ class HTMLEditablePPTXConverterV6:
             
             # 아이콘 이미지 추가
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, '#1e40af')
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 24)
-                    if png_file and png_file.exists():
-                        # 아이콘 이미지 추가
-                        icon_left = Inches(x + 0.1)
-                        icon_top = Inches(y + 0.1)
-                        icon_width = Inches(0.3)
-                        icon_height = Inches(0.3)
-                        
-                        slide.shapes.add_picture(str(png_file), icon_left, icon_top, icon_width, icon_height)
-                        print(f"기술 스택 아이콘 추가 성공: {icon_class}")
-                    else:
-                        print(f"기술 스택 PNG 변환 실패: {icon_class}")
+                icon_left = Inches(x + 0.1)
+                icon_top = Inches(y + 0.1)
+                icon_width = Inches(0.3)
+                icon_height = Inches(0.3)
+
+                if self.add_icon(slide, icon_class, '#1e40af', 24, icon_left, icon_top, icon_width, icon_height):
+                    print(f"기술 스택 아이콘 추가 성공: {icon_class}")
                 else:
-                    print(f"기술 스택 SVG 다운로드 실패: {icon_class}")
+                    print(f"기술 스택 아이콘 추가 실패: {icon_class}")
             
             return box
             
@@ -420,22 +379,15 @@ class HTMLEditablePPTXConverterV6:
             
             # 아이콘 이미지 추가
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, '#ffffff')
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 24)
-                    if png_file and png_file.exists():
-                        # 아이콘 이미지 추가
-                        icon_left = Inches(x + 0.1)
-                        icon_top = Inches(y + 0.1)
-                        icon_width = Inches(0.3)
-                        icon_height = Inches(0.3)
-                        
-                        slide.shapes.add_picture(str(png_file), icon_left, icon_top, icon_width, icon_height)
-                        print(f"버튼 아이콘 추가 성공: {icon_class}")
-                    else:
-                        print(f"버튼 PNG 변환 실패: {icon_class}")
+                icon_left = Inches(x + 0.1)
+                icon_top = Inches(y + 0.1)
+                icon_width = Inches(0.3)
+                icon_height = Inches(0.3)
+
+                if self.add_icon(slide, icon_class, '#ffffff', 24, icon_left, icon_top, icon_width, icon_height):
+                    print(f"버튼 아이콘 추가 성공: {icon_class}")
                 else:
-                    print(f"버튼 SVG 다운로드 실패: {icon_class}")
+                    print(f"버튼 아이콘 추가 실패: {icon_class}")
             
             return button
             
@@ -489,22 +441,15 @@ class HTMLEditablePPTXConverterV6:
             
             # 아이콘 이미지 추가
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, '#1f2937')
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 20)
-                    if png_file and png_file.exists():
-                        # 아이콘 이미지 추가
-                        icon_left = Inches(x + 0.1)
-                        icon_top = Inches(y + 0.1)
-                        icon_width = Inches(0.2)
-                        icon_height = Inches(0.2)
-                        
-                        slide.shapes.add_picture(str(png_file), icon_left, icon_top, icon_width, icon_height)
-                        print(f"기능 카드 아이콘 추가 성공: {icon_class}")
-                    else:
-                        print(f"기능 카드 PNG 변환 실패: {icon_class}")
+                icon_left = Inches(x + 0.1)
+                icon_top = Inches(y + 0.1)
+                icon_width = Inches(0.2)
+                icon_height = Inches(0.2)
+
+                if self.add_icon(slide, icon_class, '#1f2937', 20, icon_left, icon_top, icon_width, icon_height):
+                    print(f"기능 카드 아이콘 추가 성공: {icon_class}")
                 else:
-                    print(f"기능 카드 SVG 다운로드 실패: {icon_class}")
+                    print(f"기능 카드 아이콘 추가 실패: {icon_class}")
             
             return card
             
@@ -526,26 +471,17 @@ class HTMLEditablePPTXConverterV6:
             fill.solid()
             fill.fore_color.rgb = RGBColor(219, 234, 254)
             
-            # 아이콘 다운로드 및 변환
+            # 아이콘 이미지 추가
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, '#2563eb')
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 48)
-                    if png_file and png_file.exists():
-                        # 아이콘 이미지 추가
-                        icon_left = Inches(x + size * 0.2)
-                        icon_top = Inches(y + size * 0.2)
-                        icon_width = Inches(size * 0.6)
-                        icon_height = Inches(size * 0.6)
-                        
-                        slide.shapes.add_picture(str(png_file), icon_left, icon_top, icon_width, icon_height)
-                        print(f"아이콘 이미지 추가 성공: {icon_class}")
-                    else:
-                        print(f"PNG 변환 실패: {icon_class}")
-                        # 폴백: 텍스트 아이콘
-                        self.add_text_icon_to_circle(circle, icon_class)
+                icon_left = Inches(x + size * 0.2)
+                icon_top = Inches(y + size * 0.2)
+                icon_width = Inches(size * 0.6)
+                icon_height = Inches(size * 0.6)
+
+                if self.add_icon(slide, icon_class, '#2563eb', 48, icon_left, icon_top, icon_width, icon_height):
+                    print(f"아이콘 이미지 추가 성공: {icon_class}")
                 else:
-                    print(f"SVG 다운로드 실패: {icon_class}")
+                    print(f"아이콘 이미지 추가 실패: {icon_class}")
                     # 폴백: 텍스트 아이콘
                     self.add_text_icon_to_circle(circle, icon_class)
             else:
@@ -600,6 +536,23 @@ class HTMLEditablePPTXConverterV6:
         }
         return icon_map.get(clean_class, '●')
     
+    @staticmethod
+    def extract_icon_class(element):
+        """요소에서 아이콘 클래스 추출 (자식 <i>의 첫 fa- 클래스, 없으면 요소 자신의 첫 fa- 클래스)"""
+        if not element:
+            return None
+        
+        icon_elem = element.find('i')
+        if icon_elem:
+            for cls in icon_elem.get('class', []):
+                if cls.startswith('fa-'):
+                    return cls
+        
+        for cls in element.get('class', []):
+            if cls.startswith('fa-'):
+                return cls
+        return None
+    
     def parse_01_html(self, soup, slide):
         """01.html (메인 페이지) 파싱"""
         # 제목 추가 (text-5xl = 48px)
@@ -928,8 +881,14 @@ class HTMLEditablePPTXConverterV6:
             # 임시 디렉토리 정리
             self.cleanup_temp_directory()
 
-def convert_folder_to_pptx(html_folder, output_path):
-    """폴더 내 모든 HTML 파일을 하나의 PPTX로 변환"""
+def convert_folder_to_pptx(html_folder, output_path, trace_path=None, vector_icons=False, network_icons=False):
+    """폴더 내 모든 HTML 파일을 하나의 PPTX로 변환
+    
+    trace_path를 지정하면 단계별 시간을 Chrome trace-event 형식으로 저장하고 슬라이드별 요약 표를 출력
+    vector_icons=True이면 아이콘을 PNG 대신 편집 가능한 자유형(custGeom) 벡터 도형으로 추가
+    로컬 웹폰트가 없으면 중단하고, network_icons=True일 때만 아이콘을 네트워크에서 받아 변환
+    """
+    tracer = StageTracer(enabled=trace_path is not None)
     try:
         html_folder = Path(html_folder)
         if not html_folder.exists():
@@ -946,6 +905,18 @@ def convert_folder_to_pptx(html_folder, output_path):
         for html_file in html_files:
             print(f"  - {html_file.name}")
         
+        # 아이콘 기본 경로는 로컬 웹폰트 (없으면 asset_mirror.py 안내 후 중단, --network-icons일 때만 네트워크 사용)
+        if not check_icon_font(network_icons):
+            return False
+        
+        # 아이콘 미리 받기: 저장소 SVG가 필요한 경우(벡터 아이콘, --network-icons) 슬라이드마다 네트워크를
+        # 기다리지 않도록 모든 파일의 아이콘을 한 번에 동시 조회하여 캐시를 채움
+        if vector_icons or not get_icon_font().available:
+            with tracer.span('icon_prefetch'):
+                icon_found, icon_missing = prefetch_html_icons(html_files,
+                                                               HTMLEditablePPTXConverterV6.extract_icon_class)
+            print(f"아이콘 미리 받기: {icon_found}개 준비, {icon_missing}개 없음")
+        
         # PPTX 프레젠테이션 생성
         prs = Presentation()
         
@@ -954,27 +925,33 @@ def convert_folder_to_pptx(html_folder, output_path):
             print(f"\n--- {html_file.name} 변환 중 ({i+1}/{len(html_files)}) ---")
             
             try:
-                # 슬라이드 추가
-                slide_layout = prs.slide_layouts[6]  # 빈 슬라이드
-                slide = prs.slides.add_slide(slide_layout)
-                
-                # HTML 파일 읽기
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # HTML 파일 타입에 따라 파싱
-                converter = HTMLEditablePPTXConverterV6(str(html_file), "")
-                converter.setup_temp_directory()  # 임시 디렉토리 설정
-                
-                if '01.html' in html_file.name:
-                    converter.parse_01_html(soup, slide)
-                elif '02.html' in html_file.name:
-                    converter.parse_02_html(soup, slide)
-                else:
-                    # 기본 파싱 (제목과 내용만)
-                    parse_generic_html(converter, soup, slide)
+                with tracer.slide(html_file.name):
+                    # 슬라이드 추가
+                    slide_layout = prs.slide_layouts[6]  # 빈 슬라이드
+                    with tracer.span('add_slide'):
+                        slide = prs.slides.add_slide(slide_layout)
+                    
+                    # HTML 파일 읽기
+                    with tracer.span('read_html'):
+                        with open(html_file, 'r', encoding='utf-8') as f:
+                            html_content = f.read()
+                    
+                    with tracer.span('BeautifulSoup'):
+                        soup = BeautifulSoup(html_content, 'html.parser')
+                    
+                    # HTML 파일 타입에 따라 파싱
+                    converter = HTMLEditablePPTXConverterV6(str(html_file), "", tracer=tracer,
+                                                            vector_icons=vector_icons)
+                    converter.setup_temp_directory()  # 임시 디렉토리 설정
+                    
+                    with tracer.span('build_shapes'):
+                        if '01.html' in html_file.name:
+                            converter.parse_01_html(soup, slide)
+                        elif '02.html' in html_file.name:
+                            converter.parse_02_html(soup, slide)
+                        else:
+                            # 기본 파싱 (제목과 내용만)
+                            parse_generic_html(converter, soup, slide)
                 
                 print(f"✅ {html_file.name} 변환 완료")
                 
@@ -983,7 +960,8 @@ def convert_folder_to_pptx(html_folder, output_path):
                 continue
         
         # PPTX 파일 저장
-        prs.save(output_path)
+        with tracer.span('prs.save'):
+            prs.save(output_path)
         print(f"\n✅ 모든 HTML 파일이 하나의 PPTX로 변환 완료!")
         print(f"출력 파일: {output_path}")
         return True
@@ -991,6 +969,12 @@ def convert_folder_to_pptx(html_folder, output_path):
     except Exception as e:
         print(f"폴더 변환 오류: {e}")
         return False
+    
+    finally:
+        # 단계별 시간 트레이스 저장
+        if tracer.enabled:
+            tracer.write(trace_path)
+            tracer.print_summary()
 
 def parse_generic_html(converter, soup, slide):
     """일반적인 HTML 파일 파싱"""
@@ -1027,6 +1011,10 @@ def main():
     # 설정
     html_folder = r"C:\Project\gigabitamin\genspark\dcs_site\html"
     output_path = r"C:\Project\gigabitamin\genspark\dcs_site\html\all_pages_editable_v6.pptx"
+    # 단계별 시간 트레이스 저장 위치 (--trace로 켜기, chrome://tracing 또는 Perfetto에서 열기)
+    trace_path = Path(output_path).parent / 'trace.json' if '--trace' in sys.argv[1:] else None
+    vector_icons = '--vector-icons' in sys.argv[1:]  # 아이콘을 자유형 벡터 도형으로 추가
+    network_icons = '--network-icons' in sys.argv[1:]  # 로컬 웹폰트가 없을 때 네트워크 아이콘 다운로드 허용
     
     print("HTML 폴더 to Editable PPTX 변환기 V6 시작")
     print(f"HTML 폴더: {html_folder}")
@@ -1034,7 +1022,7 @@ def main():
     print("-" * 50)
     
     # 폴더 변환 실행
-    success = convert_folder_to_pptx(html_folder, output_path)
+    success = convert_folder_to_pptx(html_folder, output_path, trace_path, vector_icons, network_icons)
     
     if success:
         print("-" * 50)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Icon Font
+FontAwesome 클래스(fa-*)를 all.min.css의 코드포인트로 찾아 로컬 웹폰트(fa-solid-900, fa-regular-400,
+fa-brands-400) 글리프를 Pillow ImageFont로 원하는 크기와 색상의 PNG로 그리는 아이콘 제공자
+네트워크와 브라우저 없이 동작하므로 객체 변환기의 아이콘 기본 경로로 사용한다.
+
+- 코드포인트 표: html_to_pptx_convert_image/static/all.min.css (FontAwesome Free 6)
+- 웹폰트 위치: static/webfonts 또는 로컬 폰트 캐시(~/.cache/html_to_pptx/fonts/webfonts)
+  (웹폰트는 저장소에 포함되어 있지 않으므로 html_to_pptx_convert_image/asset_mirror.py를 한 번 실행하여 받는다.
+  웹폰트가 없으면 변환기는 check_icon_font로 이유를 알리고 중단하며, --network-icons일 때만 네트워크로 진행한다)
+
+사용 예:
+    icon_font = get_icon_font()
+    png_file = icon_font.write_png('fas fa-chart-line', '#2563eb', 48, temp_dir)
+"""
+
+import re
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageColor, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from icon_store import parse_icon_class
+
+# 기본 설정
+IMAGE_STATIC_DIR = Path(__file__).resolve().parent.parent / 'html_to_pptx_convert_image' / 'static'
+DEFAULT_CSS = IMAGE_STATIC_DIR / 'all.min.css'
+DEFAULT_FONT_DIRS = [
+    IMAGE_STATIC_DIR / 'webfonts',
+    Path.home() / '.cache' / 'html_to_pptx' / 'fonts' / 'webfonts',
+]
+FONT_FILES = {
+    'solid': 'fa-solid-900',
+    'regular': 'fa-regular-400',
+    'brands': 'fa-brands-400',
+}
+FONT_EXTENSIONS = ('.ttf', '.woff2', '.woff')  # Pillow(FreeType)가 woff2를 읽으려면 brotli 지원이 필요
+SUPERSAMPLE = 4  # 글리프를 크게 그린 뒤 줄여서 가장자리를 매끄럽게
+
+# .fa-house:before,.fa-home:before{content:"\f015"}
+ICON_RULE_PATTERN = re.compile(r'((?:\.fa-[\w-]+:{1,2}before,?)+)\{content:"\\([0-9a-fA-F]+)"\}')
+ICON_NAME_PATTERN = re.compile(r'\.fa-([\w-]+):{1,2}before')
+# 브랜드 아이콘 규칙은 이 선언 뒤부터 다음 :root 선언 전까지
+BRANDS_SECTION_MARKER = ':root{--fa-style-family-brands'
+
+
+def load_codepoints(css_text):
+    """all.min.css에서 {아이콘 이름: 코드포인트 문자}와 브랜드 아이콘 이름 집합 추출"""
+    brands_start = css_text.find(BRANDS_SECTION_MARKER)
+    brands_end = css_text.find(':root{', brands_start + 1) if brands_start >= 0 else -1
+    if brands_end < 0:
+        brands_end = len(css_text)
+
+    codepoints = {}
+    brands = set()
+    for match in ICON_RULE_PATTERN.finditer(css_text):
+        char = chr(int(match.group(2), 16))
+        in_brands = brands_start >= 0 and brands_start <= match.start() < brands_end
+        for name in ICON_NAME_PATTERN.findall(match.group(1)):
+            codepoints[name] = char
+            if in_brands:
+                brands.add(name)
+    return codepoints, brands
+
+
+class IconFont:
+    """FontAwesome 웹폰트 글리프 렌더러 (여러 스레드에서 사용 가능)"""
+
+    def __init__(self, css_path=DEFAULT_CSS, font_dirs=None):
+        self.css_path = Path(css_path)
+        self.font_dirs = [Path(font_dir) for font_dir in (font_dirs or DEFAULT_FONT_DIRS)]
+        self._codepoints = None
+        self._brands = set()
+        self._font_paths = {}
+        self._fonts = {}  # (스타일, px 크기) -> ImageFont
+        self._lock = threading.Lock()
+        self._warned = False
+
+    def _load(self):
+        with self._lock:
+            if self._codepoints is not None:
+                return
+            codepoints = {}
+            if self.css_path.exists():
+                codepoints, self._brands = load_codepoints(self.css_path.read_text(encoding='utf-8'))
+            for style, stem in FONT_FILES.items():
+                for font_dir in self.font_dirs:
+                    path = next((font_dir / f"{stem}{ext}" for ext in FONT_EXTENSIONS
+                                 if (font_dir / f"{stem}{ext}").exists()), None)
+                    if path:
+                        self._font_paths[style] = path
+                        break
+            self._codepoints = codepoints
+
+    @property
+    def available(self):
+        """Pillow, 코드포인트 표, solid 웹폰트가 모두 있으면 True"""
+        self._load()
+        return PIL_AVAILABLE and bool(self._codepoints) and 'solid' in self._font_paths
+
+    def unavailable_reason(self):
+        """사용할 수 없는 이유 (사용할 수 있으면 None)"""
+        if self.available:
+            return None
+        if not PIL_AVAILABLE:
+            return "Pillow가 설치되지 않아 웹폰트 아이콘을 사용할 수 없습니다. pip install pillow로 설치하세요."
+        if not self._codepoints:
+            return f"FontAwesome 코드포인트 표를 찾을 수 없습니다: {self.css_path}"
+        searched = ', '.join(str(font_dir) for font_dir in self.font_dirs)
+        return (f"FontAwesome 웹폰트({FONT_FILES['solid']})를 찾을 수 없습니다 (찾아본 위치: {searched}). "
+                "html_to_pptx_convert_image/asset_mirror.py를 실행하여 로컬 폰트 캐시를 채우세요.")
+
+    def warn_unavailable(self):
+        """사용할 수 없는 이유를 한 번만 출력"""
+        if self._warned:
+            return
+        self._warned = True
+        print(self.unavailable_reason())
+
+    def _font(self, style, px):
+        key = (style, px)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                font = ImageFont.truetype(str(self._font_paths[style]), px)
+                self._fonts[key] = font
+        return font
+
+    def glyph(self, icon_class):
+        """아이콘 클래스의 (코드포인트 문자, 스타일 후보 리스트), 표에 없으면 None"""
+        self._load()
+        name, style = parse_icon_class(icon_class)
+        char = self._codepoints.get(name) if name else None
+        if char is None:
+            return None
+        if name in self._brands:
+            styles = ['brands']
+        elif style == 'regular':
+            # Free 버전 regular에는 일부 아이콘만 있으므로 없으면 solid로
+            styles = ['regular', 'solid']
+        else:
+            styles = ['solid']
+        return char, [candidate for candidate in styles if candidate in self._font_paths]
+
+    def render(self, icon_class, color='#2563eb', size=64):
+        """size x size 투명 배경 RGBA 이미지에 아이콘을 비율 유지하여 가운데 그림 (그릴 수 없으면 None)"""
+        if not self.available:
+            self.warn_unavailable()
+            return None
+        glyph = self.glyph(icon_class)
+        if glyph is None:
+            return None
+        char, styles = glyph
+
+        for style in styles:
+            font = self._font(style, size * SUPERSAMPLE)
+            left, top, right, bottom = font.getbbox(char)
+            if right <= left or bottom <= top:
+                # 폰트에 글리프가 없음 (.notdef는 비어 있음)
+                continue
+            mask = Image.new('L', (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), char, font=font, fill=255)
+
+            ratio = size / max(mask.width, mask.height)
+            fitted = mask.resize((max(1, round(mask.width * ratio)), max(1, round(mask.height * ratio))),
+                                 Image.LANCZOS)
+            rgb = ImageColor.getrgb(color)[:3]
+            layer = Image.new('RGBA', fitted.size, rgb + (255,))
+            layer.putalpha(fitted)
+            image = Image.new('RGBA', (size, size), rgb + (0,))
+            image.paste(layer, ((size - fitted.width) // 2, (size - fitted.height) // 2))
+            return image
+        return None
+
+    def write_png(self, icon_class, color, size, directory):
+        """render 결과를 directory/{이름}_{색상}_{크기}.png로 저장하고 경로 반환 (그릴 수 없으면 None)"""
+        image = self.render(icon_class, color, size)
+        if image is None:
+            return None
+        name, _ = parse_icon_class(icon_class)
+        color_tag = re.sub(r'[^0-9A-Za-z]', '', color)
+        png_file = Path(directory) / f"{name}_{color_tag}_{size}.png"
+        image.save(png_file)
+        return png_file
+
+
+_shared_font = None
+_shared_lock = threading.Lock()
+
+
+def get_icon_font():
+    """프로세스 공유 웹폰트 아이콘 렌더러"""
+    global _shared_font
+    with _shared_lock:
+        if _shared_font is None:
+            _shared_font = IconFont()
+        return _shared_font
+
+
+def check_icon_font(network_icons=False):
+    """변환 전에 로컬 웹폰트를 사용할 수 있는지 확인 (계속 진행해도 되면 True)
+
+    웹폰트가 없으면 이유를 출력하고 False를 반환한다. network_icons=True(--network-icons)일 때만
+    아이콘 저장소 다운로드와 HTML2Image 스크린샷으로 진행한다 (네트워크로 조용히 돌아가지 않음).
+    """
+    reason = get_icon_font().unavailable_reason()
+    if reason is None:
+        return True
+    print(f"로컬 웹폰트 아이콘을 사용할 수 없습니다: {reason}")
+    if network_icons:
+        print("--network-icons: 아이콘을 네트워크에서 받아 변환합니다 (지원하지 않는 SVG는 HTML2Image 스크린샷).")
+        return True
+    print("웹폰트를 받은 뒤 다시 실행하거나, 네트워크 아이콘을 쓰려면 --network-icons를 지정하세요.")
+    return False
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Icon Place
+객체 변환기들이 함께 쓰는 아이콘 배치 모듈
+- PNG: 로컬 웹폰트 글리프 → 아이콘 저장소 SVG의 프로세스 안 변환 → 호출자가 넘긴 브라우저 스크린샷 순서로 시도
+- vector_icons이면 자유형(custGeom) 벡터 도형을 먼저 시도하고, 실패하면 이유를 출력한 뒤 PNG 그림으로 대체
+
+tracer(stage_trace.StageTracer)를 넘기면 icon_font, icon_download, icon_svg_raster, icon_vector 단계를 span으로 기록한다.
+브라우저 스크린샷 폴백의 시간은 screenshot 함수 쪽에서 기록한다 (변환기의 icon_rasterize).
+
+사용 예:
+    shape = place_icon(slide, 'fas fa-house', '#2563eb', 32, left, top, width, height, temp_dir,
+                       vector_icons=True, screenshot=converter.svg_to_png_with_html2image)
+"""
+
+from contextlib import nullcontext
+
+from icon_font import get_icon_font
+from icon_shape import add_icon_freeform
+from icon_store import get_icon_store
+from svg_raster import UnsupportedSVG, svg_file_to_png
+
+
+def _span(tracer, stage):
+    """tracer가 있으면 stage span, 없으면 아무것도 기록하지 않는 컨텍스트"""
+    return tracer.span(stage) if tracer is not None else nullcontext()
+
+
+def icon_png(icon_class, color, size, temp_dir, screenshot=None, tracer=None):
+    """아이콘 PNG 파일 경로 (만들 수 없으면 None)
+
+    웹폰트 글리프를 우선 사용하고, 없으면 저장소 SVG를 temp_dir에 받아 프로세스 안에서 변환한다.
+    프로세스 안 변환이 지원하지 않는 SVG만 screenshot(svg_file, size)로 변환한다.
+    """
+    with _span(tracer, 'icon_font'):
+        try:
+            png_file = get_icon_font().write_png(icon_class, color, size, temp_dir)
+        except (OSError, ValueError) as e:
+            print(f"웹폰트 아이콘 그리기 오류 ({icon_class}): {e}")
+            png_file = None
+    if png_file:
+        return png_file
+
+    with _span(tracer, 'icon_download'):
+        try:
+            svg_file = get_icon_store().write_svg(icon_class, color, temp_dir)
+        except OSError as e:
+            print(f"아이콘 다운로드 오류 ({icon_class}): {e}")
+            svg_file = None
+    if not svg_file:
+        print(f"아이콘 다운로드 실패: {icon_class}")
+        return None
+
+    with _span(tracer, 'icon_svg_raster'):
+        png_file = svg_file_to_png(svg_file, size, temp_dir)
+    if png_file is None and screenshot is not None:
+        png_file = screenshot(svg_file, size)
+    return png_file
+
+
+def add_vector_icon(slide, icon_class, color, left, top, width, height):
+    """아이콘 SVG path를 편집 가능한 자유형(custGeom) 벡터 도형으로 추가하고 첫 도형 반환
+
+    저장소에 SVG가 없으면 LookupError, 자유형으로 그릴 수 없는 SVG이면 svg_raster.UnsupportedSVG
+    """
+    svg_content = get_icon_store().get_svg(icon_class)
+    if svg_content is None:
+        raise LookupError("아이콘 SVG 없음")
+    shapes = add_icon_freeform(slide.shapes, svg_content, left, top, width, height, color, name=f"Icon {icon_class}")
+    if not shapes:
+        raise UnsupportedSVG("채울 path 없음")
+    return shapes[0]
+
+
+def place_icon(slide, icon_class, color, px_size, left, top, width, height, temp_dir, vector_icons=False,
+               screenshot=None, tracer=None):
+    """아이콘을 left/top/width/height 상자에 추가하고 추가한 도형 반환 (추가하지 못하면 None)
+
+    vector_icons이면 자유형 벡터 도형, 아니거나 실패하면 px_size 크기 PNG 그림으로 추가한다.
+    """
+    if vector_icons:
+        try:
+            with _span(tracer, 'icon_vector'):
+                return add_vector_icon(slide, icon_class, color, left, top, width, height)
+        except (LookupError, UnsupportedSVG, OSError, ValueError) as e:
+            print(f"벡터 아이콘 대신 PNG 사용 ({icon_class}): {e}")
+
+    png_file = icon_png(icon_class, color, px_size, temp_dir, screenshot, tracer)
+    if png_file and png_file.exists():
+        return slide.shapes.add_picture(str(png_file), left, top, width, height)
+    return None
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Icon Shape
+FontAwesome SVG의 path를 PowerPoint 자유형(custGeom) 도형으로 바꿔 슬라이드에 벡터 아이콘으로 추가하는 모듈
+래스터 변환이 필요 없고, 확대해도 깨지지 않으며, PowerPoint에서 색상과 모양을 직접 편집할 수 있다.
+
+곡선은 svg_raster의 path 분석기로 짧은 선분으로 편 다음 python-pptx FreeformBuilder로 그린다.
+한 path의 하위 경로(구멍 등)는 한 자유형 도형 안의 여러 윤곽선이 된다.
+
+사용 예:
+    shapes = add_icon_freeform(slide.shapes, svg_content, Inches(1), Inches(1), Inches(0.3), Inches(0.3), '#2563eb')
+"""
+
+from pptx.dml.color import RGBColor
+from pptx.util import Emu
+
+from svg_raster import parse_color, parse_path, parse_svg
+
+# 기본 설정
+PATH_UNITS = 16  # viewBox 단위당 자유형 로컬 좌표 수 (로컬 좌표는 정수로 반올림되므로 정밀도 확보용)
+CURVE_DETAIL_PX = 512  # 곡선을 펼 때 기준으로 삼는 출력 크기 (확대해도 매끄럽도록 넉넉하게)
+
+
+def add_icon_freeform(shapes, svg_content, left, top, width, height, color=None, name=None):
+    """SVG path들을 left/top/width/height 상자에 비율 유지하여 가운데 배치한 자유형 도형으로 추가
+
+    color를 지정하면 SVG의 fill 대신 사용한다. path마다 도형 하나를 만들며 (FontAwesome은 보통 1개)
+    추가한 도형 리스트를 반환한다. 지원하지 않는 SVG이면 svg_raster.UnsupportedSVG
+    """
+    (min_x, min_y, view_width, view_height), paths = parse_svg(svg_content)
+    fit = min(width / view_width, height / view_height)  # viewBox 단위당 EMU
+    origin_x = Emu(round(left + (width - view_width * fit) / 2))
+    origin_y = Emu(round(top + (height - view_height * fit) / 2))
+    fill_override = parse_color(color) if color else None
+
+    added = []
+    for d, fill, _ in paths:
+        rgb = fill_override or parse_color(fill)
+        if rgb is None:
+            continue
+
+        builder = None
+        for polygon in parse_path(d, CURVE_DETAIL_PX / max(view_width, view_height)):
+            points = []
+            for px, py in polygon:
+                point = (round((px - min_x) * PATH_UNITS), round((py - min_y) * PATH_UNITS))
+                if not points or points[-1] != point:
+                    points.append(point)
+            if len(points) < 3:
+                continue
+            if builder is None:
+                builder = shapes.build_freeform(points[0][0], points[0][1], scale=fit / PATH_UNITS)
+            else:
+                builder.move_to(*points[0])
+            builder.add_line_segments(points[1:], close=True)
+        if builder is None:
+            continue
+
+        shape = builder.convert_to_shape(origin_x, origin_y)
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = RGBColor(*rgb)
+        shape.line.fill.background()
+        if name:
+            shape.name = name
+        added.append(shape)
+    return added
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Icon Store
+FontAwesome 아이콘 SVG를 아이콘 이름과 스타일(solid/brands/regular)로 한 번만 받아
+실행 중에는 메모리에, 실행 사이에는 디스크(~/.cache/html_to_pptx/icons)에 보관하는 공유 저장소
+
+- 원본 SVG(fill="currentColor")를 저장하고, 색상은 꺼낼 때마다 바꿔 쓰므로 색상별로 다시 받지 않는다.
+- 모든 경로에서 404였던 아이콘은 없는 아이콘으로 기록(.missing)하여 MISSING_TTL 동안 다시 조회하지 않는다.
+  (타임아웃/연결 오류는 기록하지 않으므로 네트워크가 돌아오면 다시 시도한다)
+- 다운로드는 연결을 재사용하는 HTTP 세션 하나로 하며, prefetch로 여러 아이콘을 동시에 미리 받을 수 있다.
+- mirror_dir(FontAwesome 저장소와 같은 {버전}/svgs/{스타일}/{이름}.svg 구조)가 있으면 네트워크보다 먼저 찾는다.
+
+사용 예:
+    store = get_icon_store()
+    store.prefetch(['fas fa-chart-line', 'fa-github'])  # 변환 전에 한 번에
+    svg_file = store.write_svg('fas fa-chart-line', '#2563eb', temp_dir)
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# 기본 설정
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'html_to_pptx' / 'icons'
+DEFAULT_TIMEOUT = 10  # 경로 하나당 다운로드 제한 시간 (초)
+MISSING_TTL = 7 * 24 * 3600  # 없는 아이콘 기록 유효 시간 (초)
+PREFETCH_WORKERS = 8  # 미리 받기 동시 요청 수 (HTTP 연결 풀 크기)
+ICON_BASE_URL = "https://raw.githubusercontent.com/FortAwesome/Font-Awesome"
+ICON_VERSIONS = ('6.x', '5.x')
+ICON_STYLES = ('solid', 'brands', 'regular')
+
+# 클래스 접두어 -> 스타일 (FontAwesome 5 약어와 6 이름)
+STYLE_PREFIXES = {
+    'fas': 'solid', 'fa-solid': 'solid',
+    'fab': 'brands', 'fa-brands': 'brands',
+    'far': 'regular', 'fa-regular': 'regular',
+}
+# 아이콘 이름이 아닌 크기/모양 보조 클래스
+MODIFIER_CLASSES = {
+    'fa-fw', 'fa-lg', 'fa-sm', 'fa-xs', 'fa-spin', 'fa-pulse', 'fa-border', 'fa-inverse',
+    'fa-pull-left', 'fa-pull-right', 'fa-li', 'fa-ul', 'fa-stack', 'fa-flip-horizontal', 'fa-flip-vertical',
+}
+COLOR_FILLS = ('fill="currentColor"', 'fill="#000"', 'fill="black"')
+ICON_CLASS_PATTERN = re.compile(r'^fa-')  # BeautifulSoup class_ 검색용 (클래스 값 하나씩 비교)
+
+
+def parse_icon_class(icon_class):
+    """'fas fa-chart-line', 'fa-solid fa-house', 'fa-github' 같은 클래스 문자열을 (이름, 스타일)로 분석
+
+    스타일 접두어가 없으면 스타일은 None (solid, brands, regular 순서로 찾음)
+    """
+    name = None
+    style = None
+    for token in icon_class.split():
+        if token in STYLE_PREFIXES:
+            style = STYLE_PREFIXES[token]
+        elif token in MODIFIER_CLASSES or token in ('fa', 'icon'):
+            continue
+        elif token.startswith('fa-') and name is None:
+            rest = token[3:]
+            # fa-2x, fa-10x 같은 크기 클래스
+            if rest.endswith('x') and rest[:-1].isdigit():
+                continue
+            name = rest
+    return name, style
+
+
+def icon_paths(name, style=None):
+    """아이콘을 찾을 상대 경로 리스트 (지정 스타일 우선, 버전은 6.x -> 5.x 순)"""
+    styles = ICON_STYLES if style is None else (style,) + tuple(s for s in ICON_STYLES if s != style)
+    return [f"{version}/svgs/{icon_style}/{name}.svg" for version in ICON_VERSIONS for icon_style in styles]
+
+
+def icon_urls(name, style=None, base_url=ICON_BASE_URL):
+    """아이콘을 찾을 URL 리스트 (icon_paths 순서)"""
+    return [f"{base_url.rstrip('/')}/{path}" for path in icon_paths(name, style)]
+
+
+def apply_color(svg_content, color):
+    """SVG의 기본 채우기 색을 color로 교체"""
+    for fill in COLOR_FILLS:
+        svg_content = svg_content.replace(fill, f'fill="{color}"')
+    return svg_content
+
+
+class IconStore:
+    """아이콘 이름/스타일 단위 SVG 저장소 (메모리 + 디스크, 없는 아이콘 기록 포함, 여러 스레드에서 사용 가능)
+
+    base_url을 None으로 주면 네트워크를 쓰지 않고 mirror_dir과 디스크 캐시만 사용한다.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, timeout=DEFAULT_TIMEOUT, missing_ttl=MISSING_TTL, verbose=False,
+                 base_url=ICON_BASE_URL, mirror_dir=None, max_connections=PREFETCH_WORKERS):
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self.missing_ttl = missing_ttl
+        self.verbose = verbose
+        self.base_url = base_url
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else None
+        self.max_connections = max_connections
+        self._session = None  # 연결을 재사용하는 HTTP 세션 (처음 다운로드할 때 생성)
+        self._memory = {}  # (이름, 스타일) -> SVG 문자열 또는 None (없는 아이콘)
+        self._lock = threading.Lock()
+        self._key_locks = {}  # 같은 아이콘을 여러 스레드가 동시에 받지 않도록 키마다 잠금
+
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    def _paths(self, name, style):
+        directory = self.cache_dir / (style or 'any')
+        return directory / f"{name}.svg", directory / f"{name}.missing"
+
+    def _read_disk(self, name, style):
+        """디스크 캐시 조회: SVG 문자열, 없는 아이콘이면 None, 기록이 없으면 False"""
+        svg_path, missing_path = self._paths(name, style)
+        try:
+            return svg_path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+        try:
+            if time.time() - missing_path.stat().st_mtime < self.missing_ttl:
+                return None
+        except OSError:
+            pass
+        return False
+
+    def _write_disk(self, path, content):
+        """다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                             suffix='.tmp', delete=False) as f:
+                f.write(content)
+            Path(f.name).replace(path)
+        except OSError as e:
+            self._log(f"아이콘 캐시 저장 실패 ({path.name}): {e}")
+
+    def _http(self):
+        """여러 스레드가 함께 쓰는 HTTP 세션 (연결 풀 크기 max_connections, keep-alive)"""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.max_connections)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def _read_mirror(self, name, style):
+        """로컬 미러에서 원본 SVG 찾기 (없으면 None)"""
+        for path in icon_paths(name, style):
+            try:
+                return (self.mirror_dir / path).read_text(encoding='utf-8')
+            except OSError:
+                continue
+        return None
+
+    def _download(self, name, style):
+        """미러 또는 원격에서 원본 SVG 받기: SVG 문자열, 모든 경로가 404면 None, 네트워크 오류/오프라인이면 False"""
+        if self.mirror_dir is not None:
+            svg_content = self._read_mirror(name, style)
+            if svg_content is not None:
+                return svg_content
+        if self.base_url is None:
+            return False
+        if not REQUESTS_AVAILABLE:
+            self._log("requests가 설치되지 않아 아이콘을 다운로드할 수 없습니다.")
+            return False
+        session = self._http()
+        all_missing = True
+        for url in icon_urls(name, style, self.base_url):
+            try:
+                self._log(f"아이콘 다운로드 시도: {name} -> {url}")
+                response = session.get(url, timeout=self.timeout)
+            except Exception as e:
+                self._log(f"경로 실패: {e}")
+                all_missing = False
+                continue
+            if response.status_code == 200:
+                return response.text
+            if response.status_code != 404:
+                all_missing = False
+        return None if all_missing else False
+
+    def get_svg(self, icon_class):
+        """아이콘 원본 SVG 문자열 (색상 미적용, 찾을 수 없으면 None)"""
+        name, style = parse_icon_class(icon_class)
+        if not name:
+            return None
+        key = (name, style)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._memory:
+                    return self._memory[key]
+
+            svg_content = self._read_disk(name, style)
+            if svg_content is False:
+                svg_content = self._download(name, style)
+                svg_path, missing_path = self._paths(name, style)
+                if svg_content:
+                    self._write_disk(svg_path, svg_content)
+                elif svg_content is None:
+                    self._write_disk(missing_path, '')
+                    self._log(f"없는 아이콘으로 기록: {icon_class}")
+                else:
+                    # 네트워크 오류: 이번 실행에서만 없는 것으로 보고 디스크에는 남기지 않음
+                    svg_content = None
+
+            with self._lock:
+                self._memory[key] = svg_content
+            return svg_content
+
+    def prefetch(self, icon_classes, workers=PREFETCH_WORKERS):
+        """아이콘 클래스들을 (이름, 스타일) 단위로 중복 제거하여 동시에 조회해 캐시를 채움
+
+        반환값: (찾은 아이콘 수, 찾지 못한 아이콘 수)
+        """
+        unique = {}
+        for icon_class in icon_classes:
+            key = parse_icon_class(icon_class)
+            if key[0]:
+                unique.setdefault(key, icon_class)
+        if not unique:
+            return 0, 0
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as executor:
+            results = list(executor.map(self.get_svg, unique.values()))
+        found = sum(1 for svg_content in results if svg_content)
+        return found, len(results) - found
+
+    def colored_svg(self, icon_class, color):
+        """color를 적용한 SVG 문자열 (찾을 수 없으면 None)"""
+        svg_content = self.get_svg(icon_class)
+        return apply_color(svg_content, color) if svg_content else None
+
+    def write_svg(self, icon_class, color, directory):
+        """color를 적용한 SVG를 directory/{이름}.svg로 저장하고 경로 반환 (찾을 수 없으면 None)"""
+        svg_content = self.colored_svg(icon_class, color)
+        if svg_content is None:
+            return None
+        name, _ = parse_icon_class(icon_class)
+        svg_file = Path(directory) / f"{name}.svg"
+        with open(svg_file, 'w', encoding='utf-8') as f:
+            f.write(svg_content)
+        return svg_file
+
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_icon_store():
+    """프로세스 공유 아이콘 저장소
+
+    환경 변수로 바꿀 수 있다: HTML_TO_PPTX_ICON_CACHE (디스크 캐시 위치),
+    HTML_TO_PPTX_ICON_MIRROR (로컬 미러 폴더), HTML_TO_PPTX_ICON_BASE_URL (다운로드 주소, 'offline'이면 네트워크 사용 안 함)
+    """
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            base_url = os.environ.get('HTML_TO_PPTX_ICON_BASE_URL', ICON_BASE_URL)
+            _shared_store = IconStore(os.environ.get('HTML_TO_PPTX_ICON_CACHE', DEFAULT_CACHE_DIR),
+                                      base_url=None if base_url == 'offline' else base_url,
+                                      mirror_dir=os.environ.get('HTML_TO_PPTX_ICON_MIRROR'))
+        return _shared_store
+
+
+def prefetch_html_icons(html_files, extract_icon_class, store=None, workers=PREFETCH_WORKERS):
+    """HTML 파일들의 fa-* 클래스를 가진 요소마다 extract_icon_class(element)로 아이콘 클래스를 모아 한 번에 미리 받음
+
+    도형을 만드는 코드와 같은 추출 함수를 써서 같은 키로 캐시되므로, 변환 중 아이콘 조회는 메모리 캐시에서 끝난다.
+    반환값: (찾은 아이콘 수, 찾지 못한 아이콘 수)
+    """
+    from bs4 import BeautifulSoup
+
+    icon_classes = set()
+    for html_file in html_files:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        for element in soup.find_all(class_=ICON_CLASS_PATTERN):
+            icon_class = extract_icon_class(element)
+            if icon_class:
+                icon_classes.add(icon_class)
+    return (store or get_icon_store()).prefetch(icon_classes, workers)
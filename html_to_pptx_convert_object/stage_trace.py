@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage Trace
+변환 단계(HTML 파싱, 높이 조절, 브라우저 로드, 스크린샷, 리사이즈, add_picture, 저장)마다 걸린 시간을
+span으로 기록하여 Chrome trace-event 형식(trace.json)과 슬라이드별 요약 표로 출력하는 모듈
+trace.json은 chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있다.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class StageTracer:
+    """단계별 span 기록기 (여러 스레드에서 동시에 사용 가능)
+
+    사용 예:
+        tracer = StageTracer()
+        with tracer.slide('01.html'):
+            with tracer.span('adjust_html_height'):
+                ...
+        tracer.write('trace.json')
+        tracer.print_summary()
+
+    enabled=False이면 아무것도 기록하지 않는다 (기본 변환기는 비활성 tracer를 사용).
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.events = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def slide(self, name):
+        """이 블록 안의 span을 슬라이드 name에 귀속 (현재 스레드 기준)"""
+        previous = getattr(self._local, 'slide', None)
+        self._local.slide = name
+        try:
+            yield
+        finally:
+            self._local.slide = previous
+
+    @property
+    def current_slide(self):
+        return getattr(self._local, 'slide', None)
+
+    @contextmanager
+    def span(self, stage, slide=None):
+        """블록 실행 시간을 stage span으로 기록"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, start, time.perf_counter() - start, slide)
+
+    def record(self, stage, start, duration, slide=None):
+        """시작 시각(perf_counter 초)과 길이(초)로 span 하나 기록"""
+        if not self.enabled:
+            return
+        slide = slide if slide is not None else self.current_slide
+        event = {
+            'name': stage,
+            'cat': 'slide' if slide is not None else 'deck',
+            'ph': 'X',  # complete event
+            'ts': round((start - self._origin) * 1_000_000, 1),  # 마이크로초
+            'dur': round(duration * 1_000_000, 1),
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': {'slide': slide} if slide is not None else {},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def record_timings(self, start, timings, prefix='', slide=None):
+        """백엔드가 반환한 단계별 시간({'load_ms': .., 'wait_ms': ..})을 start부터 이어지는 span으로 기록
+
+        브라우저 안에서 순서대로 실행된 단계이므로 반환된 순서대로 연속 배치한다 (total_ms 등 합계는 제외).
+        """
+        offset = start
+        for name, value in timings.items():
+            if not name.endswith('_ms') or name == 'total_ms' or not isinstance(value, (int, float)):
+                continue
+            self.record(f"{prefix}{name[:-3]}", offset, value / 1000, slide)
+            offset += value / 1000
+
+    def write(self, trace_path):
+        """Chrome trace-event 형식 JSON 저장"""
+        if not self.enabled:
+            return None
+        trace_path = Path(trace_path)
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event['ts'])
+        trace_path.write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}, ensure_ascii=False),
+                              encoding='utf-8')
+        print(f"트레이스 저장: {trace_path} ({len(events)}개 span)")
+        return trace_path
+
+    def summary(self):
+        """{슬라이드: {단계: 합계 ms}}, {단계: 합계 ms} (슬라이드에 속하지 않은 단계는 두 번째 dict)"""
+        per_slide = {}
+        deck = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            slide = event['args'].get('slide')
+            target = deck if slide is None else per_slide.setdefault(slide, {})
+            target[event['name']] = target.get(event['name'], 0) + event['dur'] / 1000
+        return per_slide, deck
+
+    def print_summary(self):
+        """슬라이드별 단계 시간 표 출력 (ms)"""
+        if not self.enabled:
+            return
+        per_slide, deck = self.summary()
+        stages = []
+        for timings in per_slide.values():
+            for stage in timings:
+                if stage not in stages:
+                    stages.append(stage)
+
+        if per_slide:
+            name_width = max(len('슬라이드'), *(len(str(slide)) for slide in per_slide))
+            print("슬라이드별 단계 시간 (ms):")
+            print(f"{'슬라이드':<{name_width}} | " + " | ".join(f"{stage:>12}" for stage in stages))
+            for slide in sorted(per_slide, key=str):
+                timings = per_slide[slide]
+                print(f"{str(slide):<{name_width}} | " +
+                      " | ".join(f"{timings[stage]:>12.1f}" if stage in timings else f"{'-':>12}" for stage in stages))
+        if deck:
+            print("전체 단계 시간 (ms): " + ", ".join(f"{stage} {ms:.1f}" for stage, ms in deck.items()))
+
+
+def traced(stage):
+    """메서드 실행 시간을 self.tracer의 stage span으로 기록하는 데코레이터 (tracer가 없으면 그대로 실행)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, 'tracer', None)
+            if tracer is None or not tracer.enabled:
+                return method(self, *args, **kwargs)
+            with tracer.span(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG Raster
+FontAwesome 아이콘처럼 path 몇 개로 된 SVG를 브라우저 없이 프로세스 안에서 PNG 바이트로 변환하는 모듈
+(임시 HTML + Chrome 스크린샷 대신 수 밀리초 안에 변환)
+
+- cairosvg가 설치되어 있으면 cairosvg로 변환
+- 없으면 내장 path 렌더러 사용: viewBox, <path d>(M L H V C S Q T A Z), fill/fill-rule만 지원하며
+  곡선을 선분으로 펴서 nonzero/evenodd 규칙으로 안티앨리어싱 스캔라인 채우기를 한다.
+  지원하지 않는 요소(transform, circle, rect, text 등)가 있으면 None을 반환하므로 호출자가 브라우저 변환으로 폴백한다.
+
+사용 예:
+    png_bytes = svg_to_png_bytes(svg_content, 48)
+    png_file = svg_file_to_png(svg_file, 48, temp_dir)
+"""
+
+import math
+import re
+import struct
+import zlib
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+try:
+    import cairosvg
+    CAIROSVG_AVAILABLE = True
+except (ImportError, OSError):
+    # cairosvg는 설치되어 있어도 시스템 cairo 라이브러리가 없으면 OSError
+    CAIROSVG_AVAILABLE = False
+
+# 기본 설정
+SUPERSAMPLE = 4  # 픽셀당 세로 부분 스캔라인 수 (가로는 정확한 구간 면적으로 계산)
+CURVE_TOLERANCE = 0.25  # 곡선을 선분으로 펼 때 허용하는 최대 오차 (출력 픽셀)
+
+NUMBER_PATTERN = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+PATH_COMMANDS = 'MmLlHhVvCcSsQqTtAaZz'
+UNSUPPORTED_ELEMENTS = {'circle', 'ellipse', 'rect', 'line', 'polyline', 'polygon', 'text', 'image', 'use',
+                        'mask', 'clipPath', 'pattern', 'linearGradient', 'radialGradient', 'filter'}
+NAMED_COLORS = {'black': (0, 0, 0), 'white': (255, 255, 255)}
+
+
+class UnsupportedSVG(Exception):
+    """내장 렌더러가 처리하지 않는 SVG 기능"""
+
+
+def parse_color(value, current_color=(0, 0, 0)):
+    """SVG 색상값을 (r, g, b)로 변환 ('none'이면 None)"""
+    value = value.strip()
+    lowered = value.lower()
+    if lowered == 'none':
+        return None
+    if lowered == 'currentcolor':
+        return current_color
+    if lowered in NAMED_COLORS:
+        return NAMED_COLORS[lowered]
+    if re.fullmatch(r'#[0-9a-fA-F]{3}', value):
+        return tuple(int(c * 2, 16) for c in value[1:])
+    if re.fullmatch(r'#[0-9a-fA-F]{6}', value):
+        return tuple(int(value[i:i + 2], 16) for i in (1, 3, 5))
+    match = re.fullmatch(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', lowered)
+    if match:
+        return tuple(min(255, int(c)) for c in match.groups())
+    raise UnsupportedSVG(f"색상: {value}")
+
+
+class _PathReader:
+    """path d 속성 토큰 읽기 (숫자 사이 구분자 생략, 호 플래그 붙여쓰기 허용)"""
+
+    def __init__(self, d):
+        self.d = d
+        self.i = 0
+
+    def _skip(self):
+        while self.i < len(self.d) and self.d[self.i] in ' ,\t\r\n':
+            self.i += 1
+
+    def command(self):
+        """다음 명령 문자 (숫자가 이어지면 None, 끝이면 '')"""
+        self._skip()
+        if self.i >= len(self.d):
+            return ''
+        char = self.d[self.i]
+        if char in PATH_COMMANDS:
+            self.i += 1
+            return char
+        if char.isalpha():
+            raise UnsupportedSVG(f"path 명령: {char}")
+        return None
+
+    def number(self):
+        self._skip()
+        match = NUMBER_PATTERN.match(self.d, self.i)
+        if not match:
+            raise UnsupportedSVG(f"path 숫자 위치 {self.i}")
+        self.i = match.end()
+        return float(match.group())
+
+    def flag(self):
+        self._skip()
+        if self.i < len(self.d) and self.d[self.i] in '01':
+            self.i += 1
+            return self.d[self.i - 1] == '1'
+        raise UnsupportedSVG(f"호 플래그 위치 {self.i}")
+
+
+def _segments(length, scale):
+    """출력 픽셀 기준 길이에 맞는 곡선 분할 수"""
+    return max(2, min(64, int(math.sqrt(length * scale / CURVE_TOLERANCE))))
+
+
+def _arc_points(x1, y1, rx, ry, angle, large_arc, sweep, x2, y2, scale):
+    """SVG 호(끝점 표현)를 중심 표현으로 바꾸어 선분 점 리스트로 변환 (SVG 명세 F.6.5)"""
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return [(x2, y2)]
+    phi = math.radians(angle)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+    radii = x1p ** 2 / rx ** 2 + y1p ** 2 / ry ** 2
+    if radii > 1:
+        rx, ry = rx * math.sqrt(radii), ry * math.sqrt(radii)
+    numerator = rx ** 2 * ry ** 2 - rx ** 2 * y1p ** 2 - ry ** 2 * x1p ** 2
+    denominator = rx ** 2 * y1p ** 2 + ry ** 2 * x1p ** 2
+    coef = math.sqrt(max(0.0, numerator / denominator)) if denominator else 0.0
+    if large_arc == sweep:
+        coef = -coef
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+
+    def vector_angle(ux, uy, vx, vy):
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    theta = vector_angle(1, 0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = vector_angle((x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry)
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    count = _segments(max(rx, ry) * abs(delta), scale)
+    points = []
+    for k in range(1, count + 1):
+        t = theta + delta * k / count
+        points.append((cx + rx * math.cos(t) * cos_phi - ry * math.sin(t) * sin_phi,
+                       cy + rx * math.cos(t) * sin_phi + ry * math.sin(t) * cos_phi))
+    points[-1] = (x2, y2)
+    return points
+
+
+def _cubic_points(p0, p1, p2, p3, scale):
+    length = math.dist(p0, p1) + math.dist(p1, p2) + math.dist(p2, p3)
+    count = _segments(length, scale)
+    points = []
+    for k in range(1, count + 1):
+        t = k / count
+        u = 1 - t
+        points.append((u ** 3 * p0[0] + 3 * u * u * t * p1[0] + 3 * u * t * t * p2[0] + t ** 3 * p3[0],
+                       u ** 3 * p0[1] + 3 * u * u * t * p1[1] + 3 * u * t * t * p2[1] + t ** 3 * p3[1]))
+    return points
+
+
+def _quad_points(p0, p1, p2, scale):
+    count = _segments(math.dist(p0, p1) + math.dist(p1, p2), scale)
+    points = []
+    for k in range(1, count + 1):
+        t = k / count
+        u = 1 - t
+        points.append((u * u * p0[0] + 2 * u * t * p1[0] + t * t * p2[0],
+                       u * u * p0[1] + 2 * u * t * p1[1] + t * t * p2[1]))
+    return points
+
+
+def parse_path(d, scale=1.0):
+    """path d 속성을 닫힌 다각형(사용자 좌표 점 리스트) 리스트로 변환 (scale: 사용자 단위당 출력 픽셀)"""
+    reader = _PathReader(d)
+    polygons = []
+    current = []
+    x = y = start_x = start_y = 0.0
+    last_control = None  # (명령 종류 'c'/'q', 마지막 제어점) - S/T 반사용
+    command = None
+
+    while True:
+        next_command = reader.command()
+        if next_command == '':
+            break
+        if next_command is not None:
+            command = next_command
+        elif command is None or command in 'Zz':
+            raise UnsupportedSVG("path가 명령 없이 시작")
+
+        kind = command.lower()
+        relative = command.islower()
+        if kind == 'z':
+            if current:
+                polygons.append(current)
+            current = []
+            x, y = start_x, start_y
+            last_control = None
+            continue
+
+        ox, oy = (x, y) if relative else (0.0, 0.0)
+        if kind == 'm':
+            if current:
+                polygons.append(current)
+            x, y = reader.number() + ox, reader.number() + oy
+            start_x, start_y = x, y
+            current = [(x, y)]
+            last_control = None
+            # 이어지는 좌표쌍은 lineto
+            command = 'l' if relative else 'L'
+            continue
+        if not current:
+            current = [(x, y)]
+
+        if kind == 'l':
+            x, y = reader.number() + ox, reader.number() + oy
+            current.append((x, y))
+            last_control = None
+        elif kind == 'h':
+            x = reader.number() + ox
+            current.append((x, y))
+            last_control = None
+        elif kind == 'v':
+            y = reader.number() + oy
+            current.append((x, y))
+            last_control = None
+        elif kind in 'cs':
+            if kind == 'c':
+                c1 = (reader.number() + ox, reader.number() + oy)
+            elif last_control and last_control[0] == 'c':
+                c1 = (2 * x - last_control[1][0], 2 * y - last_control[1][1])
+            else:
+                c1 = (x, y)
+            c2 = (reader.number() + ox, reader.number() + oy)
+            end = (reader.number() + ox, reader.number() + oy)
+            current.extend(_cubic_points((x, y), c1, c2, end, scale))
+            x, y = end
+            last_control = ('c', c2)
+        elif kind in 'qt':
+            if kind == 'q':
+                c1 = (reader.number() + ox, reader.number() + oy)
+            elif last_control and last_control[0] == 'q':
+                c1 = (2 * x - last_control[1][0], 2 * y - last_control[1][1])
+            else:
+                c1 = (x, y)
+            end = (reader.number() + ox, reader.number() + oy)
+            current.extend(_quad_points((x, y), c1, end, scale))
+            x, y = end
+            last_control = ('q', c1)
+        elif kind == 'a':
+            rx, ry, angle = reader.number(), reader.number(), reader.number()
+            large_arc, sweep = reader.flag(), reader.flag()
+            end = (reader.number() + ox, reader.number() + oy)
+            current.extend(_arc_points(x, y, rx, ry, angle, large_arc, sweep, end[0], end[1], scale))
+            x, y = end
+            last_control = None
+
+    if current:
+        polygons.append(current)
+    return [polygon for polygon in polygons if len(polygon) > 2]
+
+
+def _add_span(row, xa, xb, weight):
+    """한 부분 스캔라인의 [xa, xb) 구간 면적을 픽셀 커버리지에 더함"""
+    width = len(row)
+    xa, xb = max(0.0, xa), min(float(width), xb)
+    if xb <= xa:
+        return
+    ia, ib = int(xa), int(xb)
+    if ia == ib:
+        row[ia] += (xb - xa) * weight
+        return
+    row[ia] += (ia + 1 - xa) * weight
+    for p in range(ia + 1, ib):
+        row[p] += weight
+    if ib < width:
+        row[ib] += (xb - ib) * weight
+
+
+def rasterize_polygons(polygons, width, height, evenodd=False):
+    """출력 픽셀 좌표 다각형들을 채운 커버리지(0~1) 행 리스트"""
+    edges = []
+    for polygon in polygons:
+        for (x0, y0), (x1, y1) in zip(polygon, polygon[1:] + polygon[:1]):
+            if y0 == y1:
+                continue
+            direction = 1 if y1 > y0 else -1
+            if y0 > y1:
+                x0, y0, x1, y1 = x1, y1, x0, y0
+            edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0), direction))
+    edges.sort()
+
+    rows = [[0.0] * width for _ in range(height)]
+    weight = 1.0 / SUPERSAMPLE
+    first = 0  # 아직 끝나지 않은 변 중 y0가 가장 작은 변 위치 (정렬된 edges 기준)
+    for row_index in range(height):
+        row = rows[row_index]
+        for k in range(SUPERSAMPLE):
+            sy = row_index + (k + 0.5) / SUPERSAMPLE
+            crossings = []
+            for index in range(first, len(edges)):
+                y0, y1, x0, slope, direction = edges[index]
+                if y0 > sy:
+                    break
+                if sy < y1:
+                    crossings.append((x0 + (sy - y0) * slope, direction))
+            if not crossings:
+                continue
+            crossings.sort()
+            winding = 0
+            span_start = 0.0
+            for cross_x, direction in crossings:
+                inside = (winding % 2 == 1) if evenodd else winding != 0
+                winding += direction
+                now_inside = (winding % 2 == 1) if evenodd else winding != 0
+                if not inside and now_inside:
+                    span_start = cross_x
+                elif inside and not now_inside:
+                    _add_span(row, span_start, cross_x, weight)
+        # 다음 행 위쪽보다 먼저 끝난 변은 앞쪽 검사에서 제외
+        while first < len(edges) and edges[first][1] <= row_index + 1:
+            first += 1
+    return rows
+
+
+def encode_png(width, height, rgba):
+    """RGBA 바이트를 PNG 파일 바이트로 인코딩 (Pillow 불필요)"""
+    stride = width * 4
+    raw = b''.join(b'\x00' + rgba[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw, 6))
+            + chunk(b'IEND', b''))
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _collect_paths(element, fill, fill_rule, paths):
+    """요소 트리를 돌며 (d, 채우기 색, fill-rule) 리스트 수집 (fill/fill-rule 상속)"""
+    name = _local_name(element.tag)
+    if name in UNSUPPORTED_ELEMENTS:
+        raise UnsupportedSVG(f"요소: {name}")
+    if 'transform' in element.attrib or 'style' in element.attrib:
+        raise UnsupportedSVG("transform/style 속성")
+    if 'fill' in element.attrib:
+        fill = element.attrib['fill']
+    fill_rule = element.attrib.get('fill-rule', fill_rule)
+    if name == 'path' and element.attrib.get('d'):
+        paths.append((element.attrib['d'], fill, fill_rule))
+    for child in element:
+        _collect_paths(child, fill, fill_rule, paths)
+
+
+def parse_svg(svg_content):
+    """SVG를 (viewBox (min_x, min_y, 너비, 높이), [(path d, fill, fill-rule), ...])로 분석
+
+    내장 렌더러가 처리하지 않는 기능이 있으면 UnsupportedSVG
+    """
+    try:
+        root = ET.fromstring(svg_content)
+    except ET.ParseError as e:
+        raise UnsupportedSVG(f"XML 파싱 실패: {e}")
+    if _local_name(root.tag) != 'svg':
+        raise UnsupportedSVG("svg 루트 요소 없음")
+
+    view_box = root.attrib.get('viewBox')
+    if view_box:
+        min_x, min_y, view_width, view_height = (float(value) for value in NUMBER_PATTERN.findall(view_box)[:4])
+    else:
+        min_x = min_y = 0.0
+        view_width = float(NUMBER_PATTERN.match(root.attrib.get('width', '0')).group())
+        view_height = float(NUMBER_PATTERN.match(root.attrib.get('height', '0')).group())
+    if view_width <= 0 or view_height <= 0:
+        raise UnsupportedSVG("viewBox 크기 없음")
+
+    paths = []
+    _collect_paths(root, 'black', 'nonzero', paths)
+    return (min_x, min_y, view_width, view_height), paths
+
+
+def rasterize_svg(svg_content, size=64):
+    """내장 path 렌더러로 SVG를 size x size RGBA 바이트로 변환 (viewBox를 비율 유지하여 가운데 배치)"""
+    (min_x, min_y, view_width, view_height), paths = parse_svg(svg_content)
+    scale = min(size / view_width, size / view_height)
+    offset_x = (size - view_width * scale) / 2 - min_x * scale
+    offset_y = (size - view_height * scale) / 2 - min_y * scale
+
+    canvas = [[0.0, 0.0, 0.0, 0.0] for _ in range(size * size)]  # 미리 곱한 알파 (r, g, b, a)
+    for d, fill, fill_rule in paths:
+        color = parse_color(fill)
+        if color is None:
+            continue
+        polygons = [[(px * scale + offset_x, py * scale + offset_y) for px, py in polygon]
+                    for polygon in parse_path(d, scale)]
+        rows = rasterize_polygons(polygons, size, size, evenodd=(fill_rule == 'evenodd'))
+        for y, row in enumerate(rows):
+            for x, coverage in enumerate(row):
+                if coverage <= 0:
+                    continue
+                alpha = min(1.0, coverage)
+                pixel = canvas[y * size + x]
+                for channel in range(3):
+                    pixel[channel] = color[channel] / 255 * alpha + pixel[channel] * (1 - alpha)
+                pixel[3] = alpha + pixel[3] * (1 - alpha)
+
+    rgba = bytearray(size * size * 4)
+    for index, (r, g, b, a) in enumerate(canvas):
+        if a <= 0:
+            continue
+        rgba[index * 4:index * 4 + 4] = bytes((round(r / a * 255), round(g / a * 255), round(b / a * 255),
+                                               round(a * 255)))
+    return bytes(rgba)
+
+
+def svg_to_png_bytes(svg_content, size=64):
+    """SVG 문자열을 size x size PNG 바이트로 변환 (cairosvg 우선, 내장 렌더러 폴백, 둘 다 안 되면 None)"""
+    if CAIROSVG_AVAILABLE:
+        try:
+            return cairosvg.svg2png(bytestring=svg_content.encode('utf-8'), output_width=size, output_height=size)
+        except Exception:
+            pass
+    try:
+        return encode_png(size, size, rasterize_svg(svg_content, size))
+    except (UnsupportedSVG, ValueError, ZeroDivisionError):
+        return None
+
+
+def svg_file_to_png(svg_file, size, out_dir):
+    """SVG 파일을 out_dir에 size x size PNG 파일로 변환하여 경로 반환
+
+    변환할 수 없는 SVG이거나 파일을 읽고 쓸 수 없으면 None (호출자가 HTML2Image 스크린샷으로 폴백)
+    """
+    svg_file = Path(svg_file)
+    try:
+        png_bytes = svg_to_png_bytes(svg_file.read_text(encoding='utf-8'), size)
+        if not png_bytes:
+            return None
+        png_file = Path(out_dir) / f"{svg_file.stem}_{size}.png"
+        png_file.write_bytes(png_bytes)
+        return png_file
+    except (OSError, UnicodeDecodeError):
+        return None
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+아이콘 미리 받기(prefetch) 테스트
+FontAwesome 저장소 대신 로컬 대역 HTTP 서버와 로컬 미러 폴더로 IconStore.prefetch를 확인한다.
+"""
+
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from icon_store import REQUESTS_AVAILABLE, IconStore
+
+SAMPLE_SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 512 512"><path d="M0 0H512V512H0Z"/></svg>'
+MIRROR_ICONS = ['6.x/svgs/solid/house.svg', '6.x/svgs/solid/chart-line.svg', '6.x/svgs/brands/github.svg']
+
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    """요청 수를 세고, 실제 네트워크처럼 약간 지연시키는 정적 파일 핸들러"""
+    request_count = 0
+    count_lock = threading.Lock()
+
+    def do_GET(self):
+        with CountingHandler.count_lock:
+            CountingHandler.request_count += 1
+        time.sleep(0.05)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_mirror(root):
+    """FontAwesome 저장소와 같은 구조의 미러 폴더 생성"""
+    for relative in MIRROR_ICONS:
+        path = Path(root) / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(SAMPLE_SVG, encoding='utf-8')
+
+
+def start_server(root):
+    """root 폴더를 제공하는 로컬 대역 서버 시작, (서버, 주소) 반환"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(CountingHandler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_prefetch_server():
+    """대역 서버에서 동시에 받고, 두 번째 prefetch는 요청 없이 캐시에서 끝나는지 확인 (requests 필요)"""
+    if not REQUESTS_AVAILABLE:
+        print("requests가 설치되지 않아 대역 서버 prefetch 테스트를 건너뜁니다. pip install requests로 설치하세요.")
+        return
+    with tempfile.TemporaryDirectory() as mirror, tempfile.TemporaryDirectory() as cache:
+        make_mirror(mirror)
+        server, base_url = start_server(mirror)
+        try:
+            store = IconStore(cache_dir=cache, base_url=base_url)
+            icons = ['fas fa-house', 'fa-house', 'fa-solid fa-chart-line', 'fab fa-github', 'fas fa-not-an-icon']
+
+            start = time.perf_counter()
+            found, missing = store.prefetch(icons)
+            elapsed = time.perf_counter() - start
+            print(f"첫 번째 prefetch: {found}개 준비, {missing}개 없음, "
+                  f"요청 {CountingHandler.request_count}회, {elapsed * 1000:.0f}ms")
+            assert (found, missing) == (4, 1), (found, missing)
+            assert (Path(cache) / 'solid' / 'not-an-icon.missing').exists(), "없는 아이콘 기록이 없습니다"
+
+            requests_before = CountingHandler.request_count
+            assert store.prefetch(icons) == (4, 1)
+            fresh_store = IconStore(cache_dir=cache, base_url=base_url)
+            assert fresh_store.prefetch(icons) == (4, 1)
+            print(f"두 번째 prefetch (메모리/디스크 캐시): 추가 요청 {CountingHandler.request_count - requests_before}회")
+            assert CountingHandler.request_count == requests_before, "캐시된 아이콘을 다시 요청했습니다"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_prefetch_mirror():
+    """네트워크 없이 미러 폴더만으로 받는지 확인 (미러에 없는 아이콘은 없는 아이콘으로 기록하지 않음)"""
+    with tempfile.TemporaryDirectory() as mirror, tempfile.TemporaryDirectory() as cache:
+        make_mirror(mirror)
+        store = IconStore(cache_dir=cache, base_url=None, mirror_dir=mirror)
+        found, missing = store.prefetch(['fas fa-house', 'fab fa-github', 'fas fa-not-an-icon'])
+        print(f"미러 prefetch: {found}개 준비, {missing}개 없음")
+        assert (found, missing) == (2, 1), (found, missing)
+        assert store.get_svg('fab fa-github') == SAMPLE_SVG
+        assert not (Path(cache) / 'solid' / 'not-an-icon.missing').exists(), "오프라인 결과를 디스크에 기록했습니다"
+
+
+if __name__ == "__main__":
+    print("로컬 대역 서버 prefetch 테스트")
+    print("=" * 50)
+    test_prefetch_server()
+
+    print("\n로컬 미러 prefetch 테스트")
+    print("=" * 50)
+    test_prefetch_mirror()
+    print("\n모든 테스트 통과")
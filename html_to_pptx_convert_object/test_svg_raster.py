@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SVG 래스터라이저 테스트
+브라우저 없이 내장 path 렌더러의 커버리지(링 구멍, 가장자리 안티앨리어싱), PNG 헤더와
+지원하지 않는 SVG 거부, svg_file_to_png 파일 변환을 확인한다.
+"""
+
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+
+from svg_raster import (CAIROSVG_AVAILABLE, UnsupportedSVG, encode_png, parse_color, parse_path, parse_svg,
+                        rasterize_polygons, rasterize_svg, svg_file_to_png)
+
+# 16x16 사각형 링 (바깥 0~16, 안쪽 4~12), 안쪽 사각형을 반대 방향으로 그려 nonzero에서도 구멍이 됨
+RING_PATH = 'M0 0H16V16H0Z M4 4V12H12V4Z'
+# 원 두 개를 호로 그린 FontAwesome 스타일 링 (evenodd)
+CIRCLE_RING_SVG = ('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32">'
+                   '<path fill="#ff0000" fill-rule="evenodd" '
+                   'd="M16 0a16 16 0 1 1 0 32a16 16 0 1 1 0-32zM16 8a8 8 0 1 0 0 16a8 8 0 1 0 0-16z"/></svg>')
+
+
+def alpha_at(rgba, size, x, y):
+    return rgba[(y * size + x) * 4 + 3]
+
+
+def test_ring_coverage():
+    """링 안쪽 구멍은 비고, 링 위 픽셀은 채워지며, 반 픽셀 걸친 가장자리는 절반 커버리지인지 확인"""
+    for evenodd in (False, True):
+        rows = rasterize_polygons(parse_path(RING_PATH), 16, 16, evenodd=evenodd)
+        assert abs(rows[1][1] - 1.0) < 1e-9, rows[1][1]
+        assert abs(rows[14][8] - 1.0) < 1e-9, rows[14][8]
+        assert rows[8][8] == 0.0, "링 구멍이 채워졌습니다"
+        assert abs(sum(map(sum, rows)) - (16 * 16 - 8 * 8)) < 1e-6, sum(map(sum, rows))
+
+    # 2.5~13.5 사각형: 가장자리 픽셀은 0.5, 모서리 픽셀은 0.25
+    rows = rasterize_polygons(parse_path('M2.5 2.5H13.5V13.5H2.5Z'), 16, 16)
+    assert abs(rows[8][2] - 0.5) < 1e-9 and abs(rows[8][13] - 0.5) < 1e-9, (rows[8][2], rows[8][13])
+    assert abs(rows[2][2] - 0.25) < 1e-9, rows[2][2]
+    assert rows[8][1] == 0.0 and rows[8][14] == 0.0
+    print("사각형 링 구멍/가장자리 커버리지 확인")
+
+    rgba = rasterize_svg(CIRCLE_RING_SVG, 32)
+    assert alpha_at(rgba, 32, 16, 16) == 0, "원형 링 구멍이 채워졌습니다"
+    assert alpha_at(rgba, 32, 16, 3) == 255 and alpha_at(rgba, 32, 3, 16) == 255
+    assert rgba[(3 * 32 + 16) * 4:(3 * 32 + 16) * 4 + 3] == bytes((255, 0, 0)), "채우기 색이 다릅니다"
+    assert alpha_at(rgba, 32, 0, 0) == 0, "원 밖 모서리가 채워졌습니다"
+    # 바깥 원이 대각선에서 지나가는 픽셀은 일부만 덮이므로 안티앨리어싱된 중간 알파
+    edge = alpha_at(rgba, 32, 4, 4)
+    assert 0 < edge < 255, edge
+    print(f"원형 링 (호 명령) 확인: 구멍 0, 링 255, 대각선 가장자리 {edge}")
+
+
+def test_png_header():
+    """PNG 서명, IHDR(크기, 8비트 RGBA), IDAT 압축 해제 결과 확인"""
+    size = 24
+    png_bytes = encode_png(size, size, rasterize_svg(CIRCLE_RING_SVG, size))
+    assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n'
+    length, tag = struct.unpack('>I4s', png_bytes[8:16])
+    assert (length, tag) == (13, b'IHDR'), (length, tag)
+    ihdr = png_bytes[16:29]
+    assert struct.unpack('>IIBBBBB', ihdr) == (size, size, 8, 6, 0, 0, 0), struct.unpack('>IIBBBBB', ihdr)
+    assert struct.unpack('>I', png_bytes[29:33])[0] == zlib.crc32(b'IHDR' + ihdr), "IHDR CRC가 다릅니다"
+
+    idat_length, idat_tag = struct.unpack('>I4s', png_bytes[33:41])
+    assert idat_tag == b'IDAT'
+    raw = zlib.decompress(png_bytes[41:41 + idat_length])
+    assert len(raw) == size * (1 + size * 4) and raw[0] == 0, len(raw)
+    assert png_bytes.endswith(struct.pack('>I', 0) + b'IEND' + struct.pack('>I', zlib.crc32(b'IEND')))
+    print(f"PNG 헤더 확인: {len(png_bytes)} bytes")
+
+
+def test_unsupported():
+    """내장 렌더러가 처리하지 않는 SVG는 UnsupportedSVG로 거부하는지 확인"""
+    rejected = {
+        'circle 요소': '<svg viewBox="0 0 8 8"><circle cx="4" cy="4" r="4"/></svg>',
+        'transform': '<svg viewBox="0 0 8 8"><path transform="scale(2)" d="M0 0H4V4Z"/></svg>',
+        'style': '<svg viewBox="0 0 8 8"><path style="fill:red" d="M0 0H4V4Z"/></svg>',
+        '그라데이션': '<svg viewBox="0 0 8 8"><linearGradient id="g"/><path d="M0 0H4V4Z"/></svg>',
+        'svg 루트 없음': '<g><path d="M0 0H4V4Z"/></g>',
+        'XML 오류': '<svg viewBox="0 0 8 8"><path d="M0 0H4V4Z"></svg>',
+        'viewBox 없음': '<svg><path d="M0 0H4V4Z"/></svg>',
+    }
+    for reason, svg_content in rejected.items():
+        try:
+            parse_svg(svg_content)
+        except UnsupportedSVG as e:
+            print(f"{reason} 거부: {e}")
+        else:
+            raise AssertionError(f"지원하지 않는 SVG를 받아들였습니다: {reason}")
+
+    for d in ['M0 0 B4 4', '10 10 L4 4', 'M0 0 A4 4 0 2 0 8 8']:
+        try:
+            parse_path(d)
+        except UnsupportedSVG:
+            pass
+        else:
+            raise AssertionError(f"잘못된 path를 받아들였습니다: {d}")
+    try:
+        parse_color('hsl(0, 100%, 50%)')
+    except UnsupportedSVG:
+        pass
+    else:
+        raise AssertionError("지원하지 않는 색상을 받아들였습니다")
+    assert parse_color('none') is None and parse_color('#0f0') == (0, 255, 0)
+
+
+def test_svg_file_to_png():
+    """지원하는 SVG는 out_dir에 PNG 파일로 쓰고, 지원하지 않는 SVG는 None(브라우저 폴백)인지 확인"""
+    with tempfile.TemporaryDirectory() as root:
+        root = Path(root)
+        svg_file = root / 'ring.svg'
+        svg_file.write_text(CIRCLE_RING_SVG, encoding='utf-8')
+        png_file = svg_file_to_png(svg_file, 48, root)
+        assert png_file == root / 'ring_48.png' and png_file.read_bytes()[:8] == b'\x89PNG\r\n\x1a\n', png_file
+
+        assert svg_file_to_png(root / 'missing.svg', 48, root) is None
+        if CAIROSVG_AVAILABLE:
+            print("cairosvg 설치됨: 지원하지 않는 SVG 폴백 확인 생략")
+            return
+        circle_file = root / 'circle.svg'
+        circle_file.write_text('<svg viewBox="0 0 8 8"><circle cx="4" cy="4" r="4"/></svg>', encoding='utf-8')
+        assert svg_file_to_png(circle_file, 48, root) is None, "지원하지 않는 SVG를 변환했습니다"
+        print("svg_file_to_png 변환/폴백 확인")
+
+
+if __name__ == "__main__":
+    print("커버리지 테스트")
+    print("=" * 50)
+    test_ring_coverage()
+
+    print("\nPNG 헤더 테스트")
+    print("=" * 50)
+    test_png_header()
+
+    print("\n지원하지 않는 SVG 테스트")
+    print("=" * 50)
+    test_unsupported()
+
+    print("\nSVG 파일 변환 테스트")
+    print("=" * 50)
+    test_svg_file_to_png()
+    print("\n모든 테스트 통과")
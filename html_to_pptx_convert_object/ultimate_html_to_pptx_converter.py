@@ -7,7 +7,6 @@ HTML의 실제 레이아웃을 완벽하게 재현하는 최종 변환기
 
 import os
 import sys
-import requests
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt
@@ -20,12 +19,18 @@ import tempfile
 import shutil
 from html2image import Html2Image
 from PIL import Image
+from icon_store import prefetch_html_icons
+from icon_font import check_icon_font, get_icon_font
+from icon_place import place_icon
+from stage_trace import StageTracer, traced
 
 class UltimateHTMLConverter:
-    def __init__(self, html_file, output_path):
+    def __init__(self, html_file, output_path, tracer=None, vector_icons=False):
         self.html_file = html_file
         self.output_path = output_path
         self.temp_dir = None
+        self.tracer = tracer  # 단계별 시간 기록기 (None이면 기록하지 않음)
+        self.vector_icons = vector_icons  # True이면 아이콘을 PNG 대신 편집 가능한 자유형 벡터 도형으로 추가
         self.hti = Html2Image()
         
     def setup_temp_directory(self):
@@ -37,39 +42,13 @@ class UltimateHTMLConverter:
         if self.temp_dir and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
     
-    def download_fontawesome_svg(self, icon_class, color='#2563eb'):
-        """FontAwesome 아이콘 SVG 다운로드"""
-        try:
-            clean_class = icon_class.replace('fas ', '').replace('fab ', '').replace('far ', '').replace('fa-', '')
-            
-            paths = [
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/6.x/svgs/solid/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/6.x/svgs/brands/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/6.x/svgs/regular/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/5.x/svgs/solid/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/5.x/svgs/brands/{clean_class}.svg",
-                f"https://raw.githubusercontent.com/FortAwesome/Font-Awesome/5.x/svgs/regular/{clean_class}.svg",
-            ]
-            
-            for path in paths:
-                try:
-                    response = requests.get(path, timeout=10)
-                    if response.status_code == 200:
-                        svg_content = response.text
-                        svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
-                        svg_content = svg_content.replace('fill="#000"', f'fill="{color}"')
-                        svg_content = svg_content.replace('fill="black"', f'fill="{color}"')
-                        
-                        svg_file = self.temp_dir / f"{clean_class}.svg"
-                        with open(svg_file, 'w', encoding='utf-8') as f:
-                            f.write(svg_content)
-                        return svg_file
-                except Exception as e:
-                    continue
-            return None
-        except Exception as e:
-            return None
+    def add_icon(self, slide, icon_class, color, px_size, left, top, width, height):
+        """아이콘 추가 (icon_place.place_icon, 프로세스 안에서 변환할 수 없는 SVG만 HTML2Image 스크린샷), 추가한 도형 반환"""
+        return place_icon(slide, icon_class, color, px_size, left, top, width, height, self.temp_dir,
+                          vector_icons=self.vector_icons, screenshot=self.svg_to_png_with_html2image,
+                          tracer=self.tracer)
     
+    @traced('icon_rasterize')
     def svg_to_png_with_html2image(self, svg_file, size=64):
         """SVG를 HTML2Image로 PNG 변환"""
         try:
@@ -221,19 +200,14 @@ class UltimateHTMLConverter:
             
             # 아이콘 추가 (왼쪽)
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, icon_color)
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 20)
-                    if png_file and png_file.exists():
-                        icon_x = x + 0.1
-                        icon_y = y + (height - 0.25) / 2
-                        icon_size = 0.25
-                        
-                        slide.shapes.add_picture(
-                            str(png_file), 
-                            Inches(icon_x), Inches(icon_y), 
-                            Inches(icon_size), Inches(icon_size)
-                        )
+                icon_x = x + 0.1
+                icon_y = y + (height - 0.25) / 2
+                icon_size = 0.25
+
+                self.add_icon(
+                    slide, icon_class, icon_color, 20,
+                    Inches(icon_x), Inches(icon_y), Inches(icon_size), Inches(icon_size)
+                )
             
             # 텍스트 추가 (아이콘 오른쪽)
             text_x = x + 0.4 if icon_class else x + 0.1
@@ -291,19 +265,14 @@ class UltimateHTMLConverter:
             
             # 아이콘 추가 (왼쪽 상단)
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, '#3b82f6')
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 24)
-                    if png_file and png_file.exists():
-                        icon_x = x + 0.2
-                        icon_y = y + 0.2
-                        icon_size = 0.3
-                        
-                        slide.shapes.add_picture(
-                            str(png_file), 
-                            Inches(icon_x), Inches(icon_y), 
-                            Inches(icon_size), Inches(icon_size)
-                        )
+                icon_x = x + 0.2
+                icon_y = y + 0.2
+                icon_size = 0.3
+
+                self.add_icon(
+                    slide, icon_class, '#3b82f6', 24,
+                    Inches(icon_x), Inches(icon_y), Inches(icon_size), Inches(icon_size)
+                )
             
             # 제목 텍스트
             title_x = x + 0.6 if icon_class else x + 0.2
@@ -382,19 +351,14 @@ class UltimateHTMLConverter:
             
             # 아이콘 추가 (왼쪽)
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, text_color)
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 20)
-                    if png_file and png_file.exists():
-                        icon_x = x + 0.1
-                        icon_y = y + (height - 0.25) / 2
-                        icon_size = 0.25
-                        
-                        slide.shapes.add_picture(
-                            str(png_file), 
-                            Inches(icon_x), Inches(icon_y), 
-                            Inches(icon_size), Inches(icon_size)
-                        )
+                icon_x = x + 0.1
+                icon_y = y + (height - 0.25) / 2
+                icon_size = 0.25
+
+                self.add_icon(
+                    slide, icon_class, text_color, 20,
+                    Inches(icon_x), Inches(icon_y), Inches(icon_size), Inches(icon_size)
+                )
             
             # 텍스트 추가
             text_x = x + 0.4 if icon_class else x + 0.1
@@ -475,23 +439,20 @@ class UltimateHTMLConverter:
             
             # 아이콘 이미지 추가
             if icon_class:
-                svg_file = self.download_fontawesome_svg(icon_class, icon_color)
-                if svg_file:
-                    png_file = self.svg_to_png_with_html2image(svg_file, 32)
-                    if png_file and png_file.exists():
-                        icon_left = Inches(x + size/4)
-                        icon_top = Inches(y + size/4)
-                        icon_width = Inches(size/2)
-                        icon_height = Inches(size/2)
-                        
-                        slide.shapes.add_picture(str(png_file), icon_left, icon_top, icon_width, icon_height)
+                icon_left = Inches(x + size/4)
+                icon_top = Inches(y + size/4)
+                icon_width = Inches(size/2)
+                icon_height = Inches(size/2)
+
+                self.add_icon(slide, icon_class, icon_color, 32, icon_left, icon_top, icon_width, icon_height)
             
             return circle
         except Exception as e:
             print(f"아이콘 원형 생성 오류: {e}")
             return None
     
-    def extract_icon_class(self, element):
+    @staticmethod
+    def extract_icon_class(element):
         """요소에서 아이콘 클래스 추출"""
         if not element:
             return None
@@ -816,15 +777,10 @@ class UltimateHTMLConverter:
                     icon_class = self.extract_icon_class(element)
                     
                     if icon_class:
-                        svg_file = self.download_fontawesome_svg(icon_class, '#3b82f6')
-                        if svg_file:
-                            png_file = self.svg_to_png_with_html2image(svg_file, 24)
-                            if png_file and png_file.exists():
-                                slide.shapes.add_picture(
-                                    str(png_file), 
-                                    Inches(0.5), Inches(y_pos), 
-                                    Inches(0.3), Inches(0.3)
-                                )
+                        self.add_icon(
+                            slide, icon_class, '#3b82f6', 24,
+                            Inches(0.5), Inches(y_pos), Inches(0.3), Inches(0.3)
+                        )
                     
                     self.create_left_aligned_text(
                         slide, text,
@@ -875,8 +831,14 @@ class UltimateHTMLConverter:
         finally:
             self.cleanup_temp_directory()
 
-def convert_folder_to_pptx(html_folder, output_path):
-    """폴더 내 모든 HTML 파일을 하나의 PPTX로 변환"""
+def convert_folder_to_pptx(html_folder, output_path, trace_path=None, vector_icons=False, network_icons=False):
+    """폴더 내 모든 HTML 파일을 하나의 PPTX로 변환
+    
+    trace_path를 지정하면 단계별 시간을 Chrome trace-event 형식으로 저장하고 슬라이드별 요약 표를 출력
+    vector_icons=True이면 아이콘을 PNG 대신 편집 가능한 자유형(custGeom) 벡터 도형으로 추가
+    로컬 웹폰트가 없으면 중단하고, network_icons=True일 때만 아이콘을 네트워크에서 받아 변환
+    """
+    tracer = StageTracer(enabled=trace_path is not None)
     try:
         html_folder = Path(html_folder)
         if not html_folder.exists():
@@ -892,6 +854,17 @@ def convert_folder_to_pptx(html_folder, output_path):
         for html_file in html_files:
             print(f"  - {html_file.name}")
         
+        # 아이콘 기본 경로는 로컬 웹폰트 (없으면 asset_mirror.py 안내 후 중단, --network-icons일 때만 네트워크 사용)
+        if not check_icon_font(network_icons):
+            return False
+        
+        # 아이콘 미리 받기: 저장소 SVG가 필요한 경우(벡터 아이콘, --network-icons) 슬라이드마다 네트워크를
+        # 기다리지 않도록 모든 파일의 아이콘을 한 번에 동시 조회하여 캐시를 채움
+        if vector_icons or not get_icon_font().available:
+            with tracer.span('icon_prefetch'):
+                icon_found, icon_missing = prefetch_html_icons(html_files, UltimateHTMLConverter.extract_icon_class)
+            print(f"아이콘 미리 받기: {icon_found}개 준비, {icon_missing}개 없음")
+        
         prs = Presentation()
         prs.slide_width = Inches(13.33)  # 16:9 비율
         prs.slide_height = Inches(7.5)
@@ -900,18 +873,23 @@ def convert_folder_to_pptx(html_folder, output_path):
             print(f"\n--- {html_file.name} 변환 중 ({i+1}/{len(html_files)}) ---")
             
             try:
-                slide_layout = prs.slide_layouts[6]
-                slide = prs.slides.add_slide(slide_layout)
-                
-                converter = UltimateHTMLConverter(str(html_file), "")
-                converter.setup_temp_directory()
-                
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                converter.parse_html_ultimate(soup, slide)
-                converter.cleanup_temp_directory()
+                with tracer.slide(html_file.name):
+                    slide_layout = prs.slide_layouts[6]
+                    with tracer.span('add_slide'):
+                        slide = prs.slides.add_slide(slide_layout)
+                    
+                    converter = UltimateHTMLConverter(str(html_file), "", tracer=tracer, vector_icons=vector_icons)
+                    converter.setup_temp_directory()
+                    
+                    with tracer.span('read_html'):
+                        with open(html_file, 'r', encoding='utf-8') as f:
+                            html_content = f.read()
+                    
+                    with tracer.span('BeautifulSoup'):
+                        soup = BeautifulSoup(html_content, 'html.parser')
+                    with tracer.span('build_shapes'):
+                        converter.parse_html_ultimate(soup, slide)
+                    converter.cleanup_temp_directory()
                 
                 print(f"✅ {html_file.name} 변환 완료")
                 
@@ -919,7 +897,8 @@ def convert_folder_to_pptx(html_folder, output_path):
                 print(f"❌ {html_file.name} 변환 실패: {e}")
                 continue
         
-        prs.save(output_path)
+        with tracer.span('prs.save'):
+            prs.save(output_path)
         print(f"\n✅ 모든 HTML 파일이 하나의 PPTX로 변환 완료!")
         print(f"출력 파일: {output_path}")
         return True
@@ -927,10 +906,20 @@ def convert_folder_to_pptx(html_folder, output_path):
     except Exception as e:
         print(f"폴더 변환 오류: {e}")
         return False
+    
+    finally:
+        # 단계별 시간 트레이스 저장
+        if tracer.enabled:
+            tracer.write(trace_path)
+            tracer.print_summary()
 
 def main():
     html_folder = r"C:\Project\gigabitamin\genspark\dcs_site\html"
     output_path = r"C:\Project\gigabitamin\genspark\dcs_site\html\ultimate_all_pages.pptx"
+    # 단계별 시간 트레이스 저장 위치 (--trace로 켜기, chrome://tracing 또는 Perfetto에서 열기)
+    trace_path = Path(output_path).parent / 'trace.json' if '--trace' in sys.argv[1:] else None
+    vector_icons = '--vector-icons' in sys.argv[1:]  # 아이콘을 자유형 벡터 도형으로 추가
+    network_icons = '--network-icons' in sys.argv[1:]  # 로컬 웹폰트가 없을 때 네트워크 아이콘 다운로드 허용
     
     print("Ultimate HTML to Editable PPTX 변환기")
     print("=" * 50)
@@ -938,7 +927,7 @@ def main():
     print(f"출력 파일: {output_path}")
     print("-" * 50)
     
-    success = convert_folder_to_pptx(html_folder, output_path)
+    success = convert_folder_to_pptx(html_folder, output_path, trace_path, vector_icons, network_icons)
     
     if success:
         print("-" * 50)
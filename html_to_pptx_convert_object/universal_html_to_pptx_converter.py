@@ -20,6 +20,7 @@ import tempfile
 import shutil
 from html2image import Html2Image
 from PIL import Image
+from svg_raster import svg_file_to_png
 
 class UniversalHTMLToPPTXConverter:
     def __init__(self, html_file, output_path):
@@ -191,7 +192,8 @@ class UniversalHTMLToPPTXConverter:
                 
             svg_file = self.download_fontawesome_svg(icon_class, color)
             if svg_file:
-                png_file = self.svg_to_png_with_html2image(svg_file, 48)
+                png_file = (svg_file_to_png(svg_file, 48, self.temp_dir)
+                            or self.svg_to_png_with_html2image(svg_file, 48))
                 if png_file and png_file.exists():
                     # 아이콘 이미지 추가
                     icon_left = Inches(x)